@@ -0,0 +1,26 @@
+"""Add hashed API key column to users
+
+Revision ID: 2b3c4d5e6f7a
+Revises: 1a2b3c4d5e6f
+Create Date: 2025-06-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b3c4d5e6f7a'
+down_revision = '1a2b3c4d5e6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('api_key_sha256', sa.String(64), nullable=True))
+    op.create_index('ix_users_api_key_sha256', 'users', ['api_key_sha256'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_api_key_sha256', table_name='users')
+    op.drop_column('users', 'api_key_sha256')
@@ -0,0 +1,47 @@
+"""Add composite indexes for strategy and signal listings
+
+Revision ID: 3c4d5e6f7a8b
+Revises: 2b3c4d5e6f7a
+Create Date: 2025-06-02 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c4d5e6f7a8b'
+down_revision = '2b3c4d5e6f7a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Strategy listings filter on one column and page on (created_at, id)
+    op.create_index('ix_strategies_user_id_created_at', 'strategies', ['user_id', 'created_at', 'id'])
+    op.create_index('ix_strategies_strategy_type_created_at', 'strategies', ['strategy_type', 'created_at', 'id'])
+    op.create_index('ix_strategies_is_active_created_at', 'strategies', ['is_active', 'created_at', 'id'])
+    
+    # Signal listings filter on one column and page on (generated_at, id);
+    # the composite indexes replace the single-column ones from the initial schema
+    op.drop_index('ix_signals_strategy_id', table_name='signals')
+    op.drop_index('ix_signals_stock_id', table_name='signals')
+    op.drop_index('ix_signals_generated_at', table_name='signals')
+    op.create_index('ix_signals_strategy_id_generated_at', 'signals', ['strategy_id', 'generated_at', 'id'])
+    op.create_index('ix_signals_stock_id_generated_at', 'signals', ['stock_id', 'generated_at', 'id'])
+    op.create_index('ix_signals_signal_type_generated_at', 'signals', ['signal_type', 'generated_at', 'id'])
+    op.create_index('ix_signals_generated_at', 'signals', ['generated_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_signals_generated_at', table_name='signals')
+    op.drop_index('ix_signals_signal_type_generated_at', table_name='signals')
+    op.drop_index('ix_signals_stock_id_generated_at', table_name='signals')
+    op.drop_index('ix_signals_strategy_id_generated_at', table_name='signals')
+    op.create_index('ix_signals_generated_at', 'signals', ['generated_at'])
+    op.create_index('ix_signals_stock_id', 'signals', ['stock_id'])
+    op.create_index('ix_signals_strategy_id', 'signals', ['strategy_id'])
+    
+    op.drop_index('ix_strategies_is_active_created_at', table_name='strategies')
+    op.drop_index('ix_strategies_strategy_type_created_at', table_name='strategies')
+    op.drop_index('ix_strategies_user_id_created_at', table_name='strategies')
@@ -0,0 +1,35 @@
+"""Add trigram indexes for stock search
+
+Revision ID: 4d5e6f7a8b9c
+Revises: 3c4d5e6f7a8b
+Create Date: 2025-06-03 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d5e6f7a8b9c'
+down_revision = '3c4d5e6f7a8b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Stock search matches substrings with ILIKE '%term%', which a btree index
+    # cannot serve; trigram GIN indexes can
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_stocks_symbol_trgm', 'stocks', ['symbol'],
+        postgresql_using='gin', postgresql_ops={'symbol': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_stocks_name_trgm', 'stocks', ['name'],
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stocks_name_trgm', table_name='stocks')
+    op.drop_index('ix_stocks_symbol_trgm', table_name='stocks')
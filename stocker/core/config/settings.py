@@ -113,6 +113,8 @@ class SecuritySettings(BaseModel):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    token_audience: Optional[str] = None  # "aud" claim issued and required when set
+    token_issuer: Optional[str] = None  # "iss" claim issued and required when set
     password_min_length: int = 8
     password_require_uppercase: bool = True
     password_require_lowercase: bool = True
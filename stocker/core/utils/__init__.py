@@ -26,6 +26,12 @@ from stocker.core.utils.decorators import (
     log_execution
 )
 
+from stocker.core.utils.passwords import (
+    hash_password,
+    verify_password,
+    needs_rehash
+)
+
 __all__ = [
     # Datetime utilities
     "parse_date",
@@ -45,5 +51,10 @@ __all__ = [
     "timer",
     "retry",
     "cache_result",
-    "log_execution"
+    "log_execution",
+    
+    # Password utilities
+    "hash_password",
+    "verify_password",
+    "needs_rehash"
 ]
@@ -0,0 +1,69 @@
+"""Password hashing utilities for STOCKER Pro.
+
+This module hashes passwords with bcrypt and verifies both bcrypt hashes and
+the PBKDF2/scrypt hashes written by earlier versions through werkzeug.
+"""
+
+import bcrypt
+
+from stocker.core.config.settings import get_settings
+
+# Prefixes of the bcrypt hash variants
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+def _bcrypt_rounds() -> int:
+    """Get the configured bcrypt cost factor."""
+    return get_settings().security.bcrypt_rounds
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt.
+    
+    Args:
+        password: Plain text password
+    
+    Returns:
+        bcrypt hash of the password
+    """
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds())
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password against a bcrypt or legacy werkzeug hash.
+    
+    Args:
+        password: Plain text password
+        password_hash: Stored password hash
+    
+    Returns:
+        True if the password matches the hash, False otherwise
+    """
+    if password_hash.startswith(BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+        except ValueError:
+            # Malformed bcrypt hash
+            return False
+    
+    # Hashes created before the switch to bcrypt; rehashed on the next login
+    from werkzeug.security import check_password_hash
+    return check_password_hash(password_hash, password)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Check whether a hash should be replaced with a current bcrypt hash.
+    
+    Args:
+        password_hash: Stored password hash
+    
+    Returns:
+        True for legacy hashes and bcrypt hashes with a different cost factor
+    """
+    if not password_hash.startswith(BCRYPT_PREFIXES):
+        return True
+    
+    # bcrypt hashes embed the cost factor, e.g. "$2b$12$..."
+    cost = password_hash[4:6]
+    return not cost.isdigit() or int(cost) != _bcrypt_rounds()
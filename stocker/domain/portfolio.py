@@ -29,6 +29,16 @@ class TransactionType(str, Enum):
     OTHER = "other"          # Other transaction type
 
 
+# Module-level aliases for transaction types compared in per-transaction loops
+_DEPOSIT = TransactionType.DEPOSIT
+_WITHDRAWAL = TransactionType.WITHDRAWAL
+_DIVIDEND = TransactionType.DIVIDEND
+
+# Transaction types grouped by the direction of their cash flow
+_OUTFLOW_TYPES = frozenset({TransactionType.BUY, TransactionType.WITHDRAWAL, TransactionType.FEE})
+_INFLOW_TYPES = frozenset({TransactionType.SELL, TransactionType.DIVIDEND, TransactionType.DEPOSIT, TransactionType.INTEREST})
+
+
 @dataclass
 class Transaction:
     """Portfolio transaction.
@@ -65,9 +75,9 @@ class Transaction:
     @property
     def net_amount(self) -> float:
         """Calculate the net amount of the transaction (including fees)."""
-        if self.type in [TransactionType.BUY, TransactionType.WITHDRAWAL, TransactionType.FEE]:
+        if self.type in _OUTFLOW_TYPES:
             return -(self.amount + self.fees)
-        elif self.type in [TransactionType.SELL, TransactionType.DIVIDEND, TransactionType.DEPOSIT, TransactionType.INTEREST]:
+        elif self.type in _INFLOW_TYPES:
             return self.amount - self.fees
         else:
             return 0.0
@@ -349,26 +359,22 @@ class Portfolio:
         if end_date is None:
             end_date = datetime.now()
         
-        # Filter transactions by date range
-        transactions_in_range = [
-            t for t in self.transactions
-            if start_date <= t.date <= end_date
-        ]
-        
-        # Calculate metrics
-        deposits = sum(
-            t.amount for t in transactions_in_range
-            if t.type == TransactionType.DEPOSIT
-        )
-        withdrawals = sum(
-            t.amount for t in transactions_in_range
-            if t.type == TransactionType.WITHDRAWAL
-        )
-        fees = sum(t.fees for t in transactions_in_range)
-        dividends = sum(
-            t.amount for t in transactions_in_range
-            if t.type == TransactionType.DIVIDEND
-        )
+        # Calculate metrics in a single pass over transactions in the date range
+        deposits = 0.0
+        withdrawals = 0.0
+        fees = 0.0
+        dividends = 0.0
+        for t in self.transactions:
+            if not start_date <= t.date <= end_date:
+                continue
+            
+            fees += t.fees
+            if t.type == _DEPOSIT:
+                deposits += t.amount
+            elif t.type == _WITHDRAWAL:
+                withdrawals += t.amount
+            elif t.type == _DIVIDEND:
+                dividends += t.amount
         
         # Calculate returns
         # This is a simplified calculation; a real implementation would use time-weighted returns
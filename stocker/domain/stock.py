@@ -43,7 +43,7 @@ class Sector(str, Enum):
     OTHER = "Other"
 
 
-@dataclass
+@dataclass(slots=True)
 class StockPrice:
     """Stock price data point.
     
@@ -118,21 +118,23 @@ class StockData:
     def dataframe(self) -> pd.DataFrame:
         """Get the data as a pandas DataFrame."""
         if self._dataframe is None:
-            # Convert list of StockPrice objects to DataFrame
-            data = [
-                {
-                    "date": price.date,
-                    "open": price.open,
-                    "high": price.high,
-                    "low": price.low,
-                    "close": price.close,
-                    "volume": price.volume,
-                    "adjusted_close": price.adjusted_close or price.close
-                }
-                for price in self.prices
-            ]
+            prices = self.prices
+            count = len(prices)
             
-            if data:
+            if prices:
+                # Build one array per column instead of a dict per price
+                data = {
+                    "date": [price.date for price in prices],
+                    "open": np.fromiter((price.open for price in prices), dtype=np.float64, count=count),
+                    "high": np.fromiter((price.high for price in prices), dtype=np.float64, count=count),
+                    "low": np.fromiter((price.low for price in prices), dtype=np.float64, count=count),
+                    "close": np.fromiter((price.close for price in prices), dtype=np.float64, count=count),
+                    "volume": np.fromiter((price.volume for price in prices), dtype=np.int64, count=count),
+                    "adjusted_close": np.fromiter(
+                        (price.adjusted_close or price.close for price in prices), dtype=np.float64, count=count
+                    )
+                }
+                
                 self._dataframe = pd.DataFrame(data)
                 self._dataframe.set_index("date", inplace=True)
                 self._dataframe.sort_index(inplace=True)
@@ -10,6 +10,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 
 
@@ -282,17 +283,27 @@ class MomentumStrategy(Strategy):
         rsi_oversold = self.parameters.custom_params.get("rsi_oversold", 30)
         threshold = self.parameters.threshold
         
-        for i in range(momentum_period + rsi_period, len(data)):
+        # Evaluate the conditions on whole columns and visit only matching rows
+        closes = data["close"].to_numpy()
+        momentums = data["momentum"].to_numpy()
+        rsis = data["rsi"].to_numpy()
+        buy_mask = (momentums > threshold) & (rsis < rsi_oversold)
+        sell_mask = (momentums < -threshold) & (rsis > rsi_overbought)
+        
+        start = momentum_period + rsi_period
+        symbol = data.get("symbol", "")
+        
+        for i in np.flatnonzero((buy_mask | sell_mask)[start:]) + start:
             date = data.index[i]
-            price = data["close"].iloc[i]
-            momentum = data["momentum"].iloc[i]
-            rsi = data["rsi"].iloc[i]
+            price = closes[i]
+            momentum = momentums[i]
+            rsi = rsis[i]
             
             # Generate buy signal
-            if momentum > threshold and rsi < rsi_oversold:
+            if buy_mask[i]:
                 signal = Signal(
                     strategy_id=self.id,
-                    symbol=data.get("symbol", ""),
+                    symbol=symbol,
                     date=date,
                     type=SignalType.BUY,
                     price=price,
@@ -305,10 +316,10 @@ class MomentumStrategy(Strategy):
                 signals.append(signal)
             
             # Generate sell signal
-            elif momentum < -threshold and rsi > rsi_overbought:
+            else:
                 signal = Signal(
                     strategy_id=self.id,
-                    symbol=data.get("symbol", ""),
+                    symbol=symbol,
                     date=date,
                     type=SignalType.SELL,
                     price=price,
@@ -368,23 +379,33 @@ class MeanReversionStrategy(Strategy):
         data["upper_band"] = data["ma"] + (data["std_dev"] * std_dev_multiplier)
         data["lower_band"] = data["ma"] - (data["std_dev"] * std_dev_multiplier)
         
+        # Evaluate the band crossings on whole columns and visit only matching rows
+        closes = data["close"].to_numpy()
+        mas = data["ma"].to_numpy()
+        upper_bands = data["upper_band"].to_numpy()
+        lower_bands = data["lower_band"].to_numpy()
+        buy_mask = closes < lower_bands
+        sell_mask = closes > upper_bands
+        
+        symbol = data.get("symbol", "")
+        
         # Generate signals
-        for i in range(ma_period, len(data)):
+        for i in np.flatnonzero((buy_mask | sell_mask)[ma_period:]) + ma_period:
             date = data.index[i]
-            price = data["close"].iloc[i]
-            ma = data["ma"].iloc[i]
-            upper_band = data["upper_band"].iloc[i]
-            lower_band = data["lower_band"].iloc[i]
+            price = closes[i]
+            ma = mas[i]
+            upper_band = upper_bands[i]
+            lower_band = lower_bands[i]
             
             # Generate buy signal
-            if price < lower_band:
+            if buy_mask[i]:
                 # Calculate distance from lower band as percentage
                 distance = (lower_band - price) / lower_band * 100
                 confidence = min(100, max(50, 50 + distance * 5))
                 
                 signal = Signal(
                     strategy_id=self.id,
-                    symbol=data.get("symbol", ""),
+                    symbol=symbol,
                     date=date,
                     type=SignalType.BUY,
                     price=price,
@@ -399,14 +420,14 @@ class MeanReversionStrategy(Strategy):
                 signals.append(signal)
             
             # Generate sell signal
-            elif price > upper_band:
+            else:
                 # Calculate distance from upper band as percentage
                 distance = (price - upper_band) / upper_band * 100
                 confidence = min(100, max(50, 50 + distance * 5))
                 
                 signal = Signal(
                     strategy_id=self.id,
-                    symbol=data.get("symbol", ""),
+                    symbol=symbol,
                     date=date,
                     type=SignalType.SELL,
                     price=price,
@@ -36,7 +36,7 @@ class UserStatus(str, Enum):
     LOCKED = "locked"            # Locked account
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPreferences:
     """User preferences.
     
@@ -19,7 +19,7 @@ from stocker.domain.stock import Stock, Exchange, Sector
 from stocker.domain.portfolio import Portfolio, PortfolioType
 from stocker.domain.strategy import Strategy, StrategyType, StrategyParameters
 from stocker.infrastructure.database.models import (
-    UserModel, UserRoleModel, StockModel, PortfolioModel, StrategyModel
+    UserRoleModel, StockModel, PortfolioModel, StrategyModel
 )
 from stocker.infrastructure.database.repositories import (
     UserRepository, StockRepository, PortfolioRepository, StrategyRepository
@@ -119,27 +119,9 @@ def seed_admin_user(admin_email: str = "admin@stockerpro.com",
             created_at=datetime.now()
         )
         
-        # Create user model
-        admin_model = UserModel.from_domain(admin_user)
-        
-        # Set password hash (in a real app, this would be properly hashed)
-        from werkzeug.security import generate_password_hash
-        admin_model.password_hash = generate_password_hash(admin_password)
-        
-        # Save to database
-        with get_session() as session:
-            # Add user to database
-            session.add(admin_model)
-            
-            # Add roles to user
-            admin_role = session.query(UserRoleModel).filter_by(role=UserRole.ADMIN.value).first()
-            user_role = session.query(UserRoleModel).filter_by(role=UserRole.USER.value).first()
-            
-            if admin_role and user_role:
-                admin_model.roles.append(admin_role)
-                admin_model.roles.append(user_role)
-            
-            session.commit()
+        # Save the user and its roles in one commit
+        from stocker.core.utils.passwords import hash_password
+        user_repo.create_many([(admin_user, hash_password(admin_password))])
         
         logger.info(f"Seeded admin user: {admin_username}")
     except Exception as e:
@@ -14,6 +14,10 @@ from sqlalchemy.orm import relationship
 from stocker.infrastructure.database.session import Base
 from stocker.domain.stock import Stock, StockPrice, StockData, Exchange, Sector
 
+# Enum members by stored value; a dict lookup avoids Enum.__call__ per row
+_EXCHANGE_BY_VALUE = {exchange.value: exchange for exchange in Exchange}
+_SECTOR_BY_VALUE = {sector.value: sector for sector in Sector}
+
 
 class StockModel(Base):
     """SQLAlchemy model for stocks.
@@ -85,8 +89,8 @@ class StockModel(Base):
         stock = Stock(
             symbol=self.symbol,
             name=self.name,
-            exchange=Exchange(self.exchange) if self.exchange else Exchange.OTHER,
-            sector=Sector(self.sector) if self.sector else Sector.OTHER,
+            exchange=_EXCHANGE_BY_VALUE.get(self.exchange, Exchange.OTHER),
+            sector=_SECTOR_BY_VALUE.get(self.sector, Sector.OTHER),
             industry=self.industry or "",
             market_cap=self.market_cap,
             pe_ratio=self.pe_ratio,
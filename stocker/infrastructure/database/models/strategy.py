@@ -45,8 +45,9 @@ class StrategyModel(Base):
     
     # Indexes
     __table_args__ = (
-        Index('ix_strategies_owner_id', 'owner_id'),
-        Index('ix_strategies_type', 'type'),
+        Index('ix_strategies_owner_id_created_at', 'owner_id', 'created_at', 'id'),
+        Index('ix_strategies_type_created_at', 'type', 'created_at', 'id'),
+        Index('ix_strategies_is_active_created_at', 'is_active', 'created_at', 'id'),
     )
     
     @classmethod
@@ -160,9 +161,10 @@ class SignalModel(Base):
     
     # Indexes
     __table_args__ = (
-        Index('ix_signals_strategy_id', 'strategy_id'),
-        Index('ix_signals_symbol', 'symbol'),
-        Index('ix_signals_date', 'date'),
+        Index('ix_signals_strategy_id_date', 'strategy_id', 'date', 'id'),
+        Index('ix_signals_symbol_date', 'symbol', 'date', 'id'),
+        Index('ix_signals_type_date', 'type', 'date', 'id'),
+        Index('ix_signals_date', 'date', 'id'),
     )
     
     @classmethod
@@ -5,6 +5,7 @@ roles, preferences, and relationships to other entities.
 """
 
 import json
+from dataclasses import fields
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 
@@ -15,6 +16,12 @@ from sqlalchemy.orm import relationship
 from stocker.infrastructure.database.session import Base
 from stocker.domain.user import User, UserRole, UserStatus, UserPreferences
 
+# Enum members by stored value; a dict lookup avoids Enum.__call__ per row
+_USER_ROLE_BY_VALUE = {role.value: role for role in UserRole}
+_USER_STATUS_BY_VALUE = {status.value: status for status in UserStatus}
+
+# UserPreferences attributes that map directly to stored preference keys
+_PREFERENCE_FIELDS = frozenset(field.name for field in fields(UserPreferences))
 
 # Association table for user-role many-to-many relationship
 user_roles = Table(
@@ -37,6 +44,7 @@ class UserModel(Base):
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(100), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
+    api_key_sha256 = Column(String(64), unique=True, nullable=True, index=True)
     first_name = Column(String(50))
     last_name = Column(String(50))
     status = Column(String(20), default="active")
@@ -91,24 +99,22 @@ class UserModel(Base):
             User domain entity
         """
         # Convert roles from database representation to domain enum
-        roles = set()
-        for role_name in [role.role for role in self.roles]:
-            try:
-                roles.add(UserRole(role_name))
-            except ValueError:
-                # Skip invalid roles
-                pass
+        # Skip invalid roles
+        roles = {
+            _USER_ROLE_BY_VALUE[role.role]
+            for role in self.roles
+            if role.role in _USER_ROLE_BY_VALUE
+        }
         
-        # Create user preferences
-        preferences = UserPreferences()
-        if self.preferences:
-            preferences_dict = self.preferences
-            for key, value in preferences_dict.items():
-                if hasattr(preferences, key):
-                    setattr(preferences, key, value)
-                else:
-                    # Add to custom settings
-                    preferences.custom_settings[key] = value
+        # Create user preferences in one constructor call; unknown keys
+        # go to custom settings
+        preferences_dict = self.preferences or {}
+        preferences = UserPreferences(**{
+            key: value for key, value in preferences_dict.items() if key in _PREFERENCE_FIELDS
+        })
+        for key, value in preferences_dict.items():
+            if key not in _PREFERENCE_FIELDS:
+                preferences.custom_settings[key] = value
         
         # Create user domain entity
         return User(
@@ -118,7 +124,7 @@ class UserModel(Base):
             first_name=self.first_name or "",
             last_name=self.last_name or "",
             roles=roles or {UserRole.USER},
-            status=UserStatus(self.status) if self.status else UserStatus.ACTIVE,
+            status=_USER_STATUS_BY_VALUE[self.status] if self.status else UserStatus.ACTIVE,
             preferences=preferences,
             created_at=self.created_at,
             last_login=self.last_login,
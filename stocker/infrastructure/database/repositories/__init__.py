@@ -4,7 +4,7 @@ This package provides repository implementations for data access patterns,
 following the repository pattern to abstract database operations.
 """
 
-from stocker.infrastructure.database.repositories.base import BaseRepository
+from stocker.infrastructure.database.repositories.base import BaseRepository, encode_cursor, decode_cursor
 from stocker.infrastructure.database.repositories.user import UserRepository
 from stocker.infrastructure.database.repositories.stock import StockRepository
 from stocker.infrastructure.database.repositories.portfolio import PortfolioRepository
@@ -12,6 +12,8 @@ from stocker.infrastructure.database.repositories.strategy import StrategyReposi
 
 __all__ = [
     "BaseRepository",
+    "encode_cursor",
+    "decode_cursor",
     "UserRepository",
     "StockRepository",
     "PortfolioRepository",
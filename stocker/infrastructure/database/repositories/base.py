@@ -4,13 +4,16 @@ This module provides a base repository class that implements common CRUD operati
 and serves as a foundation for specific repository implementations.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, Generic, Iterable, List, Optional, Set, Tuple, Type, TypeVar, Union
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Select, and_, or_, desc, inspect, select, update, delete
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from stocker.core.exceptions import DataError
+from stocker.core.exceptions import DataError, DataValidationError
 from stocker.core.logging import get_logger
 from stocker.infrastructure.database.session import get_session
 
@@ -24,6 +27,71 @@ EntityT = TypeVar('EntityT')
 logger = get_logger(__name__)
 
 
+def encode_cursor(date: datetime, id: str) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor.
+    
+    Args:
+        date: Date of the last row
+        id: ID of the last row
+        
+    Returns:
+        URL-safe cursor string for fetching the next page
+    """
+    return base64.urlsafe_b64encode(f"{date.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+        
+    Returns:
+        Tuple of the date and ID of the last row on the previous page
+        
+    Raises:
+        DataValidationError: If the cursor is malformed
+    """
+    try:
+        date, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(date), id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise DataValidationError(f"Invalid pagination cursor: {cursor}")
+
+
+def paginate_keyset(query: Select, date_column: Any, id_column: Any, limit: int,
+                    offset: int = 0, cursor: Optional[str] = None) -> Select:
+    """Order a query newest first and restrict it to one page.
+    
+    With a cursor the page starts right after the row it encodes, which an
+    index on (date, id) can seek to directly; without one, offset is used.
+    
+    Args:
+        query: Query to paginate
+        date_column: Date column to order by
+        id_column: ID column used to break ties between equal dates
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip (ignored when a cursor is given)
+        cursor: Cursor encoding the last row of the previous page
+        
+    Returns:
+        Paginated query
+        
+    Raises:
+        DataValidationError: If the cursor is malformed
+    """
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor)
+        query = query.where(or_(
+            date_column < cursor_date,
+            and_(date_column == cursor_date, id_column < cursor_id)
+        ))
+    else:
+        query = query.offset(offset)
+    
+    return query.order_by(desc(date_column), desc(id_column)).limit(limit)
+
+
 class BaseRepository(Generic[ModelT, EntityT]):
     """Base repository class for database operations.
     
@@ -61,7 +129,6 @@ class BaseRepository(Generic[ModelT, EntityT]):
             with get_session() as session:
                 session.add(model)
                 session.commit()
-                session.refresh(model)
             
             # Convert back to domain entity
             return self._to_entity(model)
@@ -93,6 +160,54 @@ class BaseRepository(Generic[ModelT, EntityT]):
             logger.error(f"Error getting {self.model_class.__name__} by ID {id}: {str(e)}")
             raise DataError(f"Error getting {self.model_class.__name__} by ID {id}: {str(e)}")
     
+    def exists(self, id: Any) -> bool:
+        """Check whether an entity exists without loading it.
+        
+        Args:
+            id: Entity ID
+            
+        Returns:
+            True if the entity exists, False otherwise
+            
+        Raises:
+            DataError: If an error occurs during the check
+        """
+        try:
+            with get_session() as session:
+                primary_key = inspect(self.model_class).primary_key[0]
+                query = select(primary_key).where(primary_key == id).limit(1)
+                
+                return session.execute(query).scalar() is not None
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking {self.model_class.__name__} with ID {id} exists: {str(e)}")
+            raise DataError(f"Error checking {self.model_class.__name__} with ID {id} exists: {str(e)}")
+    
+    def exists_many(self, ids: Iterable[Any]) -> Set[Any]:
+        """Find which of several entities exist in a single query.
+        
+        Args:
+            ids: Entity IDs
+            
+        Returns:
+            Set of the given IDs that exist
+            
+        Raises:
+            DataError: If an error occurs during the check
+        """
+        ids = set(ids)
+        if not ids:
+            return set()
+        
+        try:
+            with get_session() as session:
+                primary_key = inspect(self.model_class).primary_key[0]
+                query = select(primary_key).where(primary_key.in_(ids))
+                
+                return set(session.execute(query).scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking {self.model_class.__name__} IDs exist: {str(e)}")
+            raise DataError(f"Error checking {self.model_class.__name__} IDs exist: {str(e)}")
+    
     def get_all(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[EntityT]:
         """Get all entities.
         
@@ -143,7 +258,6 @@ class BaseRepository(Generic[ModelT, EntityT]):
             with get_session() as session:
                 session.merge(model)
                 session.commit()
-                session.refresh(model)
             
             # Convert back to domain entity
             return self._to_entity(model)
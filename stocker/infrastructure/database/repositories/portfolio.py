@@ -5,9 +5,9 @@ following the repository pattern to abstract database access.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, and_, case, desc, func
 from sqlalchemy.exc import SQLAlchemyError
 
 from stocker.core.exceptions import DataError, DataNotFoundError
@@ -53,6 +53,119 @@ class PortfolioRepository(BaseRepository[PortfolioModel, Portfolio]):
         """
         return model.to_domain()
     
+    def _apply_position(self, session, portfolio_id: str, position: Position) -> None:
+        """Add or update a position within an open session.
+        
+        Args:
+            session: Database session
+            portfolio_id: Portfolio ID
+            position: Position to add or update
+        """
+        # Check if position already exists
+        existing_position = session.execute(
+            select(PositionModel).where(
+                and_(
+                    PositionModel.portfolio_id == portfolio_id,
+                    PositionModel.symbol == position.symbol
+                )
+            )
+        ).scalar_one_or_none()
+        
+        if existing_position:
+            # Update existing position
+            existing_position.quantity = position.quantity
+            existing_position.cost_basis = position.cost_basis
+            existing_position.last_updated = datetime.now()
+        else:
+            # Create new position
+            position_model = PositionModel.from_domain(position, portfolio_id)
+            session.add(position_model)
+    
+    def _apply_transaction(self, session, portfolio_model: PortfolioModel, portfolio_id: str,
+                           transaction: Transaction) -> None:
+        """Record a transaction and its effect on cash and positions within an open session.
+        
+        Args:
+            session: Database session
+            portfolio_model: Portfolio database model
+            portfolio_id: Portfolio ID
+            transaction: Transaction to add
+        """
+        # Create transaction model
+        transaction_model = TransactionModel.from_domain(transaction, portfolio_id)
+        
+        # Add transaction to database
+        session.add(transaction_model)
+        
+        # Update portfolio cash balance
+        if transaction.type == TransactionType.DEPOSIT:
+            portfolio_model.cash_balance += transaction.amount
+        elif transaction.type == TransactionType.WITHDRAWAL:
+            portfolio_model.cash_balance -= transaction.amount
+        elif transaction.type == TransactionType.BUY:
+            # For buy transactions, reduce cash balance by total cost
+            total_cost = transaction.amount + transaction.fees
+            portfolio_model.cash_balance -= total_cost
+            
+            # Update or create position
+            existing_position = session.execute(
+                select(PositionModel).where(
+                    and_(
+                        PositionModel.portfolio_id == portfolio_id,
+                        PositionModel.symbol == transaction.symbol
+                    )
+                )
+            ).scalar_one_or_none()
+            
+            if existing_position:
+                # Update existing position
+                new_quantity = existing_position.quantity + transaction.quantity
+                new_cost_basis = (
+                    (existing_position.cost_basis * existing_position.quantity) +
+                    (transaction.price * transaction.quantity)
+                ) / new_quantity if new_quantity > 0 else 0
+                
+                existing_position.quantity = new_quantity
+                existing_position.cost_basis = new_cost_basis
+                existing_position.last_updated = datetime.now()
+            else:
+                # Create new position
+                position = Position(
+                    symbol=transaction.symbol,
+                    quantity=transaction.quantity,
+                    cost_basis=transaction.price,
+                    open_date=transaction.date
+                )
+                position_model = PositionModel.from_domain(position, portfolio_id)
+                session.add(position_model)
+        
+        elif transaction.type == TransactionType.SELL:
+            # For sell transactions, increase cash balance by proceeds minus fees
+            proceeds = transaction.amount - transaction.fees
+            portfolio_model.cash_balance += proceeds
+            
+            # Update position
+            existing_position = session.execute(
+                select(PositionModel).where(
+                    and_(
+                        PositionModel.portfolio_id == portfolio_id,
+                        PositionModel.symbol == transaction.symbol
+                    )
+                )
+            ).scalar_one_or_none()
+            
+            if existing_position:
+                # Update existing position
+                new_quantity = existing_position.quantity - transaction.quantity
+                
+                if new_quantity <= 0:
+                    # Remove position if quantity is zero or negative
+                    session.delete(existing_position)
+                else:
+                    # Update position with new quantity
+                    existing_position.quantity = new_quantity
+                    existing_position.last_updated = datetime.now()
+    
     def get_by_owner(self, owner_id: str, limit: int = 10, offset: int = 0) -> List[Portfolio]:
         """Get portfolios by owner ID.
         
@@ -128,25 +241,7 @@ class PortfolioRepository(BaseRepository[PortfolioModel, Portfolio]):
                 if portfolio_model is None:
                     raise DataNotFoundError(f"Portfolio with ID {portfolio_id} not found")
                 
-                # Check if position already exists
-                existing_position = session.execute(
-                    select(PositionModel).where(
-                        and_(
-                            PositionModel.portfolio_id == portfolio_id,
-                            PositionModel.symbol == position.symbol
-                        )
-                    )
-                ).scalar_one_or_none()
-                
-                if existing_position:
-                    # Update existing position
-                    existing_position.quantity = position.quantity
-                    existing_position.cost_basis = position.cost_basis
-                    existing_position.last_updated = datetime.now()
-                else:
-                    # Create new position
-                    position_model = PositionModel.from_domain(position, portfolio_id)
-                    session.add(position_model)
+                self._apply_position(session, portfolio_id, position)
                 
                 session.commit()
                 session.refresh(portfolio_model)
@@ -221,80 +316,7 @@ class PortfolioRepository(BaseRepository[PortfolioModel, Portfolio]):
                 if portfolio_model is None:
                     raise DataNotFoundError(f"Portfolio with ID {portfolio_id} not found")
                 
-                # Create transaction model
-                transaction_model = TransactionModel.from_domain(transaction, portfolio_id)
-                
-                # Add transaction to database
-                session.add(transaction_model)
-                
-                # Update portfolio cash balance
-                if transaction.type == TransactionType.DEPOSIT:
-                    portfolio_model.cash_balance += transaction.amount
-                elif transaction.type == TransactionType.WITHDRAWAL:
-                    portfolio_model.cash_balance -= transaction.amount
-                elif transaction.type == TransactionType.BUY:
-                    # For buy transactions, reduce cash balance by total cost
-                    total_cost = transaction.amount + transaction.fees
-                    portfolio_model.cash_balance -= total_cost
-                    
-                    # Update or create position
-                    existing_position = session.execute(
-                        select(PositionModel).where(
-                            and_(
-                                PositionModel.portfolio_id == portfolio_id,
-                                PositionModel.symbol == transaction.symbol
-                            )
-                        )
-                    ).scalar_one_or_none()
-                    
-                    if existing_position:
-                        # Update existing position
-                        new_quantity = existing_position.quantity + transaction.quantity
-                        new_cost_basis = (
-                            (existing_position.cost_basis * existing_position.quantity) +
-                            (transaction.price * transaction.quantity)
-                        ) / new_quantity if new_quantity > 0 else 0
-                        
-                        existing_position.quantity = new_quantity
-                        existing_position.cost_basis = new_cost_basis
-                        existing_position.last_updated = datetime.now()
-                    else:
-                        # Create new position
-                        position = Position(
-                            symbol=transaction.symbol,
-                            quantity=transaction.quantity,
-                            cost_basis=transaction.price,
-                            open_date=transaction.date
-                        )
-                        position_model = PositionModel.from_domain(position, portfolio_id)
-                        session.add(position_model)
-                
-                elif transaction.type == TransactionType.SELL:
-                    # For sell transactions, increase cash balance by proceeds minus fees
-                    proceeds = transaction.amount - transaction.fees
-                    portfolio_model.cash_balance += proceeds
-                    
-                    # Update position
-                    existing_position = session.execute(
-                        select(PositionModel).where(
-                            and_(
-                                PositionModel.portfolio_id == portfolio_id,
-                                PositionModel.symbol == transaction.symbol
-                            )
-                        )
-                    ).scalar_one_or_none()
-                    
-                    if existing_position:
-                        # Update existing position
-                        new_quantity = existing_position.quantity - transaction.quantity
-                        
-                        if new_quantity <= 0:
-                            # Remove position if quantity is zero or negative
-                            session.delete(existing_position)
-                        else:
-                            # Update position with new quantity
-                            existing_position.quantity = new_quantity
-                            existing_position.last_updated = datetime.now()
+                self._apply_transaction(session, portfolio_model, portfolio_id, transaction)
                 
                 # Commit changes
                 session.commit()
@@ -305,6 +327,71 @@ class PortfolioRepository(BaseRepository[PortfolioModel, Portfolio]):
             logger.error(f"Error adding transaction to portfolio {portfolio_id}: {str(e)}")
             raise DataError(f"Error adding transaction to portfolio: {str(e)}")
     
+    def add_positions_bulk(self, portfolio_id: str, positions: List[Position]) -> Portfolio:
+        """Add or update several positions in a portfolio in a single transaction.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            positions: Positions to add or update
+            
+        Returns:
+            Updated Portfolio domain entity
+            
+        Raises:
+            DataNotFoundError: If the portfolio is not found
+            DataError: If an error occurs during the operation
+        """
+        try:
+            with get_session() as session:
+                # Check if portfolio exists
+                portfolio_model = session.get(PortfolioModel, portfolio_id)
+                if portfolio_model is None:
+                    raise DataNotFoundError(f"Portfolio with ID {portfolio_id} not found")
+                
+                for position in positions:
+                    self._apply_position(session, portfolio_id, position)
+                
+                session.commit()
+                session.refresh(portfolio_model)
+                
+                return self._to_entity(portfolio_model)
+        except SQLAlchemyError as e:
+            logger.error(f"Error adding positions to portfolio {portfolio_id}: {str(e)}")
+            raise DataError(f"Error adding positions to portfolio: {str(e)}")
+    
+    def add_transactions_bulk(self, portfolio_id: str, transactions: List[Transaction]) -> Portfolio:
+        """Add several transactions to a portfolio in a single transaction.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            transactions: Transactions to add, applied in order
+            
+        Returns:
+            Updated Portfolio domain entity
+            
+        Raises:
+            DataNotFoundError: If the portfolio is not found
+            DataError: If an error occurs during the operation
+        """
+        try:
+            with get_session() as session:
+                # Check if portfolio exists
+                portfolio_model = session.get(PortfolioModel, portfolio_id)
+                if portfolio_model is None:
+                    raise DataNotFoundError(f"Portfolio with ID {portfolio_id} not found")
+                
+                for transaction in transactions:
+                    self._apply_transaction(session, portfolio_model, portfolio_id, transaction)
+                
+                # Commit changes
+                session.commit()
+                session.refresh(portfolio_model)
+                
+                return self._to_entity(portfolio_model)
+        except SQLAlchemyError as e:
+            logger.error(f"Error adding transactions to portfolio {portfolio_id}: {str(e)}")
+            raise DataError(f"Error adding transactions to portfolio: {str(e)}")
+    
     def get_transactions(self, portfolio_id: str, limit: int = 50, offset: int = 0) -> List[Transaction]:
         """Get transactions for a portfolio.
         
@@ -339,6 +426,105 @@ class PortfolioRepository(BaseRepository[PortfolioModel, Portfolio]):
             logger.error(f"Error getting transactions for portfolio {portfolio_id}: {str(e)}")
             raise DataError(f"Error getting transactions for portfolio: {str(e)}")
     
+    def iter_transactions(self, portfolio_id: str, since: Optional[datetime] = None,
+                          batch_size: int = 1000) -> Iterator[Transaction]:
+        """Stream transactions for a portfolio in date order.
+        
+        Rows are fetched from the database in batches, so the full history is
+        never materialized at once.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            since: Only include transactions on or after this date
+            batch_size: Number of rows fetched per round-trip
+            
+        Yields:
+            Transaction domain entities for the specified portfolio
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                query = select(TransactionModel).where(TransactionModel.portfolio_id == portfolio_id)
+                
+                if since:
+                    query = query.where(TransactionModel.date >= since)
+                
+                query = query.order_by(TransactionModel.date).execution_options(yield_per=batch_size)
+                
+                for result in session.execute(query).scalars():
+                    yield result.to_domain()
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming transactions for portfolio {portfolio_id}: {str(e)}")
+            raise DataError(f"Error streaming transactions for portfolio: {str(e)}")
+    
+    def get_period_cashflow_summary(self, portfolio_id: str, start_date: datetime) -> Tuple[float, float, bool]:
+        """Summarize a portfolio's cash flows since a date in a single query.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            start_date: Start of the period
+            
+        Returns:
+            Tuple of (deposits, withdrawals) within the period and whether the
+            portfolio has any transactions older than the period
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                in_period = TransactionModel.date >= start_date
+                
+                query = select(
+                    func.coalesce(func.sum(case(
+                        (and_(in_period, TransactionModel.type == TransactionType.DEPOSIT.value), TransactionModel.amount),
+                        else_=0.0
+                    )), 0.0),
+                    func.coalesce(func.sum(case(
+                        (and_(in_period, TransactionModel.type == TransactionType.WITHDRAWAL.value), TransactionModel.amount),
+                        else_=0.0
+                    )), 0.0),
+                    func.coalesce(func.sum(case(
+                        (TransactionModel.date < start_date, 1),
+                        else_=0
+                    )), 0)
+                ).where(TransactionModel.portfolio_id == portfolio_id)
+                
+                deposits, withdrawals, older_count = session.execute(query).one()
+                
+                return float(deposits), float(withdrawals), older_count > 0
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting cash flow summary for portfolio {portfolio_id}: {str(e)}")
+            raise DataError(f"Error getting cash flow summary for portfolio: {str(e)}")
+    
+    def get_position_quantities(self, portfolio_id: str) -> Dict[str, float]:
+        """Get open position quantities for a portfolio without loading full positions.
+        
+        Closed positions, with a quantity of zero, are left out.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            
+        Returns:
+            Dictionary of quantities keyed by symbol (empty if the portfolio has no open positions)
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                query = select(PositionModel.symbol, PositionModel.quantity).where(
+                    PositionModel.portfolio_id == portfolio_id,
+                    PositionModel.quantity != 0
+                )
+                
+                return dict(session.execute(query).all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting position quantities for portfolio {portfolio_id}: {str(e)}")
+            raise DataError(f"Error getting position quantities for portfolio: {str(e)}")
+    
     def get_positions(self, portfolio_id: str) -> Dict[str, Position]:
         """Get positions for a portfolio.
         
@@ -7,7 +7,8 @@ following the repository pattern to abstract database access.
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, and_, desc, func
+import pandas as pd
+from sqlalchemy import bindparam, select, insert, delete, exists, and_, desc, func
 from sqlalchemy.exc import SQLAlchemyError
 
 from stocker.core.exceptions import DataError, DataNotFoundError
@@ -20,6 +21,50 @@ from stocker.infrastructure.database.session import get_session
 # Logger
 logger = get_logger(__name__)
 
+# Price columns in StockPrice field order, selected without building ORM objects
+_PRICE_COLUMNS = (
+    StockPriceModel.date,
+    StockPriceModel.open,
+    StockPriceModel.high,
+    StockPriceModel.low,
+    StockPriceModel.close,
+    StockPriceModel.volume,
+    StockPriceModel.adjusted_close
+)
+
+# Hot lookups built once; constant statements keep SQLAlchemy's compiled-SQL
+# cache key stable and skip rebuilding the Select per call
+_SELECT_STOCKS_BY_EXCHANGE = (
+    select(StockModel)
+    .where(StockModel.exchange == bindparam("exchange"))
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_SELECT_STOCKS_BY_SECTOR = (
+    select(StockModel)
+    .where(StockModel.sector == bindparam("sector"))
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_COUNT_STOCKS_BY_EXCHANGE = (
+    select(func.count()).select_from(StockModel).where(StockModel.exchange == bindparam("exchange"))
+)
+_COUNT_STOCKS_BY_SECTOR = (
+    select(func.count()).select_from(StockModel).where(StockModel.sector == bindparam("sector"))
+)
+_SELECT_LATEST_PRICE = (
+    select(*_PRICE_COLUMNS)
+    .where(StockPriceModel.symbol == bindparam("symbol"))
+    .order_by(desc(StockPriceModel.date))
+    .limit(1)
+)
+
+# Days of price history scanned for the previous close (covers weekends and holidays)
+_MOVERS_LOOKBACK_DAYS = 7
+
+# Rows per executemany batch when bulk-inserting price data
+_PRICE_INSERT_CHUNK_SIZE = 1000
+
 
 class StockRepository(BaseRepository[StockModel, Stock]):
     """Repository for stock-related database operations.
@@ -53,6 +98,45 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         return model.to_domain()
     
+    @staticmethod
+    def _stock_exists(session, symbol: str) -> bool:
+        """Check whether a stock exists with SELECT EXISTS, without loading the row.
+        
+        Args:
+            session: Database session
+            symbol: Stock symbol
+            
+        Returns:
+            True if the stock exists, False otherwise
+        """
+        return bool(session.execute(select(exists().where(StockModel.symbol == symbol))).scalar())
+    
+    def delete(self, symbol: str) -> bool:
+        """Delete a stock and its price data.
+        
+        Issues two DELETE statements instead of loading the stock and every
+        price row for the ORM cascade.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            True if the stock was deleted, False if it was not found
+            
+        Raises:
+            DataError: If an error occurs during deletion
+        """
+        try:
+            with get_session() as session:
+                session.execute(delete(StockPriceModel).where(StockPriceModel.symbol == symbol))
+                deleted = session.execute(delete(StockModel).where(StockModel.symbol == symbol)).rowcount > 0
+                session.commit()
+                
+                return deleted
+        except SQLAlchemyError as e:
+            logger.error(f"Error deleting stock with symbol {symbol}: {str(e)}")
+            raise DataError(f"Error deleting stock with symbol {symbol}: {str(e)}")
+    
     def get_by_symbol(self, symbol: str, include_prices: bool = False) -> Optional[Stock]:
         """Get a stock by symbol.
         
@@ -69,11 +153,24 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         try:
             with get_session() as session:
                 if include_prices:
-                    # Load the stock with its prices
+                    # Load the stock, then its prices as plain rows
                     stock_model = session.get(StockModel, symbol)
                     if stock_model is None:
                         return None
-                    return stock_model.to_domain(include_prices=True)
+                    
+                    stock = self._to_entity(stock_model)
+                    rows = session.execute(
+                        select(*_PRICE_COLUMNS)
+                        .where(StockPriceModel.symbol == symbol)
+                        .order_by(StockPriceModel.date)
+                    ).all()
+                    if rows:
+                        stock.data = StockData(
+                            symbol=symbol,
+                            prices=[StockPrice(*row) for row in rows],
+                            timeframe="1d"  # Default timeframe
+                        )
+                    return stock
                 else:
                     # Load just the stock without prices
                     stock_model = session.get(StockModel, symbol)
@@ -84,6 +181,32 @@ class StockRepository(BaseRepository[StockModel, Stock]):
             logger.error(f"Error getting stock by symbol {symbol}: {str(e)}")
             raise DataError(f"Error getting stock by symbol {symbol}: {str(e)}")
     
+    def get_by_symbols(self, symbols: List[str]) -> Dict[str, Stock]:
+        """Get several stocks by symbol in a single query.
+        
+        Args:
+            symbols: Stock symbols
+            
+        Returns:
+            Dictionary of Stock domain entities keyed by symbol; unknown symbols are omitted
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            with get_session() as session:
+                query = select(StockModel).where(StockModel.symbol.in_(symbols))
+                
+                results = session.execute(query).scalars().all()
+                
+                return {result.symbol: self._to_entity(result) for result in results}
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting stocks by symbols {symbols}: {str(e)}")
+            raise DataError(f"Error getting stocks by symbols: {str(e)}")
+    
     def get_stocks_by_exchange(self, exchange: Exchange, limit: int = 100, offset: int = 0) -> List[Stock]:
         """Get stocks by exchange.
         
@@ -100,11 +223,10 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                query = select(StockModel).where(
-                    StockModel.exchange == exchange.value
-                ).offset(offset).limit(limit)
-                
-                results = session.execute(query).scalars().all()
+                results = session.execute(
+                    _SELECT_STOCKS_BY_EXCHANGE,
+                    {"exchange": exchange.value, "offset": offset, "limit": limit}
+                ).scalars().all()
                 
                 return [self._to_entity(result) for result in results]
         except SQLAlchemyError as e:
@@ -127,17 +249,58 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                query = select(StockModel).where(
-                    StockModel.sector == sector.value
-                ).offset(offset).limit(limit)
-                
-                results = session.execute(query).scalars().all()
+                results = session.execute(
+                    _SELECT_STOCKS_BY_SECTOR,
+                    {"sector": sector.value, "offset": offset, "limit": limit}
+                ).scalars().all()
                 
                 return [self._to_entity(result) for result in results]
         except SQLAlchemyError as e:
             logger.error(f"Error getting stocks by sector {sector.value}: {str(e)}")
             raise DataError(f"Error getting stocks by sector: {str(e)}")
     
+    def count_stocks_by_exchange(self, exchange: Exchange) -> int:
+        """Count stocks by exchange.
+        
+        Args:
+            exchange: Exchange to filter by
+            
+        Returns:
+            Number of stocks in the specified exchange
+            
+        Raises:
+            DataError: If an error occurs during counting
+        """
+        try:
+            with get_session() as session:
+                return session.execute(
+                    _COUNT_STOCKS_BY_EXCHANGE, {"exchange": exchange.value}
+                ).scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting stocks by exchange {exchange.value}: {str(e)}")
+            raise DataError(f"Error counting stocks by exchange: {str(e)}")
+    
+    def count_stocks_by_sector(self, sector: Sector) -> int:
+        """Count stocks by sector.
+        
+        Args:
+            sector: Sector to filter by
+            
+        Returns:
+            Number of stocks in the specified sector
+            
+        Raises:
+            DataError: If an error occurs during counting
+        """
+        try:
+            with get_session() as session:
+                return session.execute(
+                    _COUNT_STOCKS_BY_SECTOR, {"sector": sector.value}
+                ).scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting stocks by sector {sector.value}: {str(e)}")
+            raise DataError(f"Error counting stocks by sector: {str(e)}")
+    
     def search_stocks(self, search_term: str, limit: int = 10, offset: int = 0) -> List[Stock]:
         """Search for stocks by symbol or name.
         
@@ -154,7 +317,7 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                # Create search pattern for LIKE queries
+                # Substring search; served by the pg_trgm indexes on symbol and name
                 pattern = f"%{search_term}%"
                 
                 # Build query with OR conditions for different fields
@@ -186,16 +349,27 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                # Check if stock exists
-                stock_model = session.get(StockModel, symbol)
-                if stock_model is None:
+                # Check if stock exists without loading the row
+                if not self._stock_exists(session, symbol):
                     raise DataNotFoundError(f"Stock with symbol {symbol} not found")
                 
-                # Create price models
-                price_models = [StockPriceModel.from_domain(price, symbol) for price in prices]
+                # Insert prices as plain rows in batches, bypassing per-object ORM flushes
+                for start in range(0, len(prices), _PRICE_INSERT_CHUNK_SIZE):
+                    rows = [
+                        {
+                            "symbol": symbol,
+                            "date": price.date,
+                            "open": price.open,
+                            "high": price.high,
+                            "low": price.low,
+                            "close": price.close,
+                            "volume": price.volume,
+                            "adjusted_close": price.adjusted_close
+                        }
+                        for price in prices[start:start + _PRICE_INSERT_CHUNK_SIZE]
+                    ]
+                    session.execute(insert(StockPriceModel), rows)
                 
-                # Add prices to database
-                session.add_all(price_models)
                 session.commit()
                 
                 return True
@@ -222,9 +396,8 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                # Check if stock exists
-                stock_model = session.get(StockModel, symbol)
-                if stock_model is None:
+                # Check if stock exists without loading the row
+                if not self._stock_exists(session, symbol):
                     raise DataNotFoundError(f"Stock with symbol {symbol} not found")
                 
                 # Build query with date filters
@@ -247,6 +420,95 @@ class StockRepository(BaseRepository[StockModel, Stock]):
             logger.error(f"Error getting price data for stock {symbol}: {str(e)}")
             raise DataError(f"Error getting price data: {str(e)}")
     
+    def get_price_frame(self, symbol: str, start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Get price data for a stock as a DataFrame.
+        
+        Reads the price columns straight into numpy-backed columns, skipping
+        StockPrice objects entirely. The frame has the same layout as
+        StockData.dataframe.
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Start date for price data
+            end_date: End date for price data
+            
+        Returns:
+            DataFrame indexed by date (oldest first) with open, high, low, close,
+            volume and adjusted_close columns
+            
+        Raises:
+            DataNotFoundError: If the stock is not found
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                # Check if stock exists without loading the row
+                if not self._stock_exists(session, symbol):
+                    raise DataNotFoundError(f"Stock with symbol {symbol} not found")
+                
+                # Build query with date filters
+                query = select(*_PRICE_COLUMNS).where(StockPriceModel.symbol == symbol)
+                
+                if start_date:
+                    query = query.where(StockPriceModel.date >= start_date)
+                
+                if end_date:
+                    query = query.where(StockPriceModel.date <= end_date)
+                
+                query = query.order_by(StockPriceModel.date)
+                
+                df = pd.read_sql(query, session.connection(), index_col="date", parse_dates=["date"])
+                
+                # Match StockData.dataframe, which falls back to the close price
+                df["adjusted_close"] = df["adjusted_close"].fillna(df["close"])
+                return df
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting price frame for stock {symbol}: {str(e)}")
+            raise DataError(f"Error getting price data: {str(e)}")
+    
+    def get_price_data_bulk(self, symbols: List[str], start_date: Optional[datetime] = None,
+                            end_date: Optional[datetime] = None) -> Dict[str, List[StockPrice]]:
+        """Get price data for several stocks in a single query.
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date for price data
+            end_date: End date for price data
+            
+        Returns:
+            Dictionary of StockPrice domain entities keyed by symbol, newest first;
+            every requested symbol is present, with an empty list if it has no data
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        prices_by_symbol: Dict[str, List[StockPrice]] = {symbol: [] for symbol in symbols}
+        if not symbols:
+            return prices_by_symbol
+        
+        try:
+            with get_session() as session:
+                # Build query with date filters
+                query = select(StockPriceModel).where(StockPriceModel.symbol.in_(symbols))
+                
+                if start_date:
+                    query = query.where(StockPriceModel.date >= start_date)
+                
+                if end_date:
+                    query = query.where(StockPriceModel.date <= end_date)
+                
+                query = query.order_by(StockPriceModel.symbol, desc(StockPriceModel.date))
+                
+                # Group prices by symbol
+                for result in session.execute(query).scalars():
+                    prices_by_symbol[result.symbol].append(result.to_domain())
+                
+                return prices_by_symbol
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting price data for stocks {symbols}: {str(e)}")
+            raise DataError(f"Error getting price data: {str(e)}")
+    
     def get_latest_price(self, symbol: str) -> Optional[StockPrice]:
         """Get the latest price for a stock.
         
@@ -261,23 +523,106 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                query = select(StockPriceModel).where(
-                    StockPriceModel.symbol == symbol
-                ).order_by(desc(StockPriceModel.date)).limit(1)
+                row = session.execute(_SELECT_LATEST_PRICE, {"symbol": symbol}).first()
                 
-                result = session.execute(query).scalar_one_or_none()
-                
-                if result is None:
+                if row is None:
                     return None
                 
-                return result.to_domain()
+                return StockPrice(*row)
         except SQLAlchemyError as e:
             logger.error(f"Error getting latest price for stock {symbol}: {str(e)}")
             raise DataError(f"Error getting latest price: {str(e)}")
     
+    def get_latest_prices(self, symbols: List[str]) -> Dict[str, StockPrice]:
+        """Get the latest price for each of several stocks in a single query.
+        
+        Args:
+            symbols: Stock symbols
+            
+        Returns:
+            Dictionary of latest StockPrice domain entities keyed by symbol;
+            symbols without price data are omitted
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            with get_session() as session:
+                # Rank each symbol's prices from newest to oldest
+                ranked = select(
+                    StockPriceModel.id,
+                    func.row_number().over(
+                        partition_by=StockPriceModel.symbol,
+                        order_by=desc(StockPriceModel.date)
+                    ).label("rank")
+                ).where(StockPriceModel.symbol.in_(symbols)).subquery()
+                
+                query = select(StockPriceModel).join(
+                    ranked, StockPriceModel.id == ranked.c.id
+                ).where(ranked.c.rank == 1)
+                
+                results = session.execute(query).scalars().all()
+                
+                return {result.symbol: result.to_domain() for result in results}
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting latest prices for stocks {symbols}: {str(e)}")
+            raise DataError(f"Error getting latest prices: {str(e)}")
+    
+    def _get_top_movers(self, session, limit: int, gainers: bool) -> List[Tuple[Stock, float]]:
+        """Rank today's movers by change from the previous close in SQL.
+        
+        Args:
+            session: Database session
+            limit: Maximum number of stocks to return
+            gainers: Whether to rank by largest gain (True) or largest loss (False)
+            
+        Returns:
+            List of tuples containing Stock domain entities and their percentage change
+        """
+        today = datetime.now().date()
+        lookback = today - timedelta(days=_MOVERS_LOOKBACK_DAYS)
+        
+        # Pair each recent close with the previous one and rank newest first
+        recent = select(
+            StockPriceModel.symbol,
+            StockPriceModel.date,
+            StockPriceModel.close,
+            func.lag(StockPriceModel.close).over(
+                partition_by=StockPriceModel.symbol,
+                order_by=StockPriceModel.date
+            ).label("prev_close"),
+            func.row_number().over(
+                partition_by=StockPriceModel.symbol,
+                order_by=desc(StockPriceModel.date)
+            ).label("rank")
+        ).where(StockPriceModel.date >= lookback).subquery()
+        
+        pct_change = (
+            (recent.c.close - recent.c.prev_close) / recent.c.prev_close * 100
+        ).label("pct_change")
+        
+        query = select(StockModel, pct_change).join(
+            recent, StockModel.symbol == recent.c.symbol
+        ).where(
+            recent.c.rank == 1,
+            func.date(recent.c.date) == today,
+            recent.c.prev_close > 0
+        ).order_by(desc(pct_change) if gainers else pct_change).limit(limit)
+        
+        rows = session.execute(query).all()
+        
+        if gainers:
+            return [(self._to_entity(stock), change) for stock, change in rows]
+        return [(self._to_entity(stock), -change) for stock, change in rows]
+    
     def get_top_gainers(self, limit: int = 10) -> List[Tuple[Stock, float]]:
         """Get the top gaining stocks for the day.
         
+        The gain is measured against each stock's previous close.
+        
         Args:
             limit: Maximum number of stocks to return
             
@@ -289,30 +634,7 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                # Get today's date and yesterday's date
-                today = datetime.now().date()
-                yesterday = today - timedelta(days=1)
-                
-                # This is a complex query that requires joining the stocks and prices tables
-                # and calculating the percentage change between yesterday and today
-                # For simplicity, we'll implement a basic version here
-                
-                # Get stocks with price data for today
-                stocks_with_prices = session.execute(
-                    select(StockModel, StockPriceModel.close, StockPriceModel.open)
-                    .join(StockPriceModel, StockModel.symbol == StockPriceModel.symbol)
-                    .where(func.date(StockPriceModel.date) == today)
-                    .order_by(desc((StockPriceModel.close - StockPriceModel.open) / StockPriceModel.open))
-                    .limit(limit)
-                ).all()
-                
-                result = []
-                for stock, close, open_price in stocks_with_prices:
-                    # Calculate percentage gain
-                    gain = (close - open_price) / open_price * 100 if open_price > 0 else 0
-                    result.append((self._to_entity(stock), gain))
-                
-                return result
+                return self._get_top_movers(session, limit, gainers=True)
         except SQLAlchemyError as e:
             logger.error(f"Error getting top gainers: {str(e)}")
             raise DataError(f"Error getting top gainers: {str(e)}")
@@ -320,6 +642,8 @@ class StockRepository(BaseRepository[StockModel, Stock]):
     def get_top_losers(self, limit: int = 10) -> List[Tuple[Stock, float]]:
         """Get the top losing stocks for the day.
         
+        The loss is measured against each stock's previous close.
+        
         Args:
             limit: Maximum number of stocks to return
             
@@ -331,26 +655,7 @@ class StockRepository(BaseRepository[StockModel, Stock]):
         """
         try:
             with get_session() as session:
-                # Get today's date and yesterday's date
-                today = datetime.now().date()
-                yesterday = today - timedelta(days=1)
-                
-                # Similar to get_top_gainers but with reversed ordering
-                stocks_with_prices = session.execute(
-                    select(StockModel, StockPriceModel.close, StockPriceModel.open)
-                    .join(StockPriceModel, StockModel.symbol == StockPriceModel.symbol)
-                    .where(func.date(StockPriceModel.date) == today)
-                    .order_by((StockPriceModel.close - StockPriceModel.open) / StockPriceModel.open)
-                    .limit(limit)
-                ).all()
-                
-                result = []
-                for stock, close, open_price in stocks_with_prices:
-                    # Calculate percentage loss
-                    loss = (open_price - close) / open_price * 100 if open_price > 0 else 0
-                    result.append((self._to_entity(stock), loss))
-                
-                return result
+                return self._get_top_movers(session, limit, gainers=False)
         except SQLAlchemyError as e:
             logger.error(f"Error getting top losers: {str(e)}")
             raise DataError(f"Error getting top losers: {str(e)}")
@@ -4,22 +4,76 @@ This module provides a repository implementation for strategy-related database o
 following the repository pattern to abstract database access.
 """
 
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, insert, update, and_, func
 from sqlalchemy.exc import SQLAlchemyError
 
 from stocker.core.exceptions import DataError, DataNotFoundError
 from stocker.core.logging import get_logger
 from stocker.domain.strategy import Strategy, StrategyType, Signal, SignalType
 from stocker.infrastructure.database.models.strategy import StrategyModel, SignalModel
-from stocker.infrastructure.database.repositories.base import BaseRepository
+from stocker.infrastructure.database.repositories.base import BaseRepository, paginate_keyset
 from stocker.infrastructure.database.session import get_session
 
 # Logger
 logger = get_logger(__name__)
 
+# Rows per INSERT statement when storing signals in bulk
+_SIGNAL_INSERT_CHUNK_SIZE = 1000
+
+# Columns loaded for signal lists; skips the metadata JSON and audit columns
+_SIGNAL_LITE_COLUMNS = (
+    SignalModel.id,
+    SignalModel.strategy_id,
+    SignalModel.symbol,
+    SignalModel.date,
+    SignalModel.type,
+    SignalModel.price,
+    SignalModel.confidence,
+)
+
+
+def _select_signals(full_detail: bool):
+    """Build the base select for a signal list.
+    
+    Args:
+        full_detail: Whether to load whole rows instead of the list columns
+        
+    Returns:
+        SQLAlchemy select over SignalModel
+    """
+    return select(SignalModel) if full_detail else select(*_SIGNAL_LITE_COLUMNS)
+
+
+def _fetch_signals(session, query, full_detail: bool) -> List[Signal]:
+    """Execute a signal list query built by _select_signals.
+    
+    Args:
+        session: Database session
+        query: Query built on _select_signals
+        full_detail: Whether the query loads whole rows
+        
+    Returns:
+        List of Signal domain entities; lite rows carry empty metadata
+    """
+    if full_detail:
+        return [result.to_domain() for result in session.execute(query).scalars()]
+    
+    return [
+        Signal(
+            id=row.id,
+            strategy_id=row.strategy_id,
+            symbol=row.symbol,
+            date=row.date,
+            type=SignalType(row.type),
+            price=row.price,
+            confidence=row.confidence
+        )
+        for row in session.execute(query)
+    ]
+
 
 class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
     """Repository for strategy-related database operations.
@@ -53,13 +107,82 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         """
         return model.to_domain()
     
-    def get_by_owner(self, owner_id: str, limit: int = 10, offset: int = 0) -> List[Strategy]:
+    def update(self, entity: Strategy) -> Strategy:
+        """Update a strategy in a single UPDATE statement.
+        
+        Args:
+            entity: Strategy domain entity to update
+            
+        Returns:
+            Updated Strategy domain entity
+            
+        Raises:
+            DataNotFoundError: If the strategy is not found
+            DataError: If an error occurs during update
+        """
+        try:
+            with get_session() as session:
+                query = (
+                    update(StrategyModel)
+                    .where(StrategyModel.id == entity.id)
+                    .values(
+                        name=entity.name,
+                        description=entity.description,
+                        type=entity.type.value,
+                        parameters=entity.parameters.to_dict(),
+                        owner_id=entity.owner_id,
+                        updated_at=entity.updated_at,
+                        is_active=entity.is_active,
+                        performance_metrics=entity.performance_metrics
+                    )
+                )
+                
+                # No matched row means the strategy does not exist
+                if session.execute(query).rowcount == 0:
+                    raise DataNotFoundError(f"Strategy with ID {entity.id} not found")
+                
+                session.commit()
+                
+                return entity
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating strategy {entity.id}: {str(e)}")
+            raise DataError(f"Error updating strategy: {str(e)}")
+    
+    def get_by_ids(self, strategy_ids: List[str]) -> Dict[str, Strategy]:
+        """Get several strategies by ID in a single query.
+        
+        Args:
+            strategy_ids: Strategy IDs
+            
+        Returns:
+            Dictionary of Strategy domain entities keyed by ID; unknown IDs are omitted
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        if not strategy_ids:
+            return {}
+        
+        try:
+            with get_session() as session:
+                query = select(StrategyModel).where(StrategyModel.id.in_(strategy_ids))
+                
+                results = session.execute(query).scalars().all()
+                
+                return {result.id: self._to_entity(result) for result in results}
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting strategies by IDs {strategy_ids}: {str(e)}")
+            raise DataError(f"Error getting strategies by IDs: {str(e)}")
+    
+    def get_by_owner(self, owner_id: str, limit: int = 10, offset: int = 0,
+                     cursor: Optional[str] = None) -> List[Strategy]:
         """Get strategies by owner ID.
         
         Args:
             owner_id: Owner user ID
             limit: Maximum number of strategies to return
-            offset: Number of strategies to skip
+            offset: Number of strategies to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last strategy of the previous page
             
         Returns:
             List of Strategy domain entities owned by the specified user
@@ -69,9 +192,10 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         """
         try:
             with get_session() as session:
-                query = select(StrategyModel).where(
-                    StrategyModel.owner_id == owner_id
-                ).offset(offset).limit(limit)
+                query = paginate_keyset(
+                    select(StrategyModel).where(StrategyModel.owner_id == owner_id),
+                    StrategyModel.created_at, StrategyModel.id, limit, offset, cursor
+                )
                 
                 results = session.execute(query).scalars().all()
                 
@@ -80,13 +204,15 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
             logger.error(f"Error getting strategies by owner {owner_id}: {str(e)}")
             raise DataError(f"Error getting strategies by owner: {str(e)}")
     
-    def get_by_type(self, strategy_type: StrategyType, limit: int = 10, offset: int = 0) -> List[Strategy]:
+    def get_by_type(self, strategy_type: StrategyType, limit: int = 10, offset: int = 0,
+                    cursor: Optional[str] = None) -> List[Strategy]:
         """Get strategies by type.
         
         Args:
             strategy_type: Strategy type to filter by
             limit: Maximum number of strategies to return
-            offset: Number of strategies to skip
+            offset: Number of strategies to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last strategy of the previous page
             
         Returns:
             List of Strategy domain entities of the specified type
@@ -96,9 +222,10 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         """
         try:
             with get_session() as session:
-                query = select(StrategyModel).where(
-                    StrategyModel.type == strategy_type.value
-                ).offset(offset).limit(limit)
+                query = paginate_keyset(
+                    select(StrategyModel).where(StrategyModel.type == strategy_type.value),
+                    StrategyModel.created_at, StrategyModel.id, limit, offset, cursor
+                )
                 
                 results = session.execute(query).scalars().all()
                 
@@ -107,12 +234,14 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
             logger.error(f"Error getting strategies by type {strategy_type.value}: {str(e)}")
             raise DataError(f"Error getting strategies by type: {str(e)}")
     
-    def get_active_strategies(self, limit: int = 10, offset: int = 0) -> List[Strategy]:
+    def get_active_strategies(self, limit: int = 10, offset: int = 0,
+                              cursor: Optional[str] = None) -> List[Strategy]:
         """Get active strategies.
         
         Args:
             limit: Maximum number of strategies to return
-            offset: Number of strategies to skip
+            offset: Number of strategies to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last strategy of the previous page
             
         Returns:
             List of active Strategy domain entities
@@ -122,9 +251,10 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         """
         try:
             with get_session() as session:
-                query = select(StrategyModel).where(
-                    StrategyModel.is_active == True
-                ).offset(offset).limit(limit)
+                query = paginate_keyset(
+                    select(StrategyModel).where(StrategyModel.is_active == True),
+                    StrategyModel.created_at, StrategyModel.id, limit, offset, cursor
+                )
                 
                 results = session.execute(query).scalars().all()
                 
@@ -160,20 +290,70 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
                 # Add signal to database
                 session.add(signal_model)
                 session.commit()
-                session.refresh(signal_model)
                 
                 return signal_model.to_domain()
         except SQLAlchemyError as e:
             logger.error(f"Error adding signal to strategy {strategy_id}: {str(e)}")
             raise DataError(f"Error adding signal to strategy: {str(e)}")
     
-    def get_signals(self, strategy_id: str, limit: int = 50, offset: int = 0) -> List[Signal]:
+    def add_signals_bulk(self, strategy_id: str, signals: List[Signal]) -> List[Signal]:
+        """Add several signals for a strategy in a single transaction.
+        
+        Args:
+            strategy_id: Strategy ID
+            signals: Signals to add, with IDs already assigned
+            
+        Returns:
+            Added Signal domain entities
+            
+        Raises:
+            DataNotFoundError: If the strategy is not found
+            DataError: If an error occurs during the operation
+        """
+        if not signals:
+            return []
+        
+        try:
+            with get_session() as session:
+                # Check if strategy exists
+                strategy_model = session.get(StrategyModel, strategy_id)
+                if strategy_model is None:
+                    raise DataNotFoundError(f"Strategy with ID {strategy_id} not found")
+                
+                # Insert signals as plain rows in batches, skipping ORM object hydration
+                for start in range(0, len(signals), _SIGNAL_INSERT_CHUNK_SIZE):
+                    rows = [
+                        {
+                            "id": signal.id,
+                            "strategy_id": strategy_id,
+                            "symbol": signal.symbol,
+                            "date": signal.date,
+                            "type": signal.type.value,
+                            "price": signal.price,
+                            "confidence": signal.confidence,
+                            "metadata": signal.metadata
+                        }
+                        for signal in signals[start:start + _SIGNAL_INSERT_CHUNK_SIZE]
+                    ]
+                    session.execute(insert(SignalModel), rows)
+                
+                session.commit()
+                
+                return signals
+        except SQLAlchemyError as e:
+            logger.error(f"Error adding signals to strategy {strategy_id}: {str(e)}")
+            raise DataError(f"Error adding signals to strategy: {str(e)}")
+    
+    def get_signals(self, strategy_id: str, limit: int = 50, offset: int = 0,
+                    cursor: Optional[str] = None, full_detail: bool = True) -> List[Signal]:
         """Get signals for a strategy.
         
         Args:
             strategy_id: Strategy ID
             limit: Maximum number of signals to return
-            offset: Number of signals to skip
+            offset: Number of signals to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load metadata along with the list columns
             
         Returns:
             List of Signal domain entities for the specified strategy
@@ -190,24 +370,83 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
                     raise DataNotFoundError(f"Strategy with ID {strategy_id} not found")
                 
                 # Get signals
-                query = select(SignalModel).where(
-                    SignalModel.strategy_id == strategy_id
-                ).order_by(desc(SignalModel.date)).offset(offset).limit(limit)
-                
-                results = session.execute(query).scalars().all()
+                query = paginate_keyset(
+                    _select_signals(full_detail).where(SignalModel.strategy_id == strategy_id),
+                    SignalModel.date, SignalModel.id, limit, offset, cursor
+                )
                 
-                return [result.to_domain() for result in results]
+                return _fetch_signals(session, query, full_detail)
         except SQLAlchemyError as e:
             logger.error(f"Error getting signals for strategy {strategy_id}: {str(e)}")
             raise DataError(f"Error getting signals for strategy: {str(e)}")
     
-    def get_signals_by_symbol(self, symbol: str, limit: int = 50, offset: int = 0) -> List[Signal]:
+    def iter_signals(self, strategy_id: str, batch_size: int = 1000) -> Iterator[Signal]:
+        """Stream all signals for a strategy in date order.
+        
+        Rows are fetched from the database in batches, so the full history is
+        never materialized at once.
+        
+        Args:
+            strategy_id: Strategy ID
+            batch_size: Number of rows fetched per round-trip
+            
+        Yields:
+            Signal domain entities for the specified strategy
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                query = (
+                    select(SignalModel)
+                    .where(SignalModel.strategy_id == strategy_id)
+                    .order_by(SignalModel.date, SignalModel.id)
+                    .execution_options(yield_per=batch_size)
+                )
+                
+                for result in session.execute(query).scalars():
+                    yield result.to_domain()
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming signals for strategy {strategy_id}: {str(e)}")
+            raise DataError(f"Error streaming signals for strategy: {str(e)}")
+    
+    def get_signals_by_ids(self, signal_ids: List[str]) -> List[Signal]:
+        """Get several signals by ID in a single query.
+        
+        Args:
+            signal_ids: Signal IDs
+            
+        Returns:
+            List of Signal domain entities in the order of signal_ids; unknown IDs are omitted
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        if not signal_ids:
+            return []
+        
+        try:
+            with get_session() as session:
+                query = select(SignalModel).where(SignalModel.id.in_(signal_ids))
+                
+                signals = {result.id: result.to_domain() for result in session.execute(query).scalars()}
+                
+                return [signals[signal_id] for signal_id in signal_ids if signal_id in signals]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting signals by IDs: {str(e)}")
+            raise DataError(f"Error getting signals by IDs: {str(e)}")
+    
+    def get_signals_by_symbol(self, symbol: str, limit: int = 50, offset: int = 0,
+                              cursor: Optional[str] = None, full_detail: bool = True) -> List[Signal]:
         """Get signals for a specific symbol across all strategies.
         
         Args:
             symbol: Stock symbol
             limit: Maximum number of signals to return
-            offset: Number of signals to skip
+            offset: Number of signals to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load metadata along with the list columns
             
         Returns:
             List of Signal domain entities for the specified symbol
@@ -218,23 +457,25 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         try:
             with get_session() as session:
                 # Get signals
-                query = select(SignalModel).where(
-                    SignalModel.symbol == symbol
-                ).order_by(desc(SignalModel.date)).offset(offset).limit(limit)
-                
-                results = session.execute(query).scalars().all()
+                query = paginate_keyset(
+                    _select_signals(full_detail).where(SignalModel.symbol == symbol),
+                    SignalModel.date, SignalModel.id, limit, offset, cursor
+                )
                 
-                return [result.to_domain() for result in results]
+                return _fetch_signals(session, query, full_detail)
         except SQLAlchemyError as e:
             logger.error(f"Error getting signals for symbol {symbol}: {str(e)}")
             raise DataError(f"Error getting signals for symbol: {str(e)}")
     
-    def get_recent_signals(self, days: int = 7, limit: int = 50) -> List[Signal]:
+    def get_recent_signals(self, days: int = 7, limit: int = 50, cursor: Optional[str] = None,
+                           full_detail: bool = True) -> List[Signal]:
         """Get recent signals across all strategies.
         
         Args:
             days: Number of days to look back
             limit: Maximum number of signals to return
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load metadata along with the list columns
             
         Returns:
             List of recent Signal domain entities
@@ -245,27 +486,29 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         try:
             with get_session() as session:
                 # Calculate cutoff date
-                cutoff_date = datetime.now() - datetime.timedelta(days=days)
+                cutoff_date = datetime.now() - timedelta(days=days)
                 
                 # Get signals
-                query = select(SignalModel).where(
-                    SignalModel.date >= cutoff_date
-                ).order_by(desc(SignalModel.date)).limit(limit)
+                query = paginate_keyset(
+                    _select_signals(full_detail).where(SignalModel.date >= cutoff_date),
+                    SignalModel.date, SignalModel.id, limit, cursor=cursor
+                )
                 
-                results = session.execute(query).scalars().all()
-                
-                return [result.to_domain() for result in results]
+                return _fetch_signals(session, query, full_detail)
         except SQLAlchemyError as e:
             logger.error(f"Error getting recent signals: {str(e)}")
             raise DataError(f"Error getting recent signals: {str(e)}")
     
-    def get_signals_by_type(self, signal_type: SignalType, limit: int = 50, offset: int = 0) -> List[Signal]:
+    def get_signals_by_type(self, signal_type: SignalType, limit: int = 50, offset: int = 0,
+                            cursor: Optional[str] = None, full_detail: bool = True) -> List[Signal]:
         """Get signals by type across all strategies.
         
         Args:
             signal_type: Signal type to filter by
             limit: Maximum number of signals to return
-            offset: Number of signals to skip
+            offset: Number of signals to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load metadata along with the list columns
             
         Returns:
             List of Signal domain entities of the specified type
@@ -276,17 +519,53 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
         try:
             with get_session() as session:
                 # Get signals
-                query = select(SignalModel).where(
-                    SignalModel.type == signal_type.value
-                ).order_by(desc(SignalModel.date)).offset(offset).limit(limit)
-                
-                results = session.execute(query).scalars().all()
+                query = paginate_keyset(
+                    _select_signals(full_detail).where(SignalModel.type == signal_type.value),
+                    SignalModel.date, SignalModel.id, limit, offset, cursor
+                )
                 
-                return [result.to_domain() for result in results]
+                return _fetch_signals(session, query, full_detail)
         except SQLAlchemyError as e:
             logger.error(f"Error getting signals by type {signal_type.value}: {str(e)}")
             raise DataError(f"Error getting signals by type: {str(e)}")
     
+    def compute_signal_stats(self, strategy_id: str) -> Dict[str, Any]:
+        """Summarize a strategy's signals in the database.
+        
+        Args:
+            strategy_id: Strategy ID
+            
+        Returns:
+            Dictionary with "type_counts" (signal counts keyed by SignalType)
+            and "symbols" (distinct symbols with signals)
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                # Count signals of each type
+                counts_query = select(SignalModel.type, func.count()).where(
+                    SignalModel.strategy_id == strategy_id
+                ).group_by(SignalModel.type)
+                
+                type_counts = {
+                    SignalType(signal_type): count
+                    for signal_type, count in session.execute(counts_query).all()
+                }
+                
+                # Collect distinct symbols
+                symbols_query = select(SignalModel.symbol).where(
+                    SignalModel.strategy_id == strategy_id
+                ).distinct()
+                
+                symbols = list(session.execute(symbols_query).scalars())
+                
+                return {"type_counts": type_counts, "symbols": symbols}
+        except SQLAlchemyError as e:
+            logger.error(f"Error computing signal stats for strategy {strategy_id}: {str(e)}")
+            raise DataError(f"Error computing signal stats for strategy: {str(e)}")
+    
     def update_strategy_performance(self, strategy_id: str, metrics: Dict[str, Any]) -> Strategy:
         """Update performance metrics for a strategy.
         
@@ -314,7 +593,6 @@ class StrategyRepository(BaseRepository[StrategyModel, Strategy]):
                 
                 # Commit changes
                 session.commit()
-                session.refresh(strategy_model)
                 
                 return self._to_entity(strategy_model)
         except SQLAlchemyError as e:
@@ -4,21 +4,33 @@ This module provides a repository implementation for user-related database opera
 following the repository pattern to abstract database access.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, or_
+from sqlalchemy import bindparam, select, insert, update, exists, and_, or_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
 
 from stocker.core.exceptions import DataError, DataNotFoundError
 from stocker.core.logging import get_logger
-from stocker.domain.user import User, UserRole
-from stocker.infrastructure.database.models.user import UserModel, UserRoleModel
+from stocker.domain.user import User, UserRole, UserPreferences
+from stocker.infrastructure.database.models.user import UserModel, UserRoleModel, user_roles
 from stocker.infrastructure.database.repositories.base import BaseRepository
 from stocker.infrastructure.database.session import get_session
 
 # Logger
 logger = get_logger(__name__)
 
+# Rows per INSERT statement when creating users in bulk
+_USER_INSERT_CHUNK_SIZE = 1000
+
+# Lookup statements built once; the constant statement keeps SQLAlchemy's
+# compiled-SQL cache key stable and skips rebuilding the Select per call
+SELECT_USER_BY_USERNAME = select(UserModel).where(UserModel.username == bindparam("username"))
+SELECT_USER_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("email"))
+
+# Relationships read by UserModel.to_domain, batch-loaded for user lists
+_USER_LIST_OPTIONS = (selectinload(UserModel.roles), selectinload(UserModel.portfolios))
+
 
 class UserRepository(BaseRepository[UserModel, User]):
     """Repository for user-related database operations.
@@ -52,6 +64,58 @@ class UserRepository(BaseRepository[UserModel, User]):
         """
         return model.to_domain()
     
+    def create_many(self, users_with_password_hashes: List[Tuple[User, str]]) -> List[User]:
+        """Create several users and their roles with one commit, skipping ORM object hydration.
+        
+        Args:
+            users_with_password_hashes: (user, password hash) pairs, with user IDs assigned
+            
+        Returns:
+            Created User domain entities
+            
+        Raises:
+            DataError: If an error occurs during creation
+        """
+        if not users_with_password_hashes:
+            return []
+        
+        try:
+            with get_session() as session:
+                # Insert users as plain rows in batches
+                for start in range(0, len(users_with_password_hashes), _USER_INSERT_CHUNK_SIZE):
+                    rows = [
+                        {
+                            "id": user.id,
+                            "username": user.username,
+                            "email": user.email,
+                            "password_hash": password_hash,
+                            "first_name": user.first_name,
+                            "last_name": user.last_name,
+                            "status": user.status.value,
+                            "preferences": user.preferences.to_dict(),
+                            "created_at": user.created_at,
+                            "last_login": user.last_login
+                        }
+                        for user, password_hash in users_with_password_hashes[start:start + _USER_INSERT_CHUNK_SIZE]
+                    ]
+                    session.execute(insert(UserModel), rows)
+                
+                # Link each user to its roles
+                role_rows = [
+                    {"user_id": user.id, "role": role.value}
+                    for user, _ in users_with_password_hashes
+                    for role in user.roles
+                ]
+                for start in range(0, len(role_rows), _USER_INSERT_CHUNK_SIZE):
+                    session.execute(insert(user_roles), role_rows[start:start + _USER_INSERT_CHUNK_SIZE])
+                
+                session.commit()
+                
+                return [user for user, _ in users_with_password_hashes]
+        except SQLAlchemyError as e:
+            logger.error(f"Error creating users in bulk: {str(e)}")
+            raise DataError(f"Error creating users in bulk: {str(e)}")
+    
     def get_by_username(self, username: str) -> Optional[User]:
         """Get a user by username.
         
@@ -66,8 +130,9 @@ class UserRepository(BaseRepository[UserModel, User]):
         """
         try:
             with get_session() as session:
-                query = select(UserModel).where(UserModel.username == username)
-                result = session.execute(query).scalar_one_or_none()
+                result = session.execute(
+                    SELECT_USER_BY_USERNAME, {"username": username}
+                ).scalar_one_or_none()
                 
                 if result is None:
                     return None
@@ -91,8 +156,9 @@ class UserRepository(BaseRepository[UserModel, User]):
         """
         try:
             with get_session() as session:
-                query = select(UserModel).where(UserModel.email == email)
-                result = session.execute(query).scalar_one_or_none()
+                result = session.execute(
+                    SELECT_USER_BY_EMAIL, {"email": email}
+                ).scalar_one_or_none()
                 
                 if result is None:
                     return None
@@ -102,6 +168,122 @@ class UserRepository(BaseRepository[UserModel, User]):
             logger.error(f"Error getting user by email {email}: {str(e)}")
             raise DataError(f"Error getting user by email {email}: {str(e)}")
     
+    def update_fields(self, user_id: str, **fields: Any) -> None:
+        """Update only the given user columns in a single UPDATE statement.
+        
+        Args:
+            user_id: User ID
+            **fields: Domain values keyed by User attribute name, e.g. email or status
+            
+        Raises:
+            DataNotFoundError: If the user is not found
+            DataError: If an error occurs during the operation
+        """
+        # Convert domain values to their column representation
+        values = dict(fields)
+        if "status" in values:
+            values["status"] = values["status"].value
+        if "preferences" in values:
+            values["preferences"] = values["preferences"].to_dict()
+        
+        try:
+            with get_session() as session:
+                query = update(UserModel).where(UserModel.id == user_id).values(**values)
+                
+                # No matched row means the user does not exist
+                if session.execute(query).rowcount == 0:
+                    raise DataNotFoundError(f"User with ID {user_id} not found")
+                
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating user {user_id}: {str(e)}")
+            raise DataError(f"Error updating user: {str(e)}")
+    
+    def update_preferences(self, user_id: str, preferences: UserPreferences) -> None:
+        """Replace a user's preferences in a single UPDATE statement.
+        
+        Args:
+            user_id: User ID
+            preferences: User preferences
+            
+        Raises:
+            DataNotFoundError: If the user is not found
+            DataError: If an error occurs during the operation
+        """
+        try:
+            with get_session() as session:
+                query = (
+                    update(UserModel)
+                    .where(UserModel.id == user_id)
+                    .values(preferences=preferences.to_dict())
+                )
+                
+                # No matched row means the user does not exist
+                if session.execute(query).rowcount == 0:
+                    raise DataNotFoundError(f"User with ID {user_id} not found")
+                
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating preferences for user {user_id}: {str(e)}")
+            raise DataError(f"Error updating user preferences: {str(e)}")
+    
+    def check_taken(self, username: Optional[str], email: Optional[str],
+                    exclude_id: Optional[str] = None) -> Tuple[bool, bool]:
+        """Check whether a username and email are in use with one EXISTS query.
+        
+        Args:
+            username: Username to check (None to skip)
+            email: Email to check (None to skip)
+            exclude_id: ID of a user to ignore, e.g. the user being updated
+            
+        Returns:
+            (username_taken, email_taken) tuple; skipped values are False
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        checks = {"username": (UserModel.username, username), "email": (UserModel.email, email)}
+        clauses = {}
+        for name, (column, value) in checks.items():
+            if value is not None:
+                condition = column == value
+                if exclude_id is not None:
+                    condition = and_(condition, UserModel.id != exclude_id)
+                clauses[name] = exists().where(condition)
+        
+        if not clauses:
+            return False, False
+        
+        try:
+            with get_session() as session:
+                row = session.execute(select(*clauses.values())).one()
+                taken = dict(zip(clauses, row))
+                
+                return bool(taken.get("username")), bool(taken.get("email"))
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking username/email availability: {str(e)}")
+            raise DataError(f"Error checking username/email availability: {str(e)}")
+    
+    def get_id_by_api_key_hash(self, api_key_hash: str) -> Optional[str]:
+        """Get the ID of the user owning an API key.
+        
+        Args:
+            api_key_hash: Hex-encoded SHA-256 digest of the API key
+            
+        Returns:
+            User ID if found, None otherwise
+            
+        Raises:
+            DataError: If an error occurs during retrieval
+        """
+        try:
+            with get_session() as session:
+                query = select(UserModel.id).where(UserModel.api_key_sha256 == api_key_hash)
+                return session.execute(query).scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting user by API key hash: {str(e)}")
+            raise DataError(f"Error getting user by API key hash: {str(e)}")
+    
     def search_users(self, search_term: str, limit: int = 10, offset: int = 0) -> List[User]:
         """Search for users by username, email, or name.
         
@@ -129,7 +311,7 @@ class UserRepository(BaseRepository[UserModel, User]):
                         UserModel.first_name.ilike(pattern),
                         UserModel.last_name.ilike(pattern)
                     )
-                ).offset(offset).limit(limit)
+                ).options(*_USER_LIST_OPTIONS).offset(offset).limit(limit)
                 
                 results = session.execute(query).scalars().all()
                 
@@ -160,7 +342,7 @@ class UserRepository(BaseRepository[UserModel, User]):
                     UserModel.roles
                 ).where(
                     UserRoleModel.role == role.value
-                ).offset(offset).limit(limit)
+                ).options(*_USER_LIST_OPTIONS).offset(offset).limit(limit)
                 
                 results = session.execute(query).scalars().all()
                 
@@ -203,7 +385,6 @@ class UserRepository(BaseRepository[UserModel, User]):
                 if role_model not in user_model.roles:
                     user_model.roles.append(role_model)
                     session.commit()
-                    session.refresh(user_model)
                 
                 return self._to_entity(user_model)
         except SQLAlchemyError as e:
@@ -244,7 +425,6 @@ class UserRepository(BaseRepository[UserModel, User]):
                 if role_model in user_model.roles and len(user_model.roles) > 1:
                     user_model.roles.remove(role_model)
                     session.commit()
-                    session.refresh(user_model)
                 
                 return self._to_entity(user_model)
         except SQLAlchemyError as e:
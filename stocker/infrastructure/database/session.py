@@ -27,6 +27,19 @@ Base = declarative_base()
 _SessionFactory = None
 
 
+def _pool_setting(name: str, default: int) -> int:
+    """Read an integer connection pool setting from the environment.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+        
+    Returns:
+        Setting value
+    """
+    return int(os.environ.get(name, default))
+
+
 def init_db(connection_string: Optional[str] = None, echo: bool = False) -> Engine:
     """Initialize the database connection and create tables.
     
@@ -47,19 +60,22 @@ def init_db(connection_string: Optional[str] = None, echo: bool = False) -> Engi
             f"sqlite:///{os.path.join(settings.data_dir, 'stocker.db')}"
         )
     
-    # Create engine with connection pooling
+    # Create engine with connection pooling; pre-ping replaces connections
+    # the server has dropped instead of failing the first query on them
     engine = create_engine(
         connection_string,
         echo=echo,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
-        pool_timeout=30,
-        pool_recycle=1800  # Recycle connections after 30 minutes
+        pool_size=_pool_setting("DATABASE_POOL_SIZE", 10),
+        max_overflow=_pool_setting("DATABASE_MAX_OVERFLOW", 20),
+        pool_timeout=_pool_setting("DATABASE_POOL_TIMEOUT", 30),
+        pool_recycle=_pool_setting("DATABASE_POOL_RECYCLE", 1800),  # Recycle connections after 30 minutes
+        pool_pre_ping=True
     )
     
-    # Create session factory
-    _SessionFactory = sessionmaker(bind=engine)
+    # Create session factory; sessions are short-lived, so loaded objects can
+    # keep their state after commit instead of being reloaded on next access
+    _SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
     
     # Create tables
     Base.metadata.create_all(engine)
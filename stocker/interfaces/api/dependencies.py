@@ -18,7 +18,7 @@ from stocker.domain.user import User, UserRole
 from stocker.interfaces.api.schemas.auth import TokenData
 from stocker.interfaces.api.security import (
     oauth2_scheme, 
-    decode_token, 
+    decode_token_payload, 
     is_token_expired,
     get_security_settings,
     create_access_token,
@@ -124,7 +124,7 @@ async def get_current_user(
             raise credentials_exception
         
         # Decode JWT token
-        payload = decode_token(token)
+        payload = decode_token_payload(token)
         
         # Check token type
         token_type = payload.get("token_type")
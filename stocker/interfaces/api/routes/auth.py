@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from stocker.core.config.settings import get_settings
+from stocker.core.exceptions import AuthenticationError
 from stocker.core.logging import get_logger
 from stocker.domain.user import User
 from stocker.interfaces.api.dependencies import (
@@ -45,7 +46,7 @@ async def login_for_access_token(
         HTTPException: If authentication fails
     """
     # Authenticate user
-    user = user_service.authenticate_user(form_data.username, form_data.password)
+    user = await user_service.authenticate_user_async(form_data.username, form_data.password)
     if not user:
         logger.warning(f"Failed login attempt for user {form_data.username}")
         raise HTTPException(
@@ -107,7 +108,7 @@ async def login(
         HTTPException: If authentication fails
     """
     # Authenticate user
-    user = user_service.authenticate_user(login_data.username, login_data.password)
+    user = await user_service.authenticate_user_async(login_data.username, login_data.password)
     if not user:
         logger.warning(f"Failed login attempt for user {login_data.username}")
         raise HTTPException(
@@ -170,17 +171,20 @@ async def change_password(
     Raises:
         HTTPException: If password change fails
     """
-    # Verify current password
-    if not user_service.verify_password(password_data.current_password, current_user.password_hash):
+    # Change password; the service verifies the current password first
+    try:
+        await user_service.change_password_async(
+            current_user.id,
+            password_data.current_password,
+            password_data.new_password
+        )
+    except AuthenticationError:
         logger.warning(f"Failed password change attempt for user {current_user.id}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
-    # Change password
-    user_service.change_password(current_user.id, password_data.new_password)
-    
     # Return success message
     return {"message": "Password changed successfully"}
 
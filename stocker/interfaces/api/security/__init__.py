@@ -7,10 +7,17 @@ from stocker.interfaces.api.security.auth import (
     get_current_user,
     get_current_active_user,
     get_current_admin_user,
+    get_user_service,
+    get_security_settings,
     get_password_hash,
     verify_password,
+    validate_password_strength,
     create_access_token,
+    create_refresh_token,
     decode_token,
+    decode_token_payload,
+    is_token_expired,
+    get_token_expiration,
     oauth2_scheme,
     api_key_scheme
 )
@@ -26,10 +33,17 @@ __all__ = [
     "get_current_user",
     "get_current_active_user",
     "get_current_admin_user",
+    "get_user_service",
+    "get_security_settings",
     "get_password_hash",
     "verify_password",
+    "validate_password_strength",
     "create_access_token",
+    "create_refresh_token",
     "decode_token",
+    "decode_token_payload",
+    "is_token_expired",
+    "get_token_expiration",
     "oauth2_scheme",
     "api_key_scheme",
     "Token",
@@ -3,29 +3,44 @@
 This module provides authentication-related functionality for the API.
 """
 
+import base64
+import hashlib
+import hmac
+import time
+from calendar import timegm
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Any
 import uuid
 
+import orjson
 from fastapi import Depends, HTTPException, status, Security, Request
 from fastapi.security import OAuth2PasswordBearer, APIKeyHeader
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 
-from stocker.core.config.settings import get_settings
+from stocker.core.config.settings import SecuritySettings, get_settings
 from stocker.core.logging import get_logger
 from stocker.core.exceptions import AuthenticationError, AuthorizationError
+from stocker.core.utils import passwords
 from stocker.domain.user import User
-from stocker.infrastructure.database.session import get_db
 from stocker.interfaces.api.security.models import TokenData
-from stocker.services.user_service import UserService
+from stocker.services.user import UserService
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# HMAC digests for the JWT algorithms handled by the orjson codec
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Registered claims that carry NumericDate values
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+# Shared user service; it holds no per-request state
+_user_service = UserService()
 
 # OAuth2 scheme for JWT authentication
 oauth2_scheme = OAuth2PasswordBearer(
@@ -40,6 +55,15 @@ api_key_scheme = APIKeyHeader(
 )
 
 
+def get_security_settings() -> SecuritySettings:
+    """Get security settings from application settings.
+    
+    Returns:
+        SecuritySettings: Security settings
+    """
+    return get_settings().security
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash.
     
@@ -50,7 +74,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches hash, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return passwords.verify_password(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -62,7 +86,206 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    return pwd_context.hash(password)
+    return passwords.hash_password(password)
+
+
+def validate_password_strength(password: str) -> Dict[str, Union[bool, str]]:
+    """Validate password strength against security settings.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Dict[str, Union[bool, str]]: Validation result with success flag and message
+    """
+    # Get security settings
+    security_settings = get_security_settings()
+    
+    # Check password length
+    if len(password) < security_settings.password_min_length:
+        return {
+            "success": False,
+            "message": f"Password must be at least {security_settings.password_min_length} characters long"
+        }
+    
+    # Check for uppercase letters
+    if security_settings.password_require_uppercase and not any(c.isupper() for c in password):
+        return {
+            "success": False,
+            "message": "Password must contain at least one uppercase letter"
+        }
+    
+    # Check for lowercase letters
+    if security_settings.password_require_lowercase and not any(c.islower() for c in password):
+        return {
+            "success": False,
+            "message": "Password must contain at least one lowercase letter"
+        }
+    
+    # Check for digits
+    if security_settings.password_require_digit and not any(c.isdigit() for c in password):
+        return {
+            "success": False,
+            "message": "Password must contain at least one digit"
+        }
+    
+    # Check for special characters
+    if security_settings.password_require_special and not any(not c.isalnum() for c in password):
+        return {
+            "success": False,
+            "message": "Password must contain at least one special character"
+        }
+    
+    return {
+        "success": True,
+        "message": "Password meets strength requirements"
+    }
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode bytes without padding."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Base64url-decode bytes, restoring any stripped padding."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _jwt_encode(claims: Dict[str, Any], key: str, algorithm: str) -> str:
+    """Encode a JWT, serializing header and claims with orjson.
+    
+    HMAC algorithms are signed here; any other algorithm is delegated to jose.
+    
+    Args:
+        claims: Token claims
+        key: Signing key
+        algorithm: JWT signing algorithm
+        
+    Returns:
+        str: Encoded JWT
+    """
+    digest = _HMAC_DIGESTS.get(algorithm)
+    if digest is None:
+        return jwt.encode(claims, key, algorithm=algorithm)
+    
+    # Convert datetime claims to NumericDate, as jose does
+    for claim in _TIME_CLAIMS:
+        value = claims.get(claim)
+        if isinstance(value, datetime):
+            claims[claim] = timegm(value.utctimetuple())
+    
+    header = orjson.dumps({"alg": algorithm, "typ": "JWT"})
+    signing_input = _b64url_encode(header) + b"." + _b64url_encode(orjson.dumps(claims))
+    signature = hmac.new(key.encode("utf-8"), signing_input, digest).digest()
+    
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+
+def _validate_audience(claims: Dict[str, Any], audience: Optional[str]) -> None:
+    """Validate the aud claim the same way jose does.
+    
+    A token that names an audience is only accepted by that audience, so it
+    is rejected when no audience is configured.
+    
+    Args:
+        claims: Token claims
+        audience: Expected audience, if any
+        
+    Raises:
+        JWTClaimsError: If the audience does not match
+    """
+    if "aud" not in claims:
+        return
+    
+    audience_claims = claims["aud"]
+    if isinstance(audience_claims, str):
+        audience_claims = [audience_claims]
+    if not isinstance(audience_claims, list) or any(not isinstance(c, str) for c in audience_claims):
+        raise JWTClaimsError("Invalid claim format in token")
+    if audience not in audience_claims:
+        raise JWTClaimsError("Invalid audience")
+
+
+def _jwt_decode(
+    token: str,
+    key: str,
+    algorithm: str,
+    audience: Optional[str] = None,
+    issuer: Optional[str] = None
+) -> Dict[str, Any]:
+    """Decode and verify a JWT, parsing header and claims with orjson.
+    
+    HMAC algorithms are verified here; any other algorithm is delegated to jose.
+    
+    Args:
+        token: Encoded JWT
+        key: Verification key
+        algorithm: Expected JWT signing algorithm
+        audience: Expected aud claim, if any
+        issuer: Expected iss claim, if any
+        
+    Returns:
+        Dict[str, Any]: Verified token claims
+        
+    Raises:
+        JWTError: If the token is malformed, has an invalid signature, is
+            expired or was not issued by and for the expected parties
+    """
+    digest = _HMAC_DIGESTS.get(algorithm)
+    if digest is None:
+        return jwt.decode(token, key, algorithms=[algorithm], audience=audience, issuer=issuer)
+    
+    try:
+        signing_input, _, encoded_signature = token.encode("ascii").rpartition(b".")
+        encoded_header, _, encoded_claims = signing_input.partition(b".")
+        header = orjson.loads(_b64url_decode(encoded_header))
+        claims = orjson.loads(_b64url_decode(encoded_claims))
+        signature = _b64url_decode(encoded_signature)
+    except (ValueError, TypeError) as e:
+        raise JWTError(f"Error decoding token: {str(e)}")
+    
+    if not isinstance(header, dict) or not isinstance(claims, dict):
+        raise JWTError("Invalid token segments")
+    
+    if header.get("alg") != algorithm:
+        raise JWTError("The specified alg value is not allowed")
+    
+    expected = hmac.new(key.encode("utf-8"), signing_input, digest).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise JWTError("Signature verification failed.")
+    
+    now = timegm(time.gmtime())
+    
+    for claim in _TIME_CLAIMS:
+        if claim in claims and not isinstance(claims[claim], int):
+            raise JWTClaimsError(f"{claim} claim must be an integer.")
+    
+    if "nbf" in claims and claims["nbf"] > now:
+        raise JWTClaimsError("The token is not yet valid (nbf)")
+    
+    if "exp" in claims and claims["exp"] < now:
+        raise ExpiredSignatureError("Signature has expired.")
+    
+    _validate_audience(claims, audience)
+    
+    if issuer is not None and claims.get("iss") != issuer:
+        raise JWTClaimsError("Invalid issuer")
+    
+    return claims
+
+
+def _add_audience_and_issuer(claims: Dict[str, Any], security_settings: SecuritySettings) -> None:
+    """Add the configured aud and iss claims to a token being created.
+    
+    Args:
+        claims: Token claims to update
+        security_settings: Security settings
+    """
+    if security_settings.token_audience is not None:
+        claims["aud"] = security_settings.token_audience
+    if security_settings.token_issuer is not None:
+        claims["iss"] = security_settings.token_issuer
 
 
 def create_access_token(
@@ -78,34 +301,99 @@ def create_access_token(
     Returns:
         str: JWT token
     """
-    settings = get_settings()
+    security_settings = get_security_settings()
     
     # Create a copy of the data
     to_encode = data.copy()
     
     # Set expiration time
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.security.access_token_expire_minutes)
+        expire = now + timedelta(minutes=security_settings.access_token_expire_minutes)
     
     # Add claims
     to_encode.update({
+        "token_type": "access",
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
+        "nbf": now,
         "jti": str(uuid.uuid4())
     })
+    _add_audience_and_issuer(to_encode, security_settings)
     
     # Encode token
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt_encode(
         to_encode,
-        settings.security.secret_key,
-        algorithm=settings.security.algorithm
+        security_settings.secret_key,
+        security_settings.algorithm
     )
     
     return encoded_jwt
 
 
+def create_refresh_token(data: Dict[str, Any]) -> str:
+    """Create a JWT refresh token.
+    
+    Args:
+        data: Token data
+        
+    Returns:
+        str: JWT token
+    """
+    security_settings = get_security_settings()
+    
+    # Create a copy of the data
+    to_encode = data.copy()
+    
+    # Set expiration time (longer than access token)
+    now = datetime.utcnow()
+    expire = now + timedelta(days=security_settings.refresh_token_expire_days)
+    
+    # Add claims
+    to_encode.update({
+        "token_type": "refresh",
+        "exp": expire,
+        "iat": now,
+        "nbf": now,
+        "jti": str(uuid.uuid4())
+    })
+    _add_audience_and_issuer(to_encode, security_settings)
+    
+    # Encode token
+    encoded_jwt = _jwt_encode(
+        to_encode,
+        security_settings.secret_key,
+        security_settings.algorithm
+    )
+    
+    return encoded_jwt
+
+
+def decode_token_payload(token: str) -> Dict[str, Any]:
+    """Decode a JWT token into its raw claims.
+    
+    Args:
+        token: JWT token
+        
+    Returns:
+        Dict[str, Any]: Decoded token claims
+        
+    Raises:
+        JWTError: If token is invalid
+    """
+    security_settings = get_security_settings()
+    
+    return _jwt_decode(
+        token,
+        security_settings.secret_key,
+        security_settings.algorithm,
+        audience=security_settings.token_audience,
+        issuer=security_settings.token_issuer
+    )
+
+
 def decode_token(token: str) -> TokenData:
     """Decode a JWT token.
     
@@ -118,15 +406,9 @@ def decode_token(token: str) -> TokenData:
     Raises:
         AuthenticationError: If token is invalid
     """
-    settings = get_settings()
-    
     try:
         # Decode token
-        payload = jwt.decode(
-            token,
-            settings.security.secret_key,
-            algorithms=[settings.security.algorithm]
-        )
+        payload = decode_token_payload(token)
         
         # Extract data
         token_data = TokenData(
@@ -145,21 +427,131 @@ def decode_token(token: str) -> TokenData:
         raise AuthenticationError("Invalid authentication credentials")
 
 
+def is_token_expired(token: str) -> bool:
+    """Check if a JWT token is expired.
+    
+    Args:
+        token: JWT token
+        
+    Returns:
+        bool: True if token is expired, False otherwise
+    """
+    try:
+        payload = decode_token_payload(token)
+    except JWTError:
+        return True
+    
+    # Tokens without an expiration claim are treated as expired
+    return payload.get("exp") is None
+
+
+def get_token_expiration(token: str) -> Optional[datetime]:
+    """Get the expiration time of a JWT token.
+    
+    Args:
+        token: JWT token
+        
+    Returns:
+        Optional[datetime]: Token expiration time, or None if token is invalid
+    """
+    try:
+        exp = decode_token_payload(token).get("exp")
+    except JWTError:
+        return None
+    
+    if exp is None:
+        return None
+    
+    return datetime.utcfromtimestamp(exp)
+
+
+def get_user_service() -> UserService:
+    """Get the shared user service instance.
+    
+    Returns:
+        UserService: User service
+    """
+    return _user_service
+
+
+def _authenticate_token(
+    request: Request,
+    token: str,
+    user_service: UserService
+) -> User:
+    """Authenticate a user from a JWT token.
+    
+    Args:
+        request: FastAPI request
+        token: JWT token
+        user_service: User service
+        
+    Returns:
+        User: Authenticated user
+        
+    Raises:
+        AuthenticationError: If the token is invalid or the user does not exist
+    """
+    # Decode token
+    token_data = decode_token(token)
+    
+    # Get user by ID
+    user = user_service.get_user(token_data.sub)
+    if not user:
+        logger.warning(f"User not found: {token_data.sub}")
+        raise AuthenticationError("User not found")
+    
+    # Store token data in request state
+    request.state.token_data = token_data
+    
+    return user
+
+
+def _authenticate_api_key(api_key: str, user_service: UserService) -> User:
+    """Authenticate a user from an API key.
+    
+    Args:
+        api_key: API key
+        user_service: User service
+        
+    Returns:
+        User: Authenticated user
+        
+    Raises:
+        AuthenticationError: If the API key is invalid
+    """
+    try:
+        # Get user by API key
+        user = user_service.get_user_by_api_key(api_key)
+    except Exception as e:
+        logger.error(f"API key authentication error: {str(e)}")
+        raise AuthenticationError("Authentication failed")
+    
+    if not user:
+        logger.warning("Invalid API key")
+        raise AuthenticationError("Invalid API key")
+    
+    return user
+
+
 async def get_current_user(
     request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
     api_key: Optional[str] = Depends(api_key_scheme),
-    db: Session = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ) -> User:
     """Get the current authenticated user.
     
-    This function supports both JWT and API key authentication.
+    This function supports both JWT and API key authentication. The
+    mechanism is chosen from the credentials actually sent; the API key is
+    only tried as a fallback when both a token and an API key are present
+    and the token is rejected.
     
     Args:
         request: FastAPI request
         token: JWT token
         api_key: API key
-        db: Database session
+        user_service: User service
         
     Returns:
         User: Authenticated user
@@ -172,46 +564,17 @@ async def get_current_user(
         logger.warning("Authentication failed: No credentials provided")
         raise AuthenticationError("Not authenticated")
     
-    # Create user service
-    user_service = UserService(db)
+    if not token:
+        return _authenticate_api_key(api_key, user_service)
     
-    # Try JWT authentication first
-    if token:
-        try:
-            # Decode token
-            token_data = decode_token(token)
-            
-            # Get user by ID
-            user = user_service.get_user_by_id(token_data.sub)
-            if not user:
-                logger.warning(f"User not found: {token_data.sub}")
-                raise AuthenticationError("User not found")
-            
-            # Store token data in request state
-            request.state.token_data = token_data
-            
-            return user
-        except AuthenticationError:
-            # If API key is provided, try that instead
-            if not api_key:
-                raise
-    
-    # Try API key authentication
-    if api_key:
-        try:
-            # Get user by API key
-            user = user_service.get_user_by_api_key(api_key)
-            if not user:
-                logger.warning("Invalid API key")
-                raise AuthenticationError("Invalid API key")
-            
-            return user
-        except Exception as e:
-            logger.error(f"API key authentication error: {str(e)}")
-            raise AuthenticationError("Authentication failed")
+    if not api_key:
+        return _authenticate_token(request, token, user_service)
     
-    # This should never happen
-    raise AuthenticationError("Authentication failed")
+    # Both credentials were sent, fall back to the API key if the token fails
+    try:
+        return _authenticate_token(request, token, user_service)
+    except AuthenticationError:
+        return _authenticate_api_key(api_key, user_service)
 
 
 async def get_current_active_user(
@@ -263,6 +626,8 @@ def require_roles(roles: List[str]):
     Returns:
         callable: Dependency function
     """
+    required_roles = frozenset(roles)
+    
     async def _require_roles(
         current_user: User = Depends(get_current_active_user)
     ) -> User:
@@ -282,15 +647,12 @@ def require_roles(roles: List[str]):
             return current_user
         
         # Check if user has any of the required roles
-        user_roles = set(current_user.roles)
-        required_roles = set(roles)
-        
-        if not user_roles.intersection(required_roles):
+        if current_user.roles.isdisjoint(required_roles):
             logger.warning(
                 f"User {current_user.id} lacks required roles: {roles}",
                 extra={
                     "user_id": current_user.id,
-                    "user_roles": list(user_roles),
+                    "user_roles": list(current_user.roles),
                     "required_roles": roles
                 }
             )
@@ -8,6 +8,9 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field, EmailStr, validator
 
+# Characters accepted as special characters in passwords
+_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_-+={}[]|:;<>,.?/~`")
+
 
 class Token(BaseModel):
     """Token response model."""
@@ -60,8 +63,8 @@ class PasswordChange(BaseModel):
     new_password: str = Field(..., description="New password")
     
     @validator("new_password")
-    def validate_password_strength(cls, v):
-        """Validate password strength."""
+    def validate_new_password(cls, v, values):
+        """Validate password strength and that it differs from the current password."""
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
         
@@ -74,14 +77,10 @@ class PasswordChange(BaseModel):
         if not any(c.isdigit() for c in v):
             raise ValueError("Password must contain at least one digit")
         
-        if not any(c in "!@#$%^&*()_-+={}[]|:;<>,.?/~`" for c in v):
+        if _SPECIAL_CHARACTERS.isdisjoint(v):
             raise ValueError("Password must contain at least one special character")
         
-        return v
-    
-    @validator("new_password")
-    def new_password_different(cls, v, values):
-        """Validate new password is different from current password."""
-        if "current_password" in values and v == values["current_password"]:
+        if values.get("current_password") == v:
             raise ValueError("New password must be different from current password")
+        
         return v
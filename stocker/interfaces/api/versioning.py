@@ -52,6 +52,16 @@ class APIVersion(str, Enum):
         return list(cls)
 
 
+# Integer rank of each API version, used for ordering comparisons
+_VERSION_RANK: Dict[APIVersion, int] = {
+    APIVersion.V1: 1,
+    APIVersion.V2: 2,
+}
+
+# Lookup of API versions by their header value
+_VERSION_MAP: Dict[str, APIVersion] = {v.value: v for v in APIVersion}
+
+
 class VersionedAPIRouter(APIRouter):
     """Versioned API router.
     
@@ -93,14 +103,15 @@ def get_api_version(x_api_version: Optional[str] = Header(None)) -> APIVersion:
     if x_api_version is None:
         return APIVersion.default()
     
-    try:
-        return APIVersion(x_api_version.lower())
-    except ValueError:
-        valid_versions = ", ".join([v.value for v in APIVersion])
+    api_version = _VERSION_MAP.get(x_api_version.lower())
+    if api_version is None:
+        valid_versions = ", ".join(_VERSION_MAP)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid API version: {x_api_version}. Valid versions: {valid_versions}"
         )
+    
+    return api_version
 
 
 def version_dependency(version: APIVersion):
@@ -112,8 +123,10 @@ def version_dependency(version: APIVersion):
     Returns:
         Callable: Dependency function
     """
+    required_rank = _VERSION_RANK[version]
+    
     def _check_version(api_version: APIVersion = Depends(get_api_version)) -> None:
-        if api_version.value < version.value:
+        if _VERSION_RANK[api_version] < required_rank:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"This endpoint requires API version {version} or higher"
@@ -4,6 +4,7 @@ This module provides a base service class that implements common functionality
 and serves as a foundation for specific service implementations.
 """
 
+import logging
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 
 from stocker.core.exceptions import ServiceError
@@ -20,9 +21,17 @@ class BaseService:
     foundation for specific service implementations.
     """
     
+    # Per-class logger, resolved once when the class is defined
+    _logger = get_logger(f"{__name__}.BaseService")
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the logger for a service subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = get_logger(f"{__name__}.{cls.__name__}")
+    
     def __init__(self):
         """Initialize the service."""
-        self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+        self.logger = self._logger
     
     def _log_operation(self, operation: str, **kwargs) -> None:
         """Log an operation with structured data.
@@ -31,9 +40,13 @@ class BaseService:
             operation: Name of the operation
             **kwargs: Additional data to log
         """
+        # Skip building the log record when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_data = {"operation": operation}
         log_data.update(kwargs)
-        self.logger.info(f"Service operation: {operation}", extra={"data": log_data})
+        self.logger.info("Service operation: %s", operation, extra={"data": log_data})
     
     def _handle_error(self, operation: str, error: Exception, **kwargs) -> None:
         """Handle and log an error.
@@ -46,13 +59,15 @@ class BaseService:
         Raises:
             ServiceError: Wrapped exception with operation context
         """
-        log_data = {"operation": operation, "error": str(error)}
-        log_data.update(kwargs)
-        self.logger.error(
-            f"Service operation failed: {operation} - {str(error)}", 
-            extra={"data": log_data},
-            exc_info=True
-        )
+        # Only format the record and traceback when ERROR is enabled
+        if self.logger.isEnabledFor(logging.ERROR):
+            log_data = {"operation": operation, "error": str(error)}
+            log_data.update(kwargs)
+            self.logger.error(
+                "Service operation failed: %s - %s", operation, error,
+                extra={"data": log_data},
+                exc_info=True
+            )
         
         # Wrap the exception in a ServiceError to provide context
         raise ServiceError(
@@ -4,16 +4,22 @@ This module provides a service implementation for portfolio-related business log
 coordinating between domain models and repositories.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any, Union
+import logging
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any, Union
 import uuid
 
 from stocker.core.exceptions import ServiceError, DataNotFoundError
 from stocker.domain.portfolio import Portfolio, Position, Transaction, PortfolioType, TransactionType
-from stocker.domain.stock import Stock
+from stocker.domain.stock import Stock, StockPrice
 from stocker.infrastructure.database.repositories.portfolio import PortfolioRepository
 from stocker.infrastructure.database.repositories.stock import StockRepository
 from stocker.services.base import BaseService
+from stocker.services.stock import STOCK_EXISTS_TTL, stock_exists_cache
+
+# Transaction types that reference a stock symbol
+_STOCK_TRANSACTION_TYPES = frozenset({TransactionType.BUY, TransactionType.SELL})
 
 
 class PortfolioService(BaseService):
@@ -34,6 +40,26 @@ class PortfolioService(BaseService):
         super().__init__()
         self.portfolio_repository = portfolio_repository or PortfolioRepository()
         self.stock_repository = stock_repository or StockRepository()
+        
+        # Memoize lookups for the lifetime of the service (typically one request)
+        self._get_portfolio_cached = lru_cache(maxsize=128)(self.portfolio_repository.get_by_id)
+    
+    def _stock_exists_cached(self, symbol: str) -> bool:
+        """Check whether a stock exists, caching positive results briefly.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            True if the stock exists, False otherwise
+        """
+        if stock_exists_cache.get(symbol):
+            return True
+        
+        exists = self.stock_repository.exists(symbol)
+        if exists:
+            stock_exists_cache.set(symbol, True, ttl=STOCK_EXISTS_TTL)
+        return exists
     
     def get_portfolio(self, portfolio_id: str) -> Optional[Portfolio]:
         """Get a portfolio by ID.
@@ -47,11 +73,13 @@ class PortfolioService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"portfolio_id": portfolio_id}
+        
         try:
-            self._log_operation("get_portfolio", portfolio_id=portfolio_id)
-            return self.portfolio_repository.get_by_id(portfolio_id)
+            self._log_operation("get_portfolio", **ctx)
+            return self._get_portfolio_cached(portfolio_id)
         except Exception as e:
-            self._handle_error("get_portfolio", e, portfolio_id=portfolio_id)
+            self._handle_error("get_portfolio", e, **ctx)
     
     def get_portfolio_or_raise(self, portfolio_id: str) -> Portfolio:
         """Get a portfolio by ID or raise an exception if not found.
@@ -85,11 +113,13 @@ class PortfolioService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"owner_id": owner_id, "limit": limit, "offset": offset}
+        
         try:
-            self._log_operation("get_portfolios_by_owner", owner_id=owner_id, limit=limit, offset=offset)
+            self._log_operation("get_portfolios_by_owner", **ctx)
             return self.portfolio_repository.get_by_owner(owner_id, limit, offset)
         except Exception as e:
-            self._handle_error("get_portfolios_by_owner", e, owner_id=owner_id, limit=limit, offset=offset)
+            self._handle_error("get_portfolios_by_owner", e, **ctx)
     
     def create_portfolio(self, portfolio: Portfolio) -> Portfolio:
         """Create a new portfolio.
@@ -103,15 +133,18 @@ class PortfolioService(BaseService):
         Raises:
             ServiceError: If an error occurs during creation
         """
+        # Ensure portfolio has an ID
+        if not portfolio.id:
+            portfolio.id = uuid.uuid4().hex
+        
+        ctx = {"portfolio_id": portfolio.id, "name": portfolio.name}
+        
         try:
-            # Ensure portfolio has an ID
-            if not portfolio.id:
-                portfolio.id = str(uuid.uuid4())
-            
-            self._log_operation("create_portfolio", portfolio_id=portfolio.id, name=portfolio.name)
+            self._log_operation("create_portfolio", **ctx)
+            self._get_portfolio_cached.cache_clear()
             return self.portfolio_repository.create(portfolio)
         except Exception as e:
-            self._handle_error("create_portfolio", e, portfolio_id=portfolio.id, name=portfolio.name)
+            self._handle_error("create_portfolio", e, **ctx)
     
     def update_portfolio(self, portfolio: Portfolio) -> Portfolio:
         """Update an existing portfolio.
@@ -126,16 +159,18 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio is not found
             ServiceError: If an error occurs during update
         """
+        ctx = {"portfolio_id": portfolio.id, "name": portfolio.name}
+        
         try:
             # Check if portfolio exists
-            existing_portfolio = self.get_portfolio(portfolio.id)
-            if existing_portfolio is None:
+            if not self.portfolio_repository.exists(portfolio.id):
                 raise DataNotFoundError(f"Portfolio with ID {portfolio.id} not found")
             
-            self._log_operation("update_portfolio", portfolio_id=portfolio.id, name=portfolio.name)
+            self._log_operation("update_portfolio", **ctx)
+            self._get_portfolio_cached.cache_clear()
             return self.portfolio_repository.update(portfolio)
         except Exception as e:
-            self._handle_error("update_portfolio", e, portfolio_id=portfolio.id, name=portfolio.name)
+            self._handle_error("update_portfolio", e, **ctx)
     
     def delete_portfolio(self, portfolio_id: str) -> bool:
         """Delete a portfolio.
@@ -149,11 +184,14 @@ class PortfolioService(BaseService):
         Raises:
             ServiceError: If an error occurs during deletion
         """
+        ctx = {"portfolio_id": portfolio_id}
+        
         try:
-            self._log_operation("delete_portfolio", portfolio_id=portfolio_id)
+            self._log_operation("delete_portfolio", **ctx)
+            self._get_portfolio_cached.cache_clear()
             return self.portfolio_repository.delete(portfolio_id)
         except Exception as e:
-            self._handle_error("delete_portfolio", e, portfolio_id=portfolio_id)
+            self._handle_error("delete_portfolio", e, **ctx)
     
     def add_position(self, portfolio_id: str, position: Position) -> Portfolio:
         """Add or update a position in a portfolio.
@@ -169,27 +207,22 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio or stock is not found
             ServiceError: If an error occurs during the operation
         """
+        ctx = {
+            "portfolio_id": portfolio_id,
+            "symbol": position.symbol,
+            "quantity": position.quantity
+        }
+        
         try:
             # Check if stock exists
-            stock = self.stock_repository.get_by_symbol(position.symbol)
-            if stock is None:
+            if not self._stock_exists_cached(position.symbol):
                 raise DataNotFoundError(f"Stock with symbol {position.symbol} not found")
             
-            self._log_operation(
-                "add_position", 
-                portfolio_id=portfolio_id, 
-                symbol=position.symbol,
-                quantity=position.quantity
-            )
+            self._log_operation("add_position", **ctx)
+            self._get_portfolio_cached.cache_clear()
             return self.portfolio_repository.add_position(portfolio_id, position)
         except Exception as e:
-            self._handle_error(
-                "add_position", 
-                e, 
-                portfolio_id=portfolio_id, 
-                symbol=position.symbol,
-                quantity=position.quantity
-            )
+            self._handle_error("add_position", e, **ctx)
     
     def remove_position(self, portfolio_id: str, symbol: str) -> Portfolio:
         """Remove a position from a portfolio.
@@ -205,11 +238,14 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio or position is not found
             ServiceError: If an error occurs during the operation
         """
+        ctx = {"portfolio_id": portfolio_id, "symbol": symbol}
+        
         try:
-            self._log_operation("remove_position", portfolio_id=portfolio_id, symbol=symbol)
+            self._log_operation("remove_position", **ctx)
+            self._get_portfolio_cached.cache_clear()
             return self.portfolio_repository.remove_position(portfolio_id, symbol)
         except Exception as e:
-            self._handle_error("remove_position", e, portfolio_id=portfolio_id, symbol=symbol)
+            self._handle_error("remove_position", e, **ctx)
     
     def add_transaction(self, portfolio_id: str, transaction: Transaction) -> Portfolio:
         """Add a transaction to a portfolio.
@@ -225,36 +261,115 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio is not found
             ServiceError: If an error occurs during the operation
         """
+        # Ensure transaction has an ID
+        if not transaction.id:
+            transaction.id = uuid.uuid4().hex
+        
+        ctx = {
+            "portfolio_id": portfolio_id,
+            "transaction_id": transaction.id,
+            "transaction_type": transaction.type.value,
+            "symbol": transaction.symbol,
+            "amount": transaction.amount
+        }
+        
         try:
-            # Ensure transaction has an ID
-            if not transaction.id:
-                transaction.id = str(uuid.uuid4())
-            
             # For buy/sell transactions, check if stock exists
-            if transaction.type in [TransactionType.BUY, TransactionType.SELL] and transaction.symbol:
-                stock = self.stock_repository.get_by_symbol(transaction.symbol)
-                if stock is None:
+            if transaction.type in _STOCK_TRANSACTION_TYPES and transaction.symbol:
+                if not self._stock_exists_cached(transaction.symbol):
                     raise DataNotFoundError(f"Stock with symbol {transaction.symbol} not found")
             
-            self._log_operation(
-                "add_transaction", 
-                portfolio_id=portfolio_id, 
-                transaction_id=transaction.id,
-                transaction_type=transaction.type.value,
-                symbol=transaction.symbol,
-                amount=transaction.amount
-            )
+            self._log_operation("add_transaction", **ctx)
+            self._get_portfolio_cached.cache_clear()
             return self.portfolio_repository.add_transaction(portfolio_id, transaction)
         except Exception as e:
-            self._handle_error(
-                "add_transaction", 
-                e, 
-                portfolio_id=portfolio_id, 
-                transaction_id=transaction.id if transaction.id else None,
-                transaction_type=transaction.type.value,
-                symbol=transaction.symbol,
-                amount=transaction.amount
-            )
+            self._handle_error("add_transaction", e, **ctx)
+    
+    def _validate_symbols(self, symbols: Set[str]) -> None:
+        """Check that all symbols refer to existing stocks.
+        
+        Symbols not already known from the existence cache are checked with a
+        single query.
+        
+        Args:
+            symbols: Stock symbols
+            
+        Raises:
+            DataNotFoundError: If any stock is not found
+        """
+        unknown = {symbol for symbol in symbols if not stock_exists_cache.get(symbol)}
+        if not unknown:
+            return
+        
+        found = self.stock_repository.exists_many(unknown)
+        for symbol in found:
+            stock_exists_cache.set(symbol, True, ttl=STOCK_EXISTS_TTL)
+        
+        missing = unknown - found
+        if missing:
+            raise DataNotFoundError(f"Stocks with symbols {', '.join(sorted(missing))} not found")
+    
+    def add_positions(self, portfolio_id: str, positions: List[Position]) -> Portfolio:
+        """Add or update several positions in a portfolio at once.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            positions: Positions to add or update
+            
+        Returns:
+            Updated Portfolio domain entity
+            
+        Raises:
+            DataNotFoundError: If the portfolio or any stock is not found
+            ServiceError: If an error occurs during the operation
+        """
+        ctx = {"portfolio_id": portfolio_id, "position_count": len(positions)}
+        
+        try:
+            # Check all stocks exist
+            self._validate_symbols({position.symbol for position in positions})
+            
+            self._log_operation("add_positions", **ctx)
+            self._get_portfolio_cached.cache_clear()
+            return self.portfolio_repository.add_positions_bulk(portfolio_id, positions)
+        except Exception as e:
+            self._handle_error("add_positions", e, **ctx)
+    
+    def add_transactions(self, portfolio_id: str, transactions: List[Transaction]) -> Portfolio:
+        """Add several transactions to a portfolio at once.
+        
+        Transactions are applied in order within a single database transaction.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            transactions: Transactions to add
+            
+        Returns:
+            Updated Portfolio domain entity
+            
+        Raises:
+            DataNotFoundError: If the portfolio or any stock is not found
+            ServiceError: If an error occurs during the operation
+        """
+        ctx = {"portfolio_id": portfolio_id, "transaction_count": len(transactions)}
+        
+        try:
+            # Ensure transactions have IDs
+            for transaction in transactions:
+                if not transaction.id:
+                    transaction.id = uuid.uuid4().hex
+            
+            # For buy/sell transactions, check all stocks exist
+            self._validate_symbols({
+                transaction.symbol for transaction in transactions
+                if transaction.type in _STOCK_TRANSACTION_TYPES and transaction.symbol
+            })
+            
+            self._log_operation("add_transactions", **ctx)
+            self._get_portfolio_cached.cache_clear()
+            return self.portfolio_repository.add_transactions_bulk(portfolio_id, transactions)
+        except Exception as e:
+            self._handle_error("add_transactions", e, **ctx)
     
     def get_transactions(self, portfolio_id: str, limit: int = 50, offset: int = 0) -> List[Transaction]:
         """Get transactions for a portfolio.
@@ -271,11 +386,34 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio is not found
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"portfolio_id": portfolio_id, "limit": limit, "offset": offset}
+        
         try:
-            self._log_operation("get_transactions", portfolio_id=portfolio_id, limit=limit, offset=offset)
+            self._log_operation("get_transactions", **ctx)
             return self.portfolio_repository.get_transactions(portfolio_id, limit, offset)
         except Exception as e:
-            self._handle_error("get_transactions", e, portfolio_id=portfolio_id, limit=limit, offset=offset)
+            self._handle_error("get_transactions", e, **ctx)
+    
+    def iter_transactions(self, portfolio_id: str, since: Optional[datetime] = None) -> Iterator[Transaction]:
+        """Stream all transactions for a portfolio without loading them into a list.
+        
+        Args:
+            portfolio_id: Portfolio ID
+            since: Only include transactions on or after this date
+            
+        Yields:
+            Transaction domain entities for the specified portfolio, oldest first
+            
+        Raises:
+            ServiceError: If an error occurs during retrieval
+        """
+        ctx = {"portfolio_id": portfolio_id, "since": since.isoformat() if since else None}
+        
+        try:
+            self._log_operation("iter_transactions", **ctx)
+            yield from self.portfolio_repository.iter_transactions(portfolio_id, since)
+        except Exception as e:
+            self._handle_error("iter_transactions", e, **ctx)
     
     def get_positions(self, portfolio_id: str) -> Dict[str, Position]:
         """Get positions for a portfolio.
@@ -290,11 +428,33 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio is not found
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"portfolio_id": portfolio_id}
+        
         try:
-            self._log_operation("get_positions", portfolio_id=portfolio_id)
+            if self.logger.isEnabledFor(logging.INFO):
+                self._log_operation("get_positions", **ctx)
             return self.portfolio_repository.get_positions(portfolio_id)
         except Exception as e:
-            self._handle_error("get_positions", e, portfolio_id=portfolio_id)
+            self._handle_error("get_positions", e, **ctx)
+    
+    @staticmethod
+    def _value_from(portfolio: Portfolio, quantities: Dict[str, float],
+                    latest_prices: Dict[str, StockPrice]) -> float:
+        """Calculate the value of already loaded portfolio data.
+        
+        Args:
+            portfolio: Portfolio domain entity
+            quantities: Dictionary of position quantities keyed by symbol
+            latest_prices: Dictionary of latest prices keyed by symbol
+            
+        Returns:
+            Cash balance plus the value of each priced position
+        """
+        return portfolio.cash_balance + sum(
+            quantity * latest_prices[symbol].close
+            for symbol, quantity in quantities.items()
+            if symbol in latest_prices
+        )
     
     def calculate_portfolio_value(self, portfolio_id: str) -> float:
         """Calculate the current value of a portfolio.
@@ -309,28 +469,24 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio is not found
             ServiceError: If an error occurs during calculation
         """
+        ctx = {"portfolio_id": portfolio_id}
+        
         try:
             # Get portfolio
             portfolio = self.get_portfolio_or_raise(portfolio_id)
             
-            # Get positions
-            positions = self.get_positions(portfolio_id)
+            # Get open position quantities (the rest of each position is not needed)
+            quantities = self.portfolio_repository.get_position_quantities(portfolio_id)
             
-            # Start with cash balance
-            total_value = portfolio.cash_balance
+            # Get latest prices for all positions in one query
+            latest_prices = self.stock_repository.get_latest_prices(list(quantities))
             
-            # Add value of each position
-            for symbol, position in positions.items():
-                # Get latest price
-                latest_price = self.stock_repository.get_latest_price(symbol)
-                if latest_price:
-                    position_value = position.quantity * latest_price.close
-                    total_value += position_value
+            total_value = self._value_from(portfolio, quantities, latest_prices)
             
-            self._log_operation("calculate_portfolio_value", portfolio_id=portfolio_id, value=total_value)
+            self._log_operation("calculate_portfolio_value", value=total_value, **ctx)
             return total_value
         except Exception as e:
-            self._handle_error("calculate_portfolio_value", e, portfolio_id=portfolio_id)
+            self._handle_error("calculate_portfolio_value", e, **ctx)
     
     def calculate_portfolio_performance(self, portfolio_id: str, days: int = 30) -> Dict[str, Any]:
         """Calculate the performance of a portfolio over a period.
@@ -346,29 +502,27 @@ class PortfolioService(BaseService):
             DataNotFoundError: If the portfolio is not found
             ServiceError: If an error occurs during calculation
         """
+        ctx = {"portfolio_id": portfolio_id, "days": days}
+        
         try:
             # Get portfolio
             portfolio = self.get_portfolio_or_raise(portfolio_id)
             
-            # Get positions
-            positions = self.get_positions(portfolio_id)
+            # Get open position quantities (the rest of each position is not needed)
+            quantities = self.portfolio_repository.get_position_quantities(portfolio_id)
             
-            # Calculate current value
-            current_value = self.calculate_portfolio_value(portfolio_id)
+            # Calculate current value from the already loaded portfolio and quantities
+            latest_prices = self.stock_repository.get_latest_prices(list(quantities))
+            current_value = self._value_from(portfolio, quantities, latest_prices)
             
-            # Get transactions within the period
+            # Get the start of the period
             end_date = datetime.now()
-            start_date = end_date - datetime.timedelta(days=days)
-            
-            # Get all transactions
-            transactions = self.get_transactions(portfolio_id)
+            start_date = end_date - timedelta(days=days)
             
-            # Filter transactions by date
-            period_transactions = [tx for tx in transactions if tx.date >= start_date]
-            
-            # Calculate deposits and withdrawals during the period
-            deposits = sum(tx.amount for tx in period_transactions if tx.type == TransactionType.DEPOSIT)
-            withdrawals = sum(tx.amount for tx in period_transactions if tx.type == TransactionType.WITHDRAWAL)
+            # Summarize deposits and withdrawals during the period in the database
+            deposits, withdrawals, has_older_transactions = (
+                self.portfolio_repository.get_period_cashflow_summary(portfolio_id, start_date)
+            )
             
             # Calculate net flow
             net_flow = deposits - withdrawals
@@ -379,7 +533,7 @@ class PortfolioService(BaseService):
             performance = {}
             
             # If we have transactions older than the period, we can calculate performance
-            if any(tx.date < start_date for tx in transactions):
+            if has_older_transactions:
                 # Calculate value at the start of the period
                 # This is a placeholder for a more sophisticated calculation
                 # In a real application, you would need historical prices and positions
@@ -394,12 +548,12 @@ class PortfolioService(BaseService):
             performance["current_value"] = current_value
             performance["cash_balance"] = portfolio.cash_balance
             performance["position_value"] = current_value - portfolio.cash_balance
-            performance["position_count"] = len(positions)
+            performance["position_count"] = len(quantities)
             performance["period_days"] = days
             performance["period_deposits"] = deposits
             performance["period_withdrawals"] = withdrawals
             
-            self._log_operation("calculate_portfolio_performance", portfolio_id=portfolio_id, days=days)
+            self._log_operation("calculate_portfolio_performance", **ctx)
             return performance
         except Exception as e:
-            self._handle_error("calculate_portfolio_performance", e, portfolio_id=portfolio_id, days=days)
+            self._handle_error("calculate_portfolio_performance", e, **ctx)
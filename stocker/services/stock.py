@@ -4,14 +4,25 @@ This module provides a service implementation for stock-related business logic,
 coordinating between domain models and repositories.
 """
 
+import asyncio
+import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 
+import pandas as pd
+
 from stocker.core.exceptions import ServiceError, DataNotFoundError
 from stocker.domain.stock import Stock, StockPrice, StockData, Exchange, Sector
+from stocker.infrastructure.cache.memory_cache import MemoryCache
 from stocker.infrastructure.database.repositories.stock import StockRepository
 from stocker.services.base import BaseService
 
+# Symbols known to exist, shared across requests since stock metadata rarely
+# changes; delete_stock drops the symbol so other services stop accepting it
+STOCK_EXISTS_TTL = 300
+stock_exists_cache: MemoryCache[bool] = MemoryCache(max_size=4096)
+
 
 class StockService(BaseService):
     """Service for stock-related business logic.
@@ -28,6 +39,9 @@ class StockService(BaseService):
         """
         super().__init__()
         self.stock_repository = stock_repository or StockRepository()
+        
+        # Memoize lookups for the lifetime of the service (typically one request)
+        self._get_stock_cached = lru_cache(maxsize=128)(self.stock_repository.get_by_symbol)
     
     def get_stock(self, symbol: str, include_prices: bool = False) -> Optional[Stock]:
         """Get a stock by symbol.
@@ -42,11 +56,14 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"symbol": symbol, "include_prices": include_prices}
+        
         try:
-            self._log_operation("get_stock", symbol=symbol, include_prices=include_prices)
-            return self.stock_repository.get_by_symbol(symbol, include_prices)
+            if self.logger.isEnabledFor(logging.INFO):
+                self._log_operation("get_stock", **ctx)
+            return self._get_stock_cached(symbol, include_prices)
         except Exception as e:
-            self._handle_error("get_stock", e, symbol=symbol, include_prices=include_prices)
+            self._handle_error("get_stock", e, **ctx)
     
     def get_stock_or_raise(self, symbol: str, include_prices: bool = False) -> Stock:
         """Get a stock by symbol or raise an exception if not found.
@@ -79,11 +96,14 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during creation
         """
+        ctx = {"symbol": stock.symbol, "name": stock.name}
+        
         try:
-            self._log_operation("create_stock", symbol=stock.symbol, name=stock.name)
+            self._log_operation("create_stock", **ctx)
+            self._get_stock_cached.cache_clear()
             return self.stock_repository.create(stock)
         except Exception as e:
-            self._handle_error("create_stock", e, symbol=stock.symbol, name=stock.name)
+            self._handle_error("create_stock", e, **ctx)
     
     def update_stock(self, stock: Stock) -> Stock:
         """Update an existing stock.
@@ -98,16 +118,18 @@ class StockService(BaseService):
             DataNotFoundError: If the stock is not found
             ServiceError: If an error occurs during update
         """
+        ctx = {"symbol": stock.symbol, "name": stock.name}
+        
         try:
             # Check if stock exists
-            existing_stock = self.get_stock(stock.symbol)
-            if existing_stock is None:
+            if not self.stock_repository.exists(stock.symbol):
                 raise DataNotFoundError(f"Stock with symbol {stock.symbol} not found")
             
-            self._log_operation("update_stock", symbol=stock.symbol, name=stock.name)
+            self._log_operation("update_stock", **ctx)
+            self._get_stock_cached.cache_clear()
             return self.stock_repository.update(stock)
         except Exception as e:
-            self._handle_error("update_stock", e, symbol=stock.symbol, name=stock.name)
+            self._handle_error("update_stock", e, **ctx)
     
     def delete_stock(self, symbol: str) -> bool:
         """Delete a stock.
@@ -121,11 +143,16 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during deletion
         """
+        ctx = {"symbol": symbol}
+        
         try:
-            self._log_operation("delete_stock", symbol=symbol)
-            return self.stock_repository.delete(symbol)
+            self._log_operation("delete_stock", **ctx)
+            self._get_stock_cached.cache_clear()
+            deleted = self.stock_repository.delete(symbol)
+            stock_exists_cache.delete(symbol)
+            return deleted
         except Exception as e:
-            self._handle_error("delete_stock", e, symbol=symbol)
+            self._handle_error("delete_stock", e, **ctx)
     
     def search_stocks(self, query: str, limit: int = 10, offset: int = 0) -> List[Stock]:
         """Search for stocks by symbol or name.
@@ -141,11 +168,13 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during search
         """
+        ctx = {"query": query, "limit": limit, "offset": offset}
+        
         try:
-            self._log_operation("search_stocks", query=query, limit=limit, offset=offset)
+            self._log_operation("search_stocks", **ctx)
             return self.stock_repository.search_stocks(query, limit, offset)
         except Exception as e:
-            self._handle_error("search_stocks", e, query=query, limit=limit, offset=offset)
+            self._handle_error("search_stocks", e, **ctx)
     
     def get_stocks_by_exchange(self, exchange: Exchange, limit: int = 100, offset: int = 0) -> List[Stock]:
         """Get stocks by exchange.
@@ -161,11 +190,13 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"exchange": exchange.value, "limit": limit, "offset": offset}
+        
         try:
-            self._log_operation("get_stocks_by_exchange", exchange=exchange.value, limit=limit, offset=offset)
+            self._log_operation("get_stocks_by_exchange", **ctx)
             return self.stock_repository.get_stocks_by_exchange(exchange, limit, offset)
         except Exception as e:
-            self._handle_error("get_stocks_by_exchange", e, exchange=exchange.value, limit=limit, offset=offset)
+            self._handle_error("get_stocks_by_exchange", e, **ctx)
     
     def get_stocks_by_sector(self, sector: Sector, limit: int = 100, offset: int = 0) -> List[Stock]:
         """Get stocks by sector.
@@ -181,11 +212,53 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"sector": sector.value, "limit": limit, "offset": offset}
+        
         try:
-            self._log_operation("get_stocks_by_sector", sector=sector.value, limit=limit, offset=offset)
+            self._log_operation("get_stocks_by_sector", **ctx)
             return self.stock_repository.get_stocks_by_sector(sector, limit, offset)
         except Exception as e:
-            self._handle_error("get_stocks_by_sector", e, sector=sector.value, limit=limit, offset=offset)
+            self._handle_error("get_stocks_by_sector", e, **ctx)
+    
+    def count_stocks_by_exchange(self, exchange: Exchange) -> int:
+        """Count stocks by exchange without loading them.
+        
+        Args:
+            exchange: Exchange to filter by
+            
+        Returns:
+            Number of stocks in the specified exchange
+            
+        Raises:
+            ServiceError: If an error occurs during counting
+        """
+        ctx = {"exchange": exchange.value}
+        
+        try:
+            self._log_operation("count_stocks_by_exchange", **ctx)
+            return self.stock_repository.count_stocks_by_exchange(exchange)
+        except Exception as e:
+            self._handle_error("count_stocks_by_exchange", e, **ctx)
+    
+    def count_stocks_by_sector(self, sector: Sector) -> int:
+        """Count stocks by sector without loading them.
+        
+        Args:
+            sector: Sector to filter by
+            
+        Returns:
+            Number of stocks in the specified sector
+            
+        Raises:
+            ServiceError: If an error occurs during counting
+        """
+        ctx = {"sector": sector.value}
+        
+        try:
+            self._log_operation("count_stocks_by_sector", **ctx)
+            return self.stock_repository.count_stocks_by_sector(sector)
+        except Exception as e:
+            self._handle_error("count_stocks_by_sector", e, **ctx)
     
     def add_price_data(self, symbol: str, prices: List[StockPrice]) -> bool:
         """Add price data for a stock.
@@ -201,11 +274,14 @@ class StockService(BaseService):
             DataNotFoundError: If the stock is not found
             ServiceError: If an error occurs during the operation
         """
+        ctx = {"symbol": symbol, "price_count": len(prices)}
+        
         try:
-            self._log_operation("add_price_data", symbol=symbol, price_count=len(prices))
+            self._log_operation("add_price_data", **ctx)
+            self._get_stock_cached.cache_clear()
             return self.stock_repository.add_price_data(symbol, prices)
         except Exception as e:
-            self._handle_error("add_price_data", e, symbol=symbol, price_count=len(prices))
+            self._handle_error("add_price_data", e, **ctx)
     
     def get_price_data(self, symbol: str, start_date: Optional[datetime] = None, 
                       end_date: Optional[datetime] = None, limit: int = 100) -> List[StockPrice]:
@@ -224,24 +300,46 @@ class StockService(BaseService):
             DataNotFoundError: If the stock is not found
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {
+            "symbol": symbol,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "limit": limit
+        }
+        
         try:
-            self._log_operation(
-                "get_price_data", 
-                symbol=symbol, 
-                start_date=start_date.isoformat() if start_date else None,
-                end_date=end_date.isoformat() if end_date else None,
-                limit=limit
-            )
+            self._log_operation("get_price_data", **ctx)
             return self.stock_repository.get_price_data(symbol, start_date, end_date, limit)
         except Exception as e:
-            self._handle_error(
-                "get_price_data", 
-                e, 
-                symbol=symbol, 
-                start_date=start_date.isoformat() if start_date else None,
-                end_date=end_date.isoformat() if end_date else None,
-                limit=limit
-            )
+            self._handle_error("get_price_data", e, **ctx)
+    
+    def get_price_frame(self, symbol: str, start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Get price data for a stock as a DataFrame for numeric analysis.
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Start date for price data
+            end_date: End date for price data
+            
+        Returns:
+            DataFrame indexed by date with the same columns as StockData.dataframe
+            
+        Raises:
+            DataNotFoundError: If the stock is not found
+            ServiceError: If an error occurs during retrieval
+        """
+        ctx = {
+            "symbol": symbol,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None
+        }
+        
+        try:
+            self._log_operation("get_price_frame", **ctx)
+            return self.stock_repository.get_price_frame(symbol, start_date, end_date)
+        except Exception as e:
+            self._handle_error("get_price_frame", e, **ctx)
     
     def get_latest_price(self, symbol: str) -> Optional[StockPrice]:
         """Get the latest price for a stock.
@@ -255,11 +353,14 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"symbol": symbol}
+        
         try:
-            self._log_operation("get_latest_price", symbol=symbol)
+            if self.logger.isEnabledFor(logging.INFO):
+                self._log_operation("get_latest_price", **ctx)
             return self.stock_repository.get_latest_price(symbol)
         except Exception as e:
-            self._handle_error("get_latest_price", e, symbol=symbol)
+            self._handle_error("get_latest_price", e, **ctx)
     
     def get_top_gainers(self, limit: int = 10) -> List[Tuple[Stock, float]]:
         """Get the top gaining stocks for the day.
@@ -273,11 +374,13 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"limit": limit}
+        
         try:
-            self._log_operation("get_top_gainers", limit=limit)
+            self._log_operation("get_top_gainers", **ctx)
             return self.stock_repository.get_top_gainers(limit)
         except Exception as e:
-            self._handle_error("get_top_gainers", e, limit=limit)
+            self._handle_error("get_top_gainers", e, **ctx)
     
     def get_top_losers(self, limit: int = 10) -> List[Tuple[Stock, float]]:
         """Get the top losing stocks for the day.
@@ -291,11 +394,36 @@ class StockService(BaseService):
         Raises:
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"limit": limit}
+        
         try:
-            self._log_operation("get_top_losers", limit=limit)
+            self._log_operation("get_top_losers", **ctx)
             return self.stock_repository.get_top_losers(limit)
         except Exception as e:
-            self._handle_error("get_top_losers", e, limit=limit)
+            self._handle_error("get_top_losers", e, **ctx)
+    
+    async def get_top_movers(self, limit: int = 10) -> Dict[str, List[Tuple[Stock, float]]]:
+        """Get the top gaining and losing stocks for the day concurrently.
+        
+        The two queries are independent, so they run in worker threads to
+        overlap their database round-trips.
+        
+        Args:
+            limit: Maximum number of stocks to return for each list
+            
+        Returns:
+            Dictionary with "gainers" and "losers" lists of tuples containing
+            Stock domain entities and their percentage change
+            
+        Raises:
+            ServiceError: If an error occurs during retrieval
+        """
+        gainers, losers = await asyncio.gather(
+            asyncio.to_thread(self.get_top_gainers, limit),
+            asyncio.to_thread(self.get_top_losers, limit)
+        )
+        
+        return {"gainers": gainers, "losers": losers}
     
     def get_stock_data(self, symbol: str, timeframe: str = "1d", 
                       start_date: Optional[datetime] = None,
@@ -320,6 +448,8 @@ class StockService(BaseService):
             DataNotFoundError: If the stock is not found
             ServiceError: If an error occurs during retrieval
         """
+        ctx = {"symbol": symbol, "timeframe": timeframe}
+        
         try:
             # Get stock information
             stock = self.get_stock_or_raise(symbol)
@@ -328,12 +458,7 @@ class StockService(BaseService):
             prices = self.get_price_data(symbol, start_date, end_date, limit)
             
             # Create and return stock data
-            self._log_operation(
-                "get_stock_data", 
-                symbol=symbol, 
-                timeframe=timeframe,
-                price_count=len(prices)
-            )
+            self._log_operation("get_stock_data", price_count=len(prices), **ctx)
             
             return StockData(
                 symbol=symbol,
@@ -344,9 +469,8 @@ class StockService(BaseService):
             self._handle_error(
                 "get_stock_data", 
                 e, 
-                symbol=symbol, 
-                timeframe=timeframe,
                 start_date=start_date.isoformat() if start_date else None,
                 end_date=end_date.isoformat() if end_date else None,
-                limit=limit
+                limit=limit,
+                **ctx
             )
@@ -4,17 +4,67 @@ This module provides a service implementation for strategy-related business logi
 coordinating between domain models and repositories.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Union
+from functools import partial
+import hashlib
+import json
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any, Union
 import uuid
 
 from stocker.core.exceptions import ServiceError, DataNotFoundError
 from stocker.domain.strategy import Strategy, StrategyType, StrategyParameters, Signal, SignalType
 from stocker.domain.stock import Stock, StockPrice, StockData
+from stocker.infrastructure.cache.memory_cache import MemoryCache
+from stocker.infrastructure.database.repositories.base import encode_cursor
 from stocker.infrastructure.database.repositories.strategy import StrategyRepository
 from stocker.infrastructure.database.repositories.stock import StockRepository
 from stocker.services.base import BaseService
 
+# Strategies shared across requests, refreshed at least once a minute
+_STRATEGY_CACHE_TTL = 60
+_strategy_cache: MemoryCache[Strategy] = MemoryCache(max_size=1024)
+
+# Signal IDs produced by recent strategy runs, keyed by run inputs
+_RUN_CACHE_TTL = 300
+_run_cache: MemoryCache[List[str]] = MemoryCache(max_size=1024)
+
+# Upper bound on threads used to run a strategy across symbols
+_MAX_STRATEGY_WORKERS = 32
+
+# Strategy types whose signals are generated independently per symbol
+_PER_SYMBOL_STRATEGY_TYPES = frozenset({StrategyType.MOMENTUM, StrategyType.MEAN_REVERSION})
+
+# Signal pages fetched ahead of the client, served once and kept briefly.
+# Invalidation bumps the generation so a fetch still in flight can't store
+# a page read before the signals changed.
+_PREFETCH_TTL = 30
+_prefetch_cache: MemoryCache[List[Signal]] = MemoryCache(max_size=256)
+_prefetch_lock = threading.Lock()
+_prefetch_generation = 0
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_slots = threading.BoundedSemaphore(8)
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Get the prefetch thread pool, creating it on first use."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        with _prefetch_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="signal-prefetch")
+    return _prefetch_executor
+
+
+def _invalidate_prefetched_pages() -> None:
+    """Drop prefetched signal pages, including those still being fetched."""
+    global _prefetch_generation
+    with _prefetch_lock:
+        _prefetch_generation += 1
+        _prefetch_cache.clear()
+
 
 class StrategyService(BaseService):
     """Service for strategy-related business logic.
@@ -49,7 +99,17 @@ class StrategyService(BaseService):
         """
         try:
             self._log_operation("get_strategy", strategy_id=strategy_id)
-            return self.strategy_repository.get_by_id(strategy_id)
+            
+            # The cache keeps its own copy, so edits by callers never reach it
+            strategy = _strategy_cache.get(strategy_id)
+            if strategy is None:
+                strategy = self.strategy_repository.get_by_id(strategy_id)
+                if strategy is not None:
+                    _strategy_cache.set(strategy_id, deepcopy(strategy), ttl=_STRATEGY_CACHE_TTL)
+            else:
+                strategy = deepcopy(strategy)
+            
+            return strategy
         except Exception as e:
             self._handle_error("get_strategy", e, strategy_id=strategy_id)
     
@@ -71,13 +131,15 @@ class StrategyService(BaseService):
             raise DataNotFoundError(f"Strategy with ID {strategy_id} not found")
         return strategy
     
-    def get_strategies_by_owner(self, owner_id: str, limit: int = 10, offset: int = 0) -> List[Strategy]:
+    def get_strategies_by_owner(self, owner_id: str, limit: int = 10, offset: int = 0,
+                                cursor: Optional[str] = None) -> List[Strategy]:
         """Get strategies by owner ID.
         
         Args:
             owner_id: Owner user ID
             limit: Maximum number of strategies to return
-            offset: Number of strategies to skip
+            offset: Number of strategies to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last strategy of the previous page
             
         Returns:
             List of Strategy domain entities owned by the specified user
@@ -86,18 +148,20 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_strategies_by_owner", owner_id=owner_id, limit=limit, offset=offset)
-            return self.strategy_repository.get_by_owner(owner_id, limit, offset)
+            self._log_operation("get_strategies_by_owner", owner_id=owner_id, limit=limit, offset=offset, cursor=cursor)
+            return self.strategy_repository.get_by_owner(owner_id, limit, offset, cursor)
         except Exception as e:
-            self._handle_error("get_strategies_by_owner", e, owner_id=owner_id, limit=limit, offset=offset)
+            self._handle_error("get_strategies_by_owner", e, owner_id=owner_id, limit=limit, offset=offset, cursor=cursor)
     
-    def get_strategies_by_type(self, strategy_type: StrategyType, limit: int = 10, offset: int = 0) -> List[Strategy]:
+    def get_strategies_by_type(self, strategy_type: StrategyType, limit: int = 10, offset: int = 0,
+                               cursor: Optional[str] = None) -> List[Strategy]:
         """Get strategies by type.
         
         Args:
             strategy_type: Strategy type to filter by
             limit: Maximum number of strategies to return
-            offset: Number of strategies to skip
+            offset: Number of strategies to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last strategy of the previous page
             
         Returns:
             List of Strategy domain entities of the specified type
@@ -106,17 +170,19 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_strategies_by_type", strategy_type=strategy_type.value, limit=limit, offset=offset)
-            return self.strategy_repository.get_by_type(strategy_type, limit, offset)
+            self._log_operation("get_strategies_by_type", strategy_type=strategy_type.value, limit=limit, offset=offset, cursor=cursor)
+            return self.strategy_repository.get_by_type(strategy_type, limit, offset, cursor)
         except Exception as e:
-            self._handle_error("get_strategies_by_type", e, strategy_type=strategy_type.value, limit=limit, offset=offset)
+            self._handle_error("get_strategies_by_type", e, strategy_type=strategy_type.value, limit=limit, offset=offset, cursor=cursor)
     
-    def get_active_strategies(self, limit: int = 10, offset: int = 0) -> List[Strategy]:
+    def get_active_strategies(self, limit: int = 10, offset: int = 0,
+                              cursor: Optional[str] = None) -> List[Strategy]:
         """Get active strategies.
         
         Args:
             limit: Maximum number of strategies to return
-            offset: Number of strategies to skip
+            offset: Number of strategies to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last strategy of the previous page
             
         Returns:
             List of active Strategy domain entities
@@ -125,10 +191,10 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_active_strategies", limit=limit, offset=offset)
-            return self.strategy_repository.get_active_strategies(limit, offset)
+            self._log_operation("get_active_strategies", limit=limit, offset=offset, cursor=cursor)
+            return self.strategy_repository.get_active_strategies(limit, offset, cursor)
         except Exception as e:
-            self._handle_error("get_active_strategies", e, limit=limit, offset=offset)
+            self._handle_error("get_active_strategies", e, limit=limit, offset=offset, cursor=cursor)
     
     def create_strategy(self, strategy: Strategy) -> Strategy:
         """Create a new strategy.
@@ -145,13 +211,14 @@ class StrategyService(BaseService):
         try:
             # Ensure strategy has an ID
             if not strategy.id:
-                strategy.id = str(uuid.uuid4())
+                strategy.id = uuid.uuid4().hex
             
-            # Set created_at and updated_at if not set
+            # Set created_at and updated_at if not set, from one timestamp
+            now = datetime.now()
             if not strategy.created_at:
-                strategy.created_at = datetime.now()
+                strategy.created_at = now
             if not strategy.updated_at:
-                strategy.updated_at = datetime.now()
+                strategy.updated_at = now
             
             self._log_operation("create_strategy", strategy_id=strategy.id, name=strategy.name, type=strategy.type.value)
             return self.strategy_repository.create(strategy)
@@ -172,16 +239,16 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during update
         """
         try:
-            # Check if strategy exists
-            existing_strategy = self.get_strategy(strategy.id)
-            if existing_strategy is None:
-                raise DataNotFoundError(f"Strategy with ID {strategy.id} not found")
-            
             # Update updated_at timestamp
             strategy.updated_at = datetime.now()
             
             self._log_operation("update_strategy", strategy_id=strategy.id, name=strategy.name, type=strategy.type.value)
-            return self.strategy_repository.update(strategy)
+            
+            # The repository raises DataNotFoundError when no row matches
+            updated_strategy = self.strategy_repository.update(strategy)
+            _strategy_cache.delete(strategy.id)
+            _run_cache.clear()
+            return updated_strategy
         except Exception as e:
             self._handle_error("update_strategy", e, strategy_id=strategy.id, name=strategy.name, type=strategy.type.value)
     
@@ -199,7 +266,11 @@ class StrategyService(BaseService):
         """
         try:
             self._log_operation("delete_strategy", strategy_id=strategy_id)
-            return self.strategy_repository.delete(strategy_id)
+            deleted = self.strategy_repository.delete(strategy_id)
+            _strategy_cache.delete(strategy_id)
+            _run_cache.clear()
+            _invalidate_prefetched_pages()
+            return deleted
         except Exception as e:
             self._handle_error("delete_strategy", e, strategy_id=strategy_id)
     
@@ -228,7 +299,7 @@ class StrategyService(BaseService):
             
             # Ensure signal has an ID and strategy_id
             if not signal.id:
-                signal.id = str(uuid.uuid4())
+                signal.id = uuid.uuid4().hex
             signal.strategy_id = strategy_id
             
             # Set date if not set
@@ -242,7 +313,9 @@ class StrategyService(BaseService):
                 symbol=signal.symbol,
                 type=signal.type.value
             )
-            return self.strategy_repository.add_signal(strategy_id, signal)
+            saved_signal = self.strategy_repository.add_signal(strategy_id, signal)
+            _invalidate_prefetched_pages()
+            return saved_signal
         except Exception as e:
             self._handle_error(
                 "add_signal", 
@@ -253,13 +326,16 @@ class StrategyService(BaseService):
                 type=signal.type.value
             )
     
-    def get_signals(self, strategy_id: str, limit: int = 50, offset: int = 0) -> List[Signal]:
+    def get_signals(self, strategy_id: str, limit: int = 50, offset: int = 0,
+                    cursor: Optional[str] = None, full_detail: bool = False) -> List[Signal]:
         """Get signals for a strategy.
         
         Args:
             strategy_id: Strategy ID
             limit: Maximum number of signals to return
-            offset: Number of signals to skip
+            offset: Number of signals to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load signal metadata (list columns only by default)
             
         Returns:
             List of Signal domain entities for the specified strategy
@@ -269,18 +345,40 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_signals", strategy_id=strategy_id, limit=limit, offset=offset)
-            return self.strategy_repository.get_signals(strategy_id, limit, offset)
+            self._log_operation("get_signals", strategy_id=strategy_id, limit=limit, offset=offset, cursor=cursor)
+            fetch = partial(self.strategy_repository.get_signals, strategy_id, limit, full_detail=full_detail)
+            return self._get_signal_page("get_signals", (strategy_id, full_detail), fetch, limit, offset, cursor)
+        except Exception as e:
+            self._handle_error("get_signals", e, strategy_id=strategy_id, limit=limit, offset=offset, cursor=cursor)
+    
+    def iter_signals(self, strategy_id: str) -> Iterator[Signal]:
+        """Stream all signals for a strategy without loading them into a list.
+        
+        Args:
+            strategy_id: Strategy ID
+            
+        Yields:
+            Signal domain entities for the specified strategy, oldest first
+            
+        Raises:
+            ServiceError: If an error occurs during retrieval
+        """
+        try:
+            self._log_operation("iter_signals", strategy_id=strategy_id)
+            yield from self.strategy_repository.iter_signals(strategy_id)
         except Exception as e:
-            self._handle_error("get_signals", e, strategy_id=strategy_id, limit=limit, offset=offset)
+            self._handle_error("iter_signals", e, strategy_id=strategy_id)
     
-    def get_signals_by_symbol(self, symbol: str, limit: int = 50, offset: int = 0) -> List[Signal]:
+    def get_signals_by_symbol(self, symbol: str, limit: int = 50, offset: int = 0,
+                              cursor: Optional[str] = None, full_detail: bool = False) -> List[Signal]:
         """Get signals for a specific symbol across all strategies.
         
         Args:
             symbol: Stock symbol
             limit: Maximum number of signals to return
-            offset: Number of signals to skip
+            offset: Number of signals to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load signal metadata (list columns only by default)
             
         Returns:
             List of Signal domain entities for the specified symbol
@@ -289,17 +387,21 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_signals_by_symbol", symbol=symbol, limit=limit, offset=offset)
-            return self.strategy_repository.get_signals_by_symbol(symbol, limit, offset)
+            self._log_operation("get_signals_by_symbol", symbol=symbol, limit=limit, offset=offset, cursor=cursor)
+            fetch = partial(self.strategy_repository.get_signals_by_symbol, symbol, limit, full_detail=full_detail)
+            return self._get_signal_page("get_signals_by_symbol", (symbol, full_detail), fetch, limit, offset, cursor)
         except Exception as e:
-            self._handle_error("get_signals_by_symbol", e, symbol=symbol, limit=limit, offset=offset)
+            self._handle_error("get_signals_by_symbol", e, symbol=symbol, limit=limit, offset=offset, cursor=cursor)
     
-    def get_recent_signals(self, days: int = 7, limit: int = 50) -> List[Signal]:
+    def get_recent_signals(self, days: int = 7, limit: int = 50, cursor: Optional[str] = None,
+                           full_detail: bool = False) -> List[Signal]:
         """Get recent signals across all strategies.
         
         Args:
             days: Number of days to look back
             limit: Maximum number of signals to return
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load signal metadata (list columns only by default)
             
         Returns:
             List of recent Signal domain entities
@@ -308,18 +410,24 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_recent_signals", days=days, limit=limit)
-            return self.strategy_repository.get_recent_signals(days, limit)
+            self._log_operation("get_recent_signals", days=days, limit=limit, cursor=cursor)
+            fetch = lambda offset, cursor: self.strategy_repository.get_recent_signals(
+                days, limit, cursor, full_detail=full_detail
+            )
+            return self._get_signal_page("get_recent_signals", (days, full_detail), fetch, limit, None, cursor)
         except Exception as e:
-            self._handle_error("get_recent_signals", e, days=days, limit=limit)
+            self._handle_error("get_recent_signals", e, days=days, limit=limit, cursor=cursor)
     
-    def get_signals_by_type(self, signal_type: SignalType, limit: int = 50, offset: int = 0) -> List[Signal]:
+    def get_signals_by_type(self, signal_type: SignalType, limit: int = 50, offset: int = 0,
+                            cursor: Optional[str] = None, full_detail: bool = False) -> List[Signal]:
         """Get signals by type across all strategies.
         
         Args:
             signal_type: Signal type to filter by
             limit: Maximum number of signals to return
-            offset: Number of signals to skip
+            offset: Number of signals to skip (ignored when a cursor is given)
+            cursor: Cursor encoding the last signal of the previous page
+            full_detail: Whether to load signal metadata (list columns only by default)
             
         Returns:
             List of Signal domain entities of the specified type
@@ -328,10 +436,91 @@ class StrategyService(BaseService):
             ServiceError: If an error occurs during retrieval
         """
         try:
-            self._log_operation("get_signals_by_type", signal_type=signal_type.value, limit=limit, offset=offset)
-            return self.strategy_repository.get_signals_by_type(signal_type, limit, offset)
+            self._log_operation("get_signals_by_type", signal_type=signal_type.value, limit=limit, offset=offset, cursor=cursor)
+            fetch = partial(self.strategy_repository.get_signals_by_type, signal_type, limit, full_detail=full_detail)
+            return self._get_signal_page(
+                "get_signals_by_type", (signal_type.value, full_detail), fetch, limit, offset, cursor
+            )
         except Exception as e:
-            self._handle_error("get_signals_by_type", e, signal_type=signal_type.value, limit=limit, offset=offset)
+            self._handle_error("get_signals_by_type", e, signal_type=signal_type.value, limit=limit, offset=offset, cursor=cursor)
+    
+    def _get_signal_page(self, operation: str, key_args: Tuple[Any, ...],
+                         fetch: Callable[[Optional[int], Optional[str]], List[Signal]],
+                         limit: int, offset: Optional[int], cursor: Optional[str]) -> List[Signal]:
+        """Return a page of signals and fetch the following page in the background.
+        
+        Args:
+            operation: Name of the paginated operation
+            key_args: Filter arguments identifying the result set
+            fetch: Callable taking (offset, cursor) and returning a page of signals
+            limit: Page size
+            offset: Offset of the page, or None for cursor-only pagination
+            cursor: Cursor encoding the last signal of the previous page
+            
+        Returns:
+            List of Signal domain entities for the requested page
+        """
+        key = self._page_key(operation, key_args, limit, offset, cursor)
+        signals = _prefetch_cache.get(key)
+        if signals is None:
+            signals = fetch(offset, cursor)
+        else:
+            # Serve a prefetched page once so later reads see fresh data
+            _prefetch_cache.delete(key)
+        
+        # A short page is the last one, so there is nothing to prefetch
+        if signals and len(signals) == limit:
+            if cursor is not None or offset is None:
+                next_offset, next_cursor = offset, encode_cursor(signals[-1].date, signals[-1].id)
+            else:
+                next_offset, next_cursor = offset + limit, None
+            next_key = self._page_key(operation, key_args, limit, next_offset, next_cursor)
+            self._prefetch_signal_page(next_key, fetch, next_offset, next_cursor)
+        
+        return signals
+    
+    def _prefetch_signal_page(self, key: str,
+                              fetch: Callable[[Optional[int], Optional[str]], List[Signal]],
+                              offset: Optional[int], cursor: Optional[str]) -> None:
+        """Schedule a page fetch unless it is cached or too many are in flight.
+        
+        Args:
+            key: Cache key of the page
+            fetch: Callable taking (offset, cursor) and returning a page of signals
+            offset: Offset of the page
+            cursor: Cursor of the page
+        """
+        if _prefetch_cache.exists(key) or not _prefetch_slots.acquire(blocking=False):
+            return
+        
+        generation = _prefetch_generation
+        
+        def load() -> None:
+            try:
+                signals = fetch(offset, cursor)
+                
+                # Discard the page if signals changed while it was being read
+                with _prefetch_lock:
+                    if generation == _prefetch_generation:
+                        _prefetch_cache.set(key, signals, ttl=_PREFETCH_TTL)
+            except Exception as e:
+                # Prefetching is best effort; the client fetches the page itself
+                self.logger.debug("Prefetch of signal page %s failed: %s", key, e)
+            finally:
+                _prefetch_slots.release()
+        
+        try:
+            _get_prefetch_executor().submit(load)
+        except Exception as e:
+            # load never runs, so give its slot back here
+            _prefetch_slots.release()
+            self.logger.debug("Prefetch of signal page %s not scheduled: %s", key, e)
+    
+    @staticmethod
+    def _page_key(operation: str, key_args: Tuple[Any, ...], limit: int,
+                  offset: Optional[int], cursor: Optional[str]) -> str:
+        """Build the prefetch cache key for a page of signals."""
+        return json.dumps([operation, key_args, limit, offset, cursor], default=str)
     
     def run_strategy(self, strategy_id: str, symbols: Optional[List[str]] = None, 
                     start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Signal]:
@@ -353,76 +542,53 @@ class StrategyService(BaseService):
         try:
             # Get strategy
             strategy = self.get_strategy_or_raise(strategy_id)
+            params = strategy.parameters
+            
+            # Use symbols from parameters if not provided
+            if symbols is None:
+                symbols = self._parameter_symbols(strategy)
+            
+            # Ensure we have symbols to work with
+            if not symbols:
+                raise ServiceError("No symbols provided for strategy execution")
+            
+            # Reuse the signals of an identical recent run
+            run_key = self._run_cache_key(strategy, symbols, start_date, end_date)
+            cached_signal_ids = _run_cache.get(run_key)
+            if cached_signal_ids is not None:
+                self._log_operation("run_strategy", strategy_id=strategy_id, symbol_count=len(symbols), cached=True)
+                return self.strategy_repository.get_signals_by_ids(cached_signal_ids)
             
             # Set default dates if not provided
             if end_date is None:
                 end_date = datetime.now()
             if start_date is None:
                 # Use lookback period from strategy parameters or default to 30 days
-                lookback_days = 30
-                if hasattr(strategy.parameters, "lookback_period"):
-                    lookback_days = strategy.parameters.lookback_period
+                lookback_days = getattr(params, "lookback_period", 30)
                 start_date = end_date - timedelta(days=lookback_days)
             
-            # Use symbols from parameters if not provided
-            if symbols is None and hasattr(strategy.parameters, "symbols"):
-                symbols = strategy.parameters.symbols
-            
-            # Ensure we have symbols to work with
-            if not symbols:
-                raise ServiceError("No symbols provided for strategy execution")
+            # Get price data for all symbols in one query
+            prices_by_symbol = self._get_prices_by_symbol(symbols, start_date, end_date)
             
-            # Get stock data for each symbol
-            stock_data_dict = {}
-            for symbol in symbols:
-                # Check if stock exists
-                stock = self.stock_repository.get_by_symbol(symbol)
-                if stock is None:
-                    raise DataNotFoundError(f"Stock with symbol {symbol} not found")
-                
-                # Get price data
-                prices = self.stock_repository.get_price_data(symbol, start_date, end_date)
-                
-                # Create stock data
-                stock_data = StockData(
+            stock_data_dict = {
+                symbol: StockData(
                     symbol=symbol,
-                    prices=prices,
+                    prices=prices_by_symbol[symbol],
                     timeframe="1d"  # Default timeframe
                 )
-                
-                stock_data_dict[symbol] = stock_data
-            
-            # Execute strategy based on type
-            signals = []
-            
-            # Import specific strategy execution functions based on type
-            if strategy.type == StrategyType.MOMENTUM:
-                from stocker.domain.strategy.momentum import execute_momentum_strategy
-                signals = execute_momentum_strategy(strategy, stock_data_dict)
-            elif strategy.type == StrategyType.MEAN_REVERSION:
-                from stocker.domain.strategy.mean_reversion import execute_mean_reversion_strategy
-                signals = execute_mean_reversion_strategy(strategy, stock_data_dict)
-            else:
-                # For custom strategies, execute the strategy's run method
-                if hasattr(strategy, "run") and callable(getattr(strategy, "run")):
-                    signals = strategy.run(stock_data_dict)
-                else:
-                    raise ServiceError(f"Strategy type {strategy.type.value} is not supported for execution")
-            
-            # Save signals to database
-            saved_signals = []
-            for signal in signals:
-                # Set strategy ID and ensure signal has an ID
-                signal.strategy_id = strategy_id
-                if not signal.id:
-                    signal.id = str(uuid.uuid4())
-                
-                # Save signal
-                saved_signal = self.strategy_repository.add_signal(strategy_id, signal)
-                saved_signals.append(saved_signal)
+                for symbol in symbols
+            }
+            
+            signals = self._generate_signals(strategy, stock_data_dict)
+            
+            # Save all signals to database at once
+            saved_signals = self.strategy_repository.add_signals_bulk(strategy_id, signals)
+            _invalidate_prefetched_pages()
             
-            # Update strategy performance metrics
-            self.update_strategy_performance(strategy_id)
+            _run_cache.set(run_key, [signal.id for signal in saved_signals], ttl=_RUN_CACHE_TTL)
+            
+            # Update strategy performance metrics for the strategy already loaded
+            self._update_strategy_performance(strategy)
             
             self._log_operation(
                 "run_strategy", 
@@ -439,6 +605,208 @@ class StrategyService(BaseService):
                 symbol_count=len(symbols) if symbols else 0
             )
     
+    def run_strategies(self, strategy_ids: List[str], start_date: Optional[datetime] = None,
+                       end_date: Optional[datetime] = None) -> Dict[str, List[Signal]]:
+        """Run several strategies against price data fetched once for all of them.
+        
+        Each strategy runs on the symbols in its parameters over its own lookback
+        window, as run_strategy would; prices for the union of symbols are read in
+        a single query covering the widest window.
+        
+        Args:
+            strategy_ids: Strategy IDs
+            start_date: Start date for historical data (if None, use each strategy's lookback)
+            end_date: End date for historical data (if None, use current date)
+            
+        Returns:
+            Dictionary of generated Signal domain entities keyed by strategy ID
+            
+        Raises:
+            DataNotFoundError: If any strategy or stock is not found
+            ServiceError: If an error occurs during execution
+        """
+        ctx = {"strategy_count": len(strategy_ids)}
+        
+        try:
+            # Load every strategy in one query
+            strategies = self.strategy_repository.get_by_ids(strategy_ids)
+            missing = [strategy_id for strategy_id in strategy_ids if strategy_id not in strategies]
+            if missing:
+                raise DataNotFoundError(f"Strategies with IDs {', '.join(missing)} not found")
+            
+            results: Dict[str, List[Signal]] = {}
+            pending = []
+            for strategy_id in strategy_ids:
+                strategy = strategies[strategy_id]
+                symbols = self._parameter_symbols(strategy)
+                if not symbols:
+                    raise ServiceError(f"No symbols provided for strategy {strategy_id}")
+                
+                # Reuse the signals of an identical recent run
+                run_key = self._run_cache_key(strategy, symbols, start_date, end_date)
+                cached_signal_ids = _run_cache.get(run_key)
+                if cached_signal_ids is not None:
+                    results[strategy_id] = self.strategy_repository.get_signals_by_ids(cached_signal_ids)
+                else:
+                    pending.append((strategy, symbols, run_key))
+            
+            if pending:
+                run_end = end_date or datetime.now()
+                windows = {
+                    strategy.id: start_date or run_end - timedelta(days=getattr(strategy.parameters, "lookback_period", 30))
+                    for strategy, _, _ in pending
+                }
+                
+                # Fetch prices for the union of symbols over the widest window once
+                all_symbols = sorted({symbol for _, symbols, _ in pending for symbol in symbols})
+                prices_by_symbol = self._get_prices_by_symbol(all_symbols, min(windows.values()), run_end)
+                
+                for strategy, symbols, run_key in pending:
+                    window_start = windows[strategy.id]
+                    stock_data_dict = {
+                        symbol: StockData(
+                            symbol=symbol,
+                            prices=[price for price in prices_by_symbol[symbol] if price.date >= window_start],
+                            timeframe="1d"  # Default timeframe
+                        )
+                        for symbol in symbols
+                    }
+                    
+                    signals = self._generate_signals(strategy, stock_data_dict)
+                    saved_signals = self.strategy_repository.add_signals_bulk(strategy.id, signals)
+                    
+                    _run_cache.set(run_key, [signal.id for signal in saved_signals], ttl=_RUN_CACHE_TTL)
+                    self._update_strategy_performance(strategy)
+                    results[strategy.id] = saved_signals
+                
+                _invalidate_prefetched_pages()
+            
+            self._log_operation(
+                "run_strategies",
+                **ctx,
+                cached_count=len(strategy_ids) - len(pending),
+                signal_count=sum(len(signals) for signals in results.values())
+            )
+            return results
+        except Exception as e:
+            self._handle_error("run_strategies", e, **ctx)
+    
+    def _get_prices_by_symbol(self, symbols: List[str], start_date: datetime,
+                              end_date: datetime) -> Dict[str, List[StockPrice]]:
+        """Check that stocks exist and fetch their prices, one query each.
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            
+        Returns:
+            Dictionary of StockPrice lists keyed by symbol
+            
+        Raises:
+            DataNotFoundError: If any stock is not found
+        """
+        stocks = self.stock_repository.get_by_symbols(symbols)
+        missing = [symbol for symbol in symbols if symbol not in stocks]
+        if missing:
+            raise DataNotFoundError(f"Stocks with symbols {', '.join(missing)} not found")
+        
+        return self.stock_repository.get_price_data_bulk(symbols, start_date, end_date)
+    
+    def _generate_signals(self, strategy: Strategy, stock_data_dict: Dict[str, StockData]) -> List[Signal]:
+        """Execute a strategy and stamp the generated signals with IDs.
+        
+        Args:
+            strategy: Strategy domain entity
+            stock_data_dict: Price data keyed by symbol
+            
+        Returns:
+            List of generated Signal domain entities
+            
+        Raises:
+            ServiceError: If the strategy type cannot be executed
+        """
+        if strategy.type in _PER_SYMBOL_STRATEGY_TYPES:
+            # Symbols are independent, so generate their signals concurrently
+            max_workers = min(_MAX_STRATEGY_WORKERS, len(stock_data_dict))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(partial(self._execute_for_symbol, strategy), stock_data_dict.values())
+                signals = [signal for symbol_signals in results for signal in symbol_signals]
+        else:
+            # For custom strategies, execute the strategy's run method
+            if hasattr(strategy, "run") and callable(getattr(strategy, "run")):
+                signals = strategy.run(stock_data_dict)
+            else:
+                raise ServiceError(f"Strategy type {strategy.type.value} is not supported for execution")
+        
+        # Set strategy ID and ensure each signal has an ID
+        for signal in signals:
+            signal.strategy_id = strategy.id
+            if not signal.id:
+                signal.id = uuid.uuid4().hex
+        
+        return signals
+    
+    @staticmethod
+    def _execute_for_symbol(strategy: Strategy, stock_data: StockData) -> List[Signal]:
+        """Generate a strategy's signals for a single symbol.
+        
+        Args:
+            strategy: Strategy domain entity
+            stock_data: Price data for the symbol
+            
+        Returns:
+            List of generated Signal domain entities for the symbol
+        """
+        # Strategies add indicator columns, so give each run its own frame
+        signals = strategy.generate_signals(stock_data.dataframe.copy())
+        for signal in signals:
+            signal.symbol = stock_data.symbol
+        return signals
+    
+    @staticmethod
+    def _parameter_symbols(strategy: Strategy) -> Optional[List[str]]:
+        """Get the symbols a strategy runs on when none are given.
+        
+        Symbols are not a standard parameter, so StrategyParameters.from_dict
+        keeps them in custom_params.
+        
+        Args:
+            strategy: Strategy domain entity
+            
+        Returns:
+            Stock symbols from the strategy parameters, or None if not set
+        """
+        return strategy.parameters.custom_params.get("symbols")
+    
+    @staticmethod
+    def _run_cache_key(strategy: Strategy, symbols: List[str],
+                       start_date: Optional[datetime], end_date: Optional[datetime]) -> str:
+        """Build the result cache key for a strategy run.
+        
+        Args:
+            strategy: Strategy domain entity
+            symbols: Stock symbols the strategy runs on
+            start_date: Requested start date (None for the default lookback)
+            end_date: Requested end date (None for the current date)
+            
+        Returns:
+            Hex digest identifying the run inputs
+        """
+        run_inputs = json.dumps(
+            [
+                strategy.id,
+                strategy.type.value,
+                strategy.parameters.to_dict(),
+                sorted(symbols),
+                start_date.isoformat() if start_date else None,
+                end_date.isoformat() if end_date else None
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(run_inputs.encode(), digest_size=16).hexdigest()
+    
     def update_strategy_performance(self, strategy_id: str) -> Strategy:
         """Update performance metrics for a strategy.
         
@@ -456,53 +824,55 @@ class StrategyService(BaseService):
             # Get strategy
             strategy = self.get_strategy_or_raise(strategy_id)
             
-            # Get signals
-            signals = self.strategy_repository.get_signals(strategy_id)
-            
-            # Calculate performance metrics
-            metrics = self._calculate_strategy_performance(strategy, signals)
-            
             self._log_operation("update_strategy_performance", strategy_id=strategy_id)
-            return self.strategy_repository.update_strategy_performance(strategy_id, metrics)
+            return self._update_strategy_performance(strategy)
         except Exception as e:
             self._handle_error("update_strategy_performance", e, strategy_id=strategy_id)
     
-    def _calculate_strategy_performance(self, strategy: Strategy, signals: List[Signal]) -> Dict[str, Any]:
+    def _update_strategy_performance(self, strategy: Strategy) -> Strategy:
+        """Update performance metrics for an already loaded strategy.
+        
+        Args:
+            strategy: Strategy domain entity
+            
+        Returns:
+            Updated Strategy domain entity
+        """
+        # Summarize signals in the database
+        signal_stats = self.strategy_repository.compute_signal_stats(strategy.id)
+        
+        # Calculate performance metrics
+        metrics = self._calculate_strategy_performance(strategy, signal_stats)
+        
+        updated_strategy = self.strategy_repository.update_strategy_performance(strategy.id, metrics)
+        _strategy_cache.delete(strategy.id)
+        return updated_strategy
+    
+    def _calculate_strategy_performance(self, strategy: Strategy, signal_stats: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate performance metrics for a strategy.
         
         Args:
             strategy: Strategy domain entity
-            signals: List of signals for the strategy
+            signal_stats: Signal summary from StrategyRepository.compute_signal_stats
             
         Returns:
             Dictionary containing performance metrics
         """
         # This is a simplified implementation
         # In a real application, you would need to calculate more sophisticated metrics
+        type_counts = signal_stats["type_counts"]
+        symbols = signal_stats["symbols"]
+        
+        signal_count = sum(type_counts.values())
+        buy_signals = type_counts.get(SignalType.BUY, 0)
+        sell_signals = type_counts.get(SignalType.SELL, 0)
         
-        # Initialize metrics
-        metrics = {
-            "signal_count": len(signals),
+        return {
+            "signal_count": signal_count,
             "last_run": datetime.now().isoformat(),
-            "symbols": set(),
-            "buy_signals": 0,
-            "sell_signals": 0,
-            "neutral_signals": 0
+            "symbols": symbols,
+            "buy_signals": buy_signals,
+            "sell_signals": sell_signals,
+            "neutral_signals": signal_count - buy_signals - sell_signals,
+            "symbol_count": len(symbols)
         }
-        
-        # Calculate metrics
-        for signal in signals:
-            metrics["symbols"].add(signal.symbol)
-            
-            if signal.type == SignalType.BUY:
-                metrics["buy_signals"] += 1
-            elif signal.type == SignalType.SELL:
-                metrics["sell_signals"] += 1
-            else:
-                metrics["neutral_signals"] += 1
-        
-        # Convert set to list for JSON serialization
-        metrics["symbols"] = list(metrics["symbols"])
-        metrics["symbol_count"] = len(metrics["symbols"])
-        
-        return metrics
@@ -4,15 +4,50 @@ This module provides a service implementation for user-related business logic,
 coordinating between domain models and repositories.
 """
 
+import asyncio
+import hashlib
+from copy import deepcopy
+from dataclasses import replace
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 import uuid
 
 from stocker.core.exceptions import ServiceError, DataNotFoundError, AuthenticationError
+from stocker.core.utils.passwords import hash_password, needs_rehash, verify_password
 from stocker.domain.user import User, UserRole, UserStatus, UserPreferences
-from stocker.infrastructure.database.repositories.user import UserRepository
+from stocker.infrastructure.cache.memory_cache import MemoryCache
+from stocker.infrastructure.database.models.user import UserModel
+from stocker.infrastructure.database.repositories.user import (
+    SELECT_USER_BY_EMAIL,
+    SELECT_USER_BY_USERNAME,
+    UserRepository
+)
+from stocker.infrastructure.database.session import get_session
 from stocker.services.base import BaseService
 
+# Short-lived cache of API key hash -> user ID for clients polling with an API key
+_API_KEY_CACHE_TTL = 30
+_api_key_cache: MemoryCache[str] = MemoryCache(max_size=4096)
+
+# Users shared across requests by ID, plus username/email -> user ID lookups
+_USER_CACHE_TTL = 30
+_user_cache: MemoryCache[User] = MemoryCache(max_size=10000)
+_user_id_cache: MemoryCache[str] = MemoryCache(max_size=20000)
+
+# User attributes written by update_user; roles are managed through add/remove_role
+_USER_UPDATE_FIELDS = ("username", "email", "first_name", "last_name", "status", "preferences")
+
+
+def _cache_user(user: User) -> None:
+    """Store a private copy of a user in the shared user cache."""
+    _user_cache.set(user.id, deepcopy(user), ttl=_USER_CACHE_TTL)
+
+
+def _get_cached_user(user_id: str) -> Optional[User]:
+    """Get a copy of a cached user that callers are free to modify."""
+    user = _user_cache.get(user_id)
+    return deepcopy(user) if user is not None else None
+
 
 class UserService(BaseService):
     """Service for user-related business logic.
@@ -44,7 +79,7 @@ class UserService(BaseService):
         """
         try:
             self._log_operation("get_user", user_id=user_id)
-            return self.user_repository.get_by_id(user_id)
+            return self._get_user_cached(user_id)
         except Exception as e:
             self._handle_error("get_user", e, user_id=user_id)
     
@@ -80,7 +115,7 @@ class UserService(BaseService):
         """
         try:
             self._log_operation("get_user_by_username", username=username)
-            return self.user_repository.get_by_username(username)
+            return self._get_user_by_key("username", username, self.user_repository.get_by_username)
         except Exception as e:
             self._handle_error("get_user_by_username", e, username=username)
     
@@ -98,10 +133,86 @@ class UserService(BaseService):
         """
         try:
             self._log_operation("get_user_by_email", email=email)
-            return self.user_repository.get_by_email(email)
+            return self._get_user_by_key("email", email, self.user_repository.get_by_email)
         except Exception as e:
             self._handle_error("get_user_by_email", e, email=email)
     
+    def get_user_by_api_key(self, api_key: str) -> Optional[User]:
+        """Get a user by API key.
+        
+        Keys are looked up by their SHA-256 digest; the owning user ID is
+        cached briefly so polling clients skip the hash lookup.
+        
+        Args:
+            api_key: API key
+            
+        Returns:
+            User domain entity if found, None otherwise
+            
+        Raises:
+            ServiceError: If an error occurs during retrieval
+        """
+        try:
+            # Don't log the API key itself
+            self._log_operation("get_user_by_api_key")
+            api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+            
+            user_id = _api_key_cache.get(api_key_hash)
+            if user_id is None:
+                user_id = self.user_repository.get_id_by_api_key_hash(api_key_hash)
+                if user_id is None:
+                    return None
+                _api_key_cache.set(api_key_hash, user_id, ttl=_API_KEY_CACHE_TTL)
+            
+            return self._get_user_cached(user_id)
+        except Exception as e:
+            self._handle_error("get_user_by_api_key", e)
+    
+    def _get_user_cached(self, user_id: str) -> Optional[User]:
+        """Get a user by ID through the shared user cache.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            User domain entity if found, None otherwise
+        """
+        user = _get_cached_user(user_id)
+        if user is None:
+            user = self.user_repository.get_by_id(user_id)
+            # Don't cache misses so newly created users are found
+            if user is not None:
+                _cache_user(user)
+        return user
+    
+    def _get_user_by_key(self, field: str, value: str, loader) -> Optional[User]:
+        """Get a user by a unique field through the shared user caches.
+        
+        The field is mapped to a user ID, so invalidating the ID entry is enough
+        after a write; a mapping whose user no longer matches is discarded.
+        
+        Args:
+            field: Name of the unique field ("username" or "email")
+            value: Field value to look up
+            loader: Repository method loading a user by the field
+            
+        Returns:
+            User domain entity if found, None otherwise
+        """
+        key = f"{field}:{value}"
+        user_id = _user_id_cache.get(key)
+        if user_id is not None:
+            user = self._get_user_cached(user_id)
+            if user is not None and getattr(user, field) == value:
+                return user
+            _user_id_cache.delete(key)
+        
+        user = loader(value)
+        if user is not None:
+            _cache_user(user)
+            _user_id_cache.set(key, user.id, ttl=_USER_CACHE_TTL)
+        return user
+    
     def create_user(self, user: User, password: str) -> User:
         """Create a new user.
         
@@ -117,13 +228,7 @@ class UserService(BaseService):
         """
         try:
             # Check if username or email already exists
-            existing_username = self.user_repository.get_by_username(user.username)
-            if existing_username:
-                raise ServiceError(f"Username '{user.username}' is already taken")
-            
-            existing_email = self.user_repository.get_by_email(user.email)
-            if existing_email:
-                raise ServiceError(f"Email '{user.email}' is already registered")
+            self._check_conflicts(user.username, user.email)
             
             # Ensure user has an ID
             if not user.id:
@@ -138,23 +243,23 @@ class UserService(BaseService):
                 user.created_at = datetime.now()
             
             # Create user model
-            from stocker.infrastructure.database.models.user import UserModel
             user_model = UserModel.from_domain(user)
             
             # Set password hash
-            from werkzeug.security import generate_password_hash
-            user_model.password_hash = generate_password_hash(password)
+            user_model.password_hash = hash_password(password)
             
             # Save to database using direct session access
             # This is a special case because we need to handle the password hash
-            from stocker.infrastructure.database.session import get_session
             with get_session() as session:
                 session.add(user_model)
+                
+                # Convert while still pending; ID and timestamps are set client-side,
+                # so there is nothing to read back after the INSERT
+                created_user = user_model.to_domain()
                 session.commit()
-                session.refresh(user_model)
             
             self._log_operation("create_user", user_id=user.id, username=user.username)
-            return user_model.to_domain()
+            return created_user
         except Exception as e:
             self._handle_error("create_user", e, username=user.username, email=user.email)
     
@@ -172,28 +277,59 @@ class UserService(BaseService):
             ServiceError: If an error occurs during update
         """
         try:
+            # Get the stored user, from the cache when possible
+            existing_user = self._get_user_cached(user.id)
+            
             # Check if user exists
-            existing_user = self.get_user(user.id)
             if existing_user is None:
                 raise DataNotFoundError(f"User with ID {user.id} not found")
             
-            # Check if username is being changed and if it's already taken
-            if user.username != existing_user.username:
-                username_check = self.user_repository.get_by_username(user.username)
-                if username_check and username_check.id != user.id:
-                    raise ServiceError(f"Username '{user.username}' is already taken")
-            
-            # Check if email is being changed and if it's already registered
-            if user.email != existing_user.email:
-                email_check = self.user_repository.get_by_email(user.email)
-                if email_check and email_check.id != user.id:
-                    raise ServiceError(f"Email '{user.email}' is already registered")
+            # Nothing to write for an idempotent update
+            changed = {
+                name: getattr(user, name)
+                for name in _USER_UPDATE_FIELDS
+                if getattr(user, name) != getattr(existing_user, name)
+            }
+            if not changed:
+                return existing_user
+            
+            # Check that a changed username or email is not already in use
+            self._check_conflicts(
+                changed.get("username"),
+                changed.get("email"),
+                exclude_id=user.id
+            )
             
             self._log_operation("update_user", user_id=user.id, username=user.username)
-            return self.user_repository.update(user)
+            self.user_repository.update_fields(user.id, **changed)
+            
+            # Keep the cached copy in step with the written columns
+            updated_user = replace(existing_user, **changed)
+            _cache_user(updated_user)
+            return updated_user
         except Exception as e:
             self._handle_error("update_user", e, user_id=user.id, username=user.username)
     
+    def _check_conflicts(self, username: Optional[str], email: Optional[str],
+                         exclude_id: Optional[str] = None) -> None:
+        """Check that a username and email are free with one query.
+        
+        Args:
+            username: Username to check (None to skip)
+            email: Email to check (None to skip)
+            exclude_id: ID of a user to ignore, e.g. the user being updated
+            
+        Raises:
+            ServiceError: If the username or email is already in use
+        """
+        username_taken, email_taken = self.user_repository.check_taken(username, email, exclude_id)
+        
+        if username_taken:
+            raise ServiceError(f"Username '{username}' is already taken")
+        
+        if email_taken:
+            raise ServiceError(f"Email '{email}' is already registered")
+    
     def delete_user(self, user_id: str) -> bool:
         """Delete a user.
         
@@ -208,7 +344,9 @@ class UserService(BaseService):
         """
         try:
             self._log_operation("delete_user", user_id=user_id)
-            return self.user_repository.delete(user_id)
+            deleted = self.user_repository.delete(user_id)
+            _user_cache.delete(user_id)
+            return deleted
         except Exception as e:
             self._handle_error("delete_user", e, user_id=user_id)
     
@@ -268,7 +406,9 @@ class UserService(BaseService):
         """
         try:
             self._log_operation("add_role_to_user", user_id=user_id, role=role.value)
-            return self.user_repository.add_role_to_user(user_id, role)
+            updated_user = self.user_repository.add_role_to_user(user_id, role)
+            _user_cache.delete(user_id)
+            return updated_user
         except Exception as e:
             self._handle_error("add_role_to_user", e, user_id=user_id, role=role.value)
     
@@ -288,7 +428,9 @@ class UserService(BaseService):
         """
         try:
             self._log_operation("remove_role_from_user", user_id=user_id, role=role.value)
-            return self.user_repository.remove_role_from_user(user_id, role)
+            updated_user = self.user_repository.remove_role_from_user(user_id, role)
+            _user_cache.delete(user_id)
+            return updated_user
         except Exception as e:
             self._handle_error("remove_role_from_user", e, user_id=user_id, role=role.value)
     
@@ -307,42 +449,40 @@ class UserService(BaseService):
             ServiceError: If an error occurs during authentication
         """
         try:
-            # Check if input is an email
-            is_email = "@" in username_or_email
-            
-            # Get user by username or email
-            user = None
-            if is_email:
-                user = self.user_repository.get_by_email(username_or_email)
+            # Match on email or username depending on the input
+            if "@" in username_or_email:
+                query, params = SELECT_USER_BY_EMAIL, {"email": username_or_email}
             else:
-                user = self.user_repository.get_by_username(username_or_email)
-            
-            # Check if user exists
-            if user is None:
-                raise AuthenticationError("Invalid username/email or password")
-            
-            # Check if user is active
-            if user.status != UserStatus.ACTIVE:
-                raise AuthenticationError(f"User account is {user.status.value}")
+                query, params = SELECT_USER_BY_USERNAME, {"username": username_or_email}
             
-            # Get user model to check password
-            from stocker.infrastructure.database.models.user import UserModel
-            from stocker.infrastructure.database.session import get_session
+            # Load the row once to check the password and record the login
             with get_session() as session:
-                user_model = session.query(UserModel).filter_by(id=user.id).first()
+                user_model = session.execute(query, params).scalar_one_or_none()
+                
+                # Check if user exists
+                if user_model is None:
+                    raise AuthenticationError("Invalid username/email or password")
+                
+                # Check if user is active; status is stored as the enum value
+                if user_model.status and user_model.status != UserStatus.ACTIVE.value:
+                    raise AuthenticationError(f"User account is {user_model.status}")
                 
                 # Check password
-                from werkzeug.security import check_password_hash
-                if not check_password_hash(user_model.password_hash, password):
+                if not verify_password(password, user_model.password_hash):
                     raise AuthenticationError("Invalid username/email or password")
                 
-                # Update last login time
+                # Upgrade legacy or outdated hashes while the password is at hand
+                if needs_rehash(user_model.password_hash):
+                    user_model.password_hash = hash_password(password)
+                
+                # Update last login time; stored naive like every other timestamp
                 user_model.last_login = datetime.now()
+                authenticated_user = user_model.to_domain()
                 session.commit()
-                session.refresh(user_model)
-                
-                # Return updated user
-                return user_model.to_domain()
+            
+            # Refresh the cached copy of the user
+            _cache_user(authenticated_user)
+            return authenticated_user
         except AuthenticationError:
             # Don't log sensitive details for authentication errors
             self._log_operation("authenticate_user", success=False)
@@ -350,6 +490,25 @@ class UserService(BaseService):
         except Exception as e:
             self._handle_error("authenticate_user", e)
     
+    async def authenticate_user_async(self, username_or_email: str, password: str) -> User:
+        """Authenticate a user without blocking the event loop.
+        
+        The bcrypt check and database round-trips run in a worker thread, so an
+        async request handler can keep serving other requests meanwhile.
+        
+        Args:
+            username_or_email: Username or email address
+            password: User password
+            
+        Returns:
+            Authenticated User domain entity
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            ServiceError: If an error occurs during authentication
+        """
+        return await asyncio.to_thread(self.authenticate_user, username_or_email, password)
+    
     def change_password(self, user_id: str, current_password: str, new_password: str) -> bool:
         """Change a user's password.
         
@@ -368,24 +527,23 @@ class UserService(BaseService):
         """
         try:
             # Get user model
-            from stocker.infrastructure.database.models.user import UserModel
-            from stocker.infrastructure.database.session import get_session
             with get_session() as session:
-                user_model = session.query(UserModel).filter_by(id=user_id).first()
+                user_model = session.get(UserModel, user_id)
                 
                 # Check if user exists
                 if user_model is None:
                     raise DataNotFoundError(f"User with ID {user_id} not found")
                 
                 # Check current password
-                from werkzeug.security import check_password_hash, generate_password_hash
-                if not check_password_hash(user_model.password_hash, current_password):
+                if not verify_password(current_password, user_model.password_hash):
                     raise AuthenticationError("Current password is incorrect")
                 
                 # Update password
-                user_model.password_hash = generate_password_hash(new_password)
+                user_model.password_hash = hash_password(new_password)
                 session.commit()
             
+            _user_cache.delete(user_id)
+            
             self._log_operation("change_password", user_id=user_id, success=True)
             return True
         except (DataNotFoundError, AuthenticationError):
@@ -395,6 +553,24 @@ class UserService(BaseService):
         except Exception as e:
             self._handle_error("change_password", e, user_id=user_id)
     
+    async def change_password_async(self, user_id: str, current_password: str, new_password: str) -> bool:
+        """Change a user's password without blocking the event loop.
+        
+        Args:
+            user_id: User ID
+            current_password: Current password
+            new_password: New password
+            
+        Returns:
+            True if the password was changed successfully
+            
+        Raises:
+            DataNotFoundError: If the user is not found
+            AuthenticationError: If the current password is incorrect
+            ServiceError: If an error occurs during the operation
+        """
+        return await asyncio.to_thread(self.change_password, user_id, current_password, new_password)
+    
     def update_user_preferences(self, user_id: str, preferences: UserPreferences) -> User:
         """Update a user's preferences.
         
@@ -410,14 +586,17 @@ class UserService(BaseService):
             ServiceError: If an error occurs during the operation
         """
         try:
-            # Get user
-            user = self.get_user_or_raise(user_id)
+            # Update only the preferences column
+            self._log_operation("update_user_preferences", user_id=user_id)
+            self.user_repository.update_preferences(user_id, preferences)
             
-            # Update preferences
-            user.preferences = preferences
+            # Patch a cached copy rather than reloading the user
+            cached_user = _get_cached_user(user_id)
+            if cached_user is None:
+                return self.get_user_or_raise(user_id)
             
-            # Save user
-            self._log_operation("update_user_preferences", user_id=user_id)
-            return self.user_repository.update(user)
+            updated_user = replace(cached_user, preferences=preferences)
+            _cache_user(updated_user)
+            return updated_user
         except Exception as e:
             self._handle_error("update_user_preferences", e, user_id=user_id)
@@ -8,8 +8,9 @@ import pytest
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from stocker.infrastructure.database.session import Base, get_session
 from stocker.infrastructure.database.models import (
@@ -24,8 +25,22 @@ def test_db_engine():
     Returns:
         SQLAlchemy engine for testing
     """
-    # Use in-memory SQLite database for testing
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    # Use in-memory SQLite database for testing, shared by every session
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _begin_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
     
     # Create all tables
     Base.metadata.create_all(engine)
@@ -43,16 +58,22 @@ def test_db_session(test_db_engine) -> Generator[Session, None, None]:
     Yields:
         SQLAlchemy session for testing
     """
-    # Create a new session for each test
-    TestSessionLocal = sessionmaker(bind=test_db_engine)
-    session = TestSessionLocal()
+    # Run each test inside an outer transaction; commits in the test only
+    # release a savepoint, so rolling back the outer transaction undoes them
+    connection = test_db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
     
     try:
         yield session
     finally:
-        # Roll back transaction after each test
-        session.rollback()
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -79,8 +100,9 @@ def mock_get_session(test_db_session, monkeypatch):
         _mock_get_session
     )
     
-    # Also patch the repositories to use the test session
-    monkeypatch.setattr(
-        "stocker.infrastructure.database.repositories.base.get_session",
-        _mock_get_session
-    )
+    # Also patch the repositories, which import get_session by name
+    for module in ("base", "stock", "user", "portfolio", "strategy"):
+        monkeypatch.setattr(
+            f"stocker.infrastructure.database.repositories.{module}.get_session",
+            _mock_get_session
+        )
@@ -6,10 +6,29 @@ This module contains tests for the StockModel and StockPriceModel classes.
 import pytest
 from datetime import datetime, timedelta
 
+from sqlalchemy import insert
+
 from stocker.domain.stock import Stock, StockPrice, StockData, Exchange, Sector
 from stocker.infrastructure.database.models.stock import StockModel, StockPriceModel
 
 
+@pytest.fixture(scope="module")
+def apple_kwargs():
+    """Column values for an AAPL StockModel, shared by the model tests."""
+    return {
+        "symbol": "AAPL",
+        "name": "Apple Inc.",
+        "exchange": Exchange.NASDAQ.value,
+        "sector": Sector.TECHNOLOGY.value,
+        "industry": "Consumer Electronics",
+        "market_cap": 2500000000000.0,
+        "pe_ratio": 30.5,
+        "dividend_yield": 0.5,
+        "beta": 1.2,
+        "description": "Apple Inc. designs, manufactures, and markets smartphones."
+    }
+
+
 class TestStockModel:
     """Tests for the StockModel class."""
     
@@ -44,24 +63,43 @@ class TestStockModel:
         assert model.beta == 1.2
         assert model.description == "Apple Inc. designs, manufactures, and markets smartphones."
     
-    def test_to_domain(self):
-        """Test converting a model to a domain entity."""
+    @pytest.mark.parametrize("include_prices", [False, True])
+    def test_to_domain(self, apple_kwargs, test_db_session, include_prices):
+        """Test converting a model to a domain entity, with and without price data."""
         # Create a model
-        model = StockModel(
-            symbol="AAPL",
-            name="Apple Inc.",
-            exchange=Exchange.NASDAQ.value,
-            sector=Sector.TECHNOLOGY.value,
-            industry="Consumer Electronics",
-            market_cap=2500000000000.0,
-            pe_ratio=30.5,
-            dividend_yield=0.5,
-            beta=1.2,
-            description="Apple Inc. designs, manufactures, and markets smartphones."
-        )
+        model = StockModel(**apple_kwargs)
+        
+        if include_prices:
+            # Save the stock, then add price data in one bulk insert
+            test_db_session.add(model)
+            test_db_session.flush()
+            
+            today = datetime.now().date()
+            test_db_session.execute(insert(StockPriceModel), [
+                dict(
+                    symbol="AAPL",
+                    date=datetime.combine(today - timedelta(days=1), datetime.min.time()),
+                    open=150.0,
+                    high=155.0,
+                    low=149.0,
+                    close=153.0,
+                    volume=1000000,
+                    adjusted_close=153.0
+                ),
+                dict(
+                    symbol="AAPL",
+                    date=datetime.combine(today, datetime.min.time()),
+                    open=153.0,
+                    high=160.0,
+                    low=152.0,
+                    close=158.0,
+                    volume=1200000,
+                    adjusted_close=158.0
+                )
+            ])
         
         # Convert to domain entity
-        stock = model.to_domain()
+        stock = model.to_domain(include_prices=include_prices)
         
         # Verify domain entity attributes
         assert stock.symbol == "AAPL"
@@ -74,57 +112,15 @@ class TestStockModel:
         assert stock.dividend_yield == 0.5
         assert stock.beta == 1.2
         assert stock.description == "Apple Inc. designs, manufactures, and markets smartphones."
-    
-    def test_to_domain_with_prices(self, test_db_session):
-        """Test converting a model to a domain entity with price data."""
-        # Create a model with price data
-        model = StockModel(
-            symbol="AAPL",
-            name="Apple Inc.",
-            exchange=Exchange.NASDAQ.value,
-            sector=Sector.TECHNOLOGY.value,
-            industry="Consumer Electronics"
-        )
         
-        # Add price data
-        today = datetime.now().date()
-        price1 = StockPriceModel(
-            symbol="AAPL",
-            date=datetime.combine(today - timedelta(days=1), datetime.min.time()),
-            open=150.0,
-            high=155.0,
-            low=149.0,
-            close=153.0,
-            volume=1000000,
-            adjusted_close=153.0
-        )
-        price2 = StockPriceModel(
-            symbol="AAPL",
-            date=datetime.combine(today, datetime.min.time()),
-            open=153.0,
-            high=160.0,
-            low=152.0,
-            close=158.0,
-            volume=1200000,
-            adjusted_close=158.0
-        )
-        
-        model.prices = [price1, price2]
-        
-        # Save to database
-        test_db_session.add(model)
-        test_db_session.commit()
-        
-        # Convert to domain entity with prices
-        stock = model.to_domain(include_prices=True)
-        
-        # Verify domain entity attributes
-        assert stock.symbol == "AAPL"
-        assert stock.name == "Apple Inc."
-        assert stock.data is not None
-        assert len(stock.data.prices) == 2
-        assert stock.data.prices[0].close == 153.0
-        assert stock.data.prices[1].close == 158.0
+        # Verify price data is only included on request
+        if include_prices:
+            assert stock.data is not None
+            assert len(stock.data.prices) == 2
+            assert stock.data.prices[0].close == 153.0
+            assert stock.data.prices[1].close == 158.0
+        else:
+            assert stock.data is None
     
     def test_to_domain_with_missing_fields(self):
         """Test converting a model with missing fields to a domain entity."""
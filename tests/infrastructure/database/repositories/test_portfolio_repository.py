@@ -0,0 +1,35 @@
+"""Tests for the portfolio repository.
+
+This module contains tests for the PortfolioRepository class.
+"""
+
+from stocker.infrastructure.database.models.portfolio import PortfolioModel, PositionModel
+from stocker.infrastructure.database.repositories.portfolio import PortfolioRepository
+
+
+class TestPortfolioRepository:
+    """Tests for the PortfolioRepository class."""
+    
+    def test_get_position_quantities_skips_closed_positions(self, mock_get_session, test_db_session):
+        """Test that closed positions are left out of the position quantities."""
+        # Add a portfolio with one open and one closed position
+        test_db_session.add(PortfolioModel(id="portfolio-id", name="Test Portfolio", cash_balance=10000.0))
+        test_db_session.add_all([
+            PositionModel(portfolio_id="portfolio-id", symbol="AAPL", quantity=10.0, cost_basis=150.0),
+            PositionModel(portfolio_id="portfolio-id", symbol="MSFT", quantity=0.0, cost_basis=250.0)
+        ])
+        test_db_session.commit()
+        
+        # Create repository
+        repo = PortfolioRepository()
+        
+        # Verify only the open position is returned
+        assert repo.get_position_quantities("portfolio-id") == {"AAPL": 10.0}
+    
+    def test_get_position_quantities_empty(self, mock_get_session, test_db_session):
+        """Test getting position quantities for a portfolio without positions."""
+        # Create repository
+        repo = PortfolioRepository()
+        
+        # Verify nothing is returned
+        assert repo.get_position_quantities("missing-id") == {}
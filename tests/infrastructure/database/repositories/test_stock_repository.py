@@ -7,15 +7,16 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+from sqlalchemy import event
+
 from stocker.core.exceptions import DataError, DataNotFoundError
 from stocker.domain.stock import Stock, StockPrice, StockData, Exchange, Sector
 from stocker.infrastructure.database.models.stock import StockModel, StockPriceModel
 from stocker.infrastructure.database.repositories.stock import StockRepository
 
 
-@pytest.fixture
-def sample_stock():
-    """Create a sample stock for testing."""
+def _make_sample_stock() -> Stock:
+    """Build the AAPL stock used throughout these tests."""
     return Stock(
         symbol="AAPL",
         name="Apple Inc.",
@@ -31,10 +32,32 @@ def sample_stock():
 
 
 @pytest.fixture
+def sample_stock():
+    """Create a sample stock for testing."""
+    return _make_sample_stock()
+
+
+@pytest.fixture(scope="session")
+def sample_stock_model_kwargs():
+    """Column values of the sample stock's model, converted once per session.
+    
+    Build a fresh model per test with StockModel(**sample_stock_model_kwargs).
+    """
+    model = StockModel.from_domain(_make_sample_stock())
+    
+    # Only the attributes from_domain set, without SQLAlchemy's instance state
+    return {key: value for key, value in vars(model).items() if not key.startswith("_")}
+
+
+@pytest.fixture(scope="session")
 def sample_stock_prices():
-    """Create sample stock prices for testing."""
+    """Create sample stock prices for testing, once per test session.
+    
+    The prices end on the day the session started, since top movers are ranked
+    relative to the current date. A tuple keeps tests from mutating the shared data.
+    """
     today = datetime.now().date()
-    return [
+    return (
         StockPrice(
             date=datetime.combine(today - timedelta(days=2), datetime.min.time()),
             open=150.0,
@@ -62,7 +85,7 @@ def sample_stock_prices():
             volume=1500000,
             adjusted_close=163.0
         )
-    ]
+    )
 
 
 class TestStockRepository:
@@ -86,13 +109,13 @@ class TestStockRepository:
         assert db_stock.symbol == "AAPL"
         assert db_stock.name == "Apple Inc."
     
-    def test_get_by_id(self, mock_get_session, test_db_session, sample_stock):
+    def test_get_by_id(self, mock_get_session, test_db_session, sample_stock_model_kwargs):
         """Test getting a stock by ID (symbol)."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         test_db_session.commit()
         
@@ -104,13 +127,13 @@ class TestStockRepository:
         assert stock.symbol == "AAPL"
         assert stock.name == "Apple Inc."
     
-    def test_get_by_symbol(self, mock_get_session, test_db_session, sample_stock):
+    def test_get_by_symbol(self, mock_get_session, test_db_session, sample_stock_model_kwargs):
         """Test getting a stock by symbol."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         test_db_session.commit()
         
@@ -122,19 +145,19 @@ class TestStockRepository:
         assert stock.symbol == "AAPL"
         assert stock.name == "Apple Inc."
     
-    def test_get_by_symbol_with_prices(self, mock_get_session, test_db_session, sample_stock, sample_stock_prices):
+    def test_get_by_symbol_with_prices(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
         """Test getting a stock by symbol with price data."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         
         # Add price data
-        for price in sample_stock_prices:
-            price_model = StockPriceModel.from_domain(price, "AAPL")
-            test_db_session.add(price_model)
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
         
         test_db_session.commit()
         
@@ -148,24 +171,65 @@ class TestStockRepository:
         assert stock.data is not None
         assert len(stock.data.prices) == 3
     
-    def test_get_by_symbol_not_found(self, mock_get_session):
-        """Test getting a non-existent stock by symbol."""
+    def test_get_by_symbol_with_prices_query_count(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
+        """Test that loading a stock with prices does not query per price."""
         # Create repository
         repo = StockRepository()
         
-        # Get non-existent stock
-        stock = repo.get_by_symbol("NONEXISTENT")
+        # Add stock and price data to database
+        test_db_session.add(StockModel(**sample_stock_model_kwargs))
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
+        test_db_session.commit()
+        test_db_session.expunge_all()
+        
+        # Count SELECTs sent to the database, ignoring savepoint handling
+        statements = []
+        
+        def _record_statement(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        
+        event.listen(test_db_session.bind, "before_cursor_execute", _record_statement)
+        try:
+            stock = repo.get_by_symbol("AAPL", include_prices=True)
+        finally:
+            event.remove(test_db_session.bind, "before_cursor_execute", _record_statement)
+        
+        # One query for the stock and one for all of its prices
+        assert len(stock.data.prices) == 3
+        assert len(statements) == 2
+    
+    @pytest.mark.parametrize(
+        "method, args, expected, exc",
+        [
+            ("get_by_symbol", ("NONEXISTENT",), None, None),
+            ("delete", ("NONEXISTENT",), False, None),
+            ("get_price_data", ("NONEXISTENT",), None, DataNotFoundError),
+            ("add_price_data", ("NONEXISTENT", []), None, DataNotFoundError),
+        ],
+        ids=["get_by_symbol", "delete", "get_price_data", "add_price_data"]
+    )
+    def test_stock_not_found(self, mock_get_session, method, args, expected, exc):
+        """Test repository methods called for a non-existent stock."""
+        # Create repository
+        repo = StockRepository()
         
-        # Verify stock was not found
-        assert stock is None
+        # Verify the method reports the missing stock
+        if exc is not None:
+            with pytest.raises(exc):
+                getattr(repo, method)(*args)
+        else:
+            assert getattr(repo, method)(*args) is expected
     
-    def test_update(self, mock_get_session, test_db_session, sample_stock):
+    def test_update(self, mock_get_session, test_db_session, sample_stock, sample_stock_model_kwargs):
         """Test updating a stock."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         test_db_session.commit()
         
@@ -184,13 +248,13 @@ class TestStockRepository:
         assert db_stock.name == "Apple Inc. Updated"
         assert db_stock.market_cap == 3000000000000.0
     
-    def test_delete(self, mock_get_session, test_db_session, sample_stock):
+    def test_delete(self, mock_get_session, test_db_session, sample_stock_model_kwargs):
         """Test deleting a stock."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         test_db_session.commit()
         
@@ -204,17 +268,6 @@ class TestStockRepository:
         db_stock = test_db_session.get(StockModel, "AAPL")
         assert db_stock is None
     
-    def test_delete_not_found(self, mock_get_session):
-        """Test deleting a non-existent stock."""
-        # Create repository
-        repo = StockRepository()
-        
-        # Delete non-existent stock
-        result = repo.delete("NONEXISTENT")
-        
-        # Verify deletion failed
-        assert result is False
-    
     def test_get_stocks_by_exchange(self, mock_get_session, test_db_session):
         """Test getting stocks by exchange."""
         # Create repository
@@ -237,7 +290,7 @@ class TestStockRepository:
             exchange=Exchange.NYSE.value
         )
         
-        test_db_session.add_all([nasdaq_stock1, nasdaq_stock2, nyse_stock])
+        test_db_session.bulk_save_objects([nasdaq_stock1, nasdaq_stock2, nyse_stock])
         test_db_session.commit()
         
         # Get stocks by exchange
@@ -251,6 +304,10 @@ class TestStockRepository:
         
         assert len(nyse_stocks) == 1
         assert nyse_stocks[0].symbol == "IBM"
+        
+        # Verify counts match without loading the stocks
+        assert repo.count_stocks_by_exchange(Exchange.NASDAQ) == 2
+        assert repo.count_stocks_by_exchange(Exchange.NYSE) == 1
     
     def test_get_stocks_by_sector(self, mock_get_session, test_db_session):
         """Test getting stocks by sector."""
@@ -274,7 +331,7 @@ class TestStockRepository:
             sector=Sector.FINANCIAL.value
         )
         
-        test_db_session.add_all([tech_stock1, tech_stock2, finance_stock])
+        test_db_session.bulk_save_objects([tech_stock1, tech_stock2, finance_stock])
         test_db_session.commit()
         
         # Get stocks by sector
@@ -308,7 +365,7 @@ class TestStockRepository:
             name="Alphabet Inc."
         )
         
-        test_db_session.add_all([stock1, stock2, stock3])
+        test_db_session.bulk_save_objects([stock1, stock2, stock3])
         test_db_session.commit()
         
         # Search for stocks
@@ -326,13 +383,13 @@ class TestStockRepository:
         # Should find both Apple and Alphabet
         assert len(a_stocks) >= 2
     
-    def test_add_price_data(self, mock_get_session, test_db_session, sample_stock, sample_stock_prices):
+    def test_add_price_data(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
         """Test adding price data for a stock."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         test_db_session.commit()
         
@@ -346,28 +403,19 @@ class TestStockRepository:
         price_models = test_db_session.query(StockPriceModel).filter_by(symbol="AAPL").all()
         assert len(price_models) == 3
     
-    def test_add_price_data_stock_not_found(self, mock_get_session, sample_stock_prices):
-        """Test adding price data for a non-existent stock."""
-        # Create repository
-        repo = StockRepository()
-        
-        # Add price data for non-existent stock
-        with pytest.raises(DataNotFoundError):
-            repo.add_price_data("NONEXISTENT", sample_stock_prices)
-    
-    def test_get_price_data(self, mock_get_session, test_db_session, sample_stock, sample_stock_prices):
+    def test_get_price_data(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
         """Test getting price data for a stock."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         
         # Add price data
-        for price in sample_stock_prices:
-            price_model = StockPriceModel.from_domain(price, "AAPL")
-            test_db_session.add(price_model)
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
         
         test_db_session.commit()
         
@@ -377,39 +425,57 @@ class TestStockRepository:
         # Verify price data was retrieved
         assert len(prices) == 3
         
-        # Get price data with date range
-        today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
+        # Get price data from the second sample day onwards
         prices = repo.get_price_data(
             "AAPL",
-            start_date=datetime.combine(yesterday, datetime.min.time())
+            start_date=sample_stock_prices[1].date
         )
         
         # Verify filtered price data was retrieved
         assert len(prices) == 2
     
-    def test_get_price_data_stock_not_found(self, mock_get_session):
-        """Test getting price data for a non-existent stock."""
+    def test_get_price_frame(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
+        """Test getting price data for a stock as a DataFrame."""
         # Create repository
         repo = StockRepository()
         
-        # Get price data for non-existent stock
+        # Add stock to database
+        model = StockModel(**sample_stock_model_kwargs)
+        test_db_session.add(model)
+        
+        # Add price data
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
+        
+        test_db_session.commit()
+        
+        # Get price frame
+        df = repo.get_price_frame("AAPL")
+        
+        # Verify the frame matches the StockData layout
+        expected = StockData(symbol="AAPL", prices=sample_stock_prices).dataframe
+        assert list(df.columns) == list(expected.columns)
+        assert list(df.index) == list(expected.index)
+        assert df["close"].tolist() == [153.0, 158.0, 163.0]
+        
+        # Unknown stocks are reported as not found
         with pytest.raises(DataNotFoundError):
-            repo.get_price_data("NONEXISTENT")
+            repo.get_price_frame("NONEXISTENT")
     
-    def test_get_latest_price(self, mock_get_session, test_db_session, sample_stock, sample_stock_prices):
+    def test_get_latest_price(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
         """Test getting the latest price for a stock."""
         # Create repository
         repo = StockRepository()
         
         # Add stock to database
-        model = StockModel.from_domain(sample_stock)
+        model = StockModel(**sample_stock_model_kwargs)
         test_db_session.add(model)
         
         # Add price data
-        for price in sample_stock_prices:
-            price_model = StockPriceModel.from_domain(price, "AAPL")
-            test_db_session.add(price_model)
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
         
         test_db_session.commit()
         
@@ -419,3 +485,102 @@ class TestStockRepository:
         # Verify latest price was retrieved
         assert price is not None
         assert price.close == 163.0  # Latest price in sample data
+    
+    def test_get_latest_prices(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
+        """Test getting the latest prices for several stocks."""
+        # Create repository
+        repo = StockRepository()
+        
+        # Add stocks to database
+        test_db_session.add(StockModel(**sample_stock_model_kwargs))
+        test_db_session.add(StockModel(symbol="MSFT", name="Microsoft Corporation"))
+        
+        # Add price data for AAPL only
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
+        
+        test_db_session.commit()
+        
+        # Get latest prices
+        prices = repo.get_latest_prices(["AAPL", "MSFT"])
+        
+        # Verify only the latest AAPL price was retrieved
+        assert list(prices) == ["AAPL"]
+        assert prices["AAPL"].close == 163.0  # Latest price in sample data
+    
+    def test_exists(self, mock_get_session, test_db_session, sample_stock_model_kwargs):
+        """Test checking whether a stock exists."""
+        # Create repository
+        repo = StockRepository()
+        
+        # Add stock to database
+        test_db_session.add(StockModel(**sample_stock_model_kwargs))
+        test_db_session.commit()
+        
+        # Verify existence checks
+        assert repo.exists("AAPL") is True
+        assert repo.exists("NONEXISTENT") is False
+    
+    def test_get_top_gainers_and_losers(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
+        """Test ranking movers by change from the previous close."""
+        # Create repository
+        repo = StockRepository()
+        
+        # Add stocks to database
+        test_db_session.add(StockModel(**sample_stock_model_kwargs))
+        test_db_session.add(StockModel(symbol="MSFT", name="Microsoft Corporation"))
+        
+        # AAPL closes 158.0 -> 163.0, MSFT closes 100.0 -> 95.0
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
+        
+        for price, close in zip(sample_stock_prices[1:], (100.0, 95.0)):
+            test_db_session.add(StockPriceModel(
+                symbol="MSFT", date=price.date, open=close, high=close,
+                low=close, close=close, volume=1000000
+            ))
+        
+        test_db_session.commit()
+        
+        # Get movers
+        gainers = repo.get_top_gainers(limit=1)
+        losers = repo.get_top_losers(limit=1)
+        
+        # Verify movers were ranked against the previous close
+        assert [stock.symbol for stock, _ in gainers] == ["AAPL"]
+        assert gainers[0][1] == pytest.approx(5.0 / 158.0 * 100)
+        assert [stock.symbol for stock, _ in losers] == ["MSFT"]
+        assert losers[0][1] == pytest.approx(5.0)
+    
+    def test_get_by_symbols_and_price_data_bulk(self, mock_get_session, test_db_session, sample_stock_model_kwargs, sample_stock_prices):
+        """Test getting stocks and their price data for several symbols at once."""
+        # Create repository
+        repo = StockRepository()
+        
+        # Add stocks to database
+        test_db_session.add(StockModel(**sample_stock_model_kwargs))
+        test_db_session.add(StockModel(symbol="MSFT", name="Microsoft Corporation"))
+        
+        # Add price data for AAPL only
+        test_db_session.bulk_save_objects(
+            [StockPriceModel.from_domain(price, "AAPL") for price in sample_stock_prices]
+        )
+        
+        test_db_session.commit()
+        
+        # Get stocks, including an unknown symbol
+        stocks = repo.get_by_symbols(["AAPL", "MSFT", "NONEXISTENT"])
+        
+        # Verify only known stocks were retrieved
+        assert sorted(stocks) == ["AAPL", "MSFT"]
+        assert stocks["AAPL"].name == "Apple Inc."
+        
+        # Get price data since yesterday
+        yesterday = sample_stock_prices[1].date
+        prices = repo.get_price_data_bulk(["AAPL", "MSFT"], start_date=yesterday)
+        
+        # Verify prices were grouped by symbol, newest first
+        assert [price.close for price in prices["AAPL"]] == [163.0, 158.0]
+        assert prices["MSFT"] == []
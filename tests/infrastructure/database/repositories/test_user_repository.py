@@ -0,0 +1,46 @@
+"""Tests for the user repository.
+
+This module contains tests for the UserRepository class.
+"""
+
+from sqlalchemy import select
+
+from stocker.domain.user import User, UserRole
+from stocker.infrastructure.database.models.user import UserModel, user_roles
+from stocker.infrastructure.database.repositories.user import UserRepository
+
+
+class TestUserRepository:
+    """Tests for the UserRepository class."""
+    
+    def test_create_many(self, mock_get_session, test_db_session):
+        """Test creating several users and their roles at once."""
+        # Create repository
+        repo = UserRepository()
+        
+        # Create users with different roles
+        admin = User(username="admin", email="admin@example.com", roles={UserRole.ADMIN, UserRole.USER})
+        analyst = User(username="analyst", email="analyst@example.com", roles={UserRole.ANALYST})
+        created = repo.create_many([(admin, "admin-hash"), (analyst, "analyst-hash")])
+        
+        # Verify the users were returned and stored with their password hashes
+        assert [user.id for user in created] == [admin.id, analyst.id]
+        stored = dict(test_db_session.execute(select(UserModel.username, UserModel.password_hash)).all())
+        assert stored == {"admin": "admin-hash", "analyst": "analyst-hash"}
+        
+        # Verify the roles were stored for each user
+        role_rows = set(test_db_session.execute(select(user_roles.c.user_id, user_roles.c.role)).all())
+        assert role_rows == {
+            (admin.id, UserRole.ADMIN.value),
+            (admin.id, UserRole.USER.value),
+            (analyst.id, UserRole.ANALYST.value)
+        }
+    
+    def test_create_many_empty(self, mock_get_session, test_db_session):
+        """Test that creating no users writes nothing."""
+        # Create repository
+        repo = UserRepository()
+        
+        # Verify nothing was created
+        assert repo.create_many([]) == []
+        assert test_db_session.execute(select(UserModel.id)).first() is None
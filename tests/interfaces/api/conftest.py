@@ -4,9 +4,12 @@ This module provides fixtures for testing the STOCKER Pro API endpoints.
 """
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from typing import Generator, Dict, Any
 
 from stocker.interfaces.api.app import create_app
@@ -17,38 +20,142 @@ from stocker.services.user_service import UserService
 from stocker.interfaces.api.dependencies import create_access_token
 
 
-# Create test database engine
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create test database engine; one in-memory database shared by every connection.
+# Each pytest-xdist worker is its own process and so gets a private database.
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db() -> Generator[Session, None, None]:
-    """Create a fresh database for each test.
+# Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _begin_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+# bcrypt's minimum cost factor; hashes stay real but take about a millisecond
+TEST_BCRYPT_ROUNDS = 4
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing() -> Generator[None, None, None]:
+    """Hash and verify test passwords with the cheapest bcrypt cost factor."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "stocker.core.utils.passwords._bcrypt_rounds",
+            lambda: TEST_BCRYPT_ROUNDS
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def _engine():
+    """Create the database schema once for the test session.
+    
+    Returns:
+        SQLAlchemy engine for testing
+    """
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture(scope="module")
+def _connection(_engine, _seed_users) -> Generator[Connection, None, None]:
+    """Open one connection per test module inside an outer transaction.
+    
+    Fixtures shared by the tests of a module commit into this transaction,
+    which is rolled back after the module so no module sees another's data.
+    The shared users are committed outside it and so are created first.
+    
+    Yields:
+        Connection: Database connection with an open transaction
+    """
+    connection = _engine.connect()
+    transaction = connection.begin()
+    
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def module_db(_connection: Connection) -> Generator[Session, None, None]:
+    """Create a database session for fixtures shared by a test module.
     
     Yields:
         SQLAlchemy Session: Database session
     """
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal(bind=_connection, join_transaction_mode="create_savepoint")
     
-    # Create session
-    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="function")
+def db(_connection: Connection) -> Generator[Session, None, None]:
+    """Create a database session whose changes are rolled back after each test.
+    
+    Each test runs inside a savepoint of the module transaction; commits made
+    through the session only release a nested savepoint, and the test's
+    savepoint is rolled back at teardown.
+    
+    Yields:
+        SQLAlchemy Session: Database session
+    """
+    savepoint = _connection.begin_nested()
+    db = TestingSessionLocal(bind=_connection, join_transaction_mode="create_savepoint")
     
     try:
         yield db
     finally:
         db.close()
-        # Drop tables
-        Base.metadata.drop_all(bind=engine)
+        savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Create the FastAPI app once for the test session.
+    
+    Returns:
+        FastAPI: Application instance
+    """
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def _client(app: FastAPI) -> Generator[TestClient, None, None]:
+    """Start a test client once for the test session.
+    
+    Args:
+        app: Application instance
+        
+    Yields:
+        TestClient: FastAPI test client
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
-def client(db: Session) -> Generator[TestClient, None, None]:
-    """Create a test client for the FastAPI app.
+def client(_client: TestClient, app: FastAPI, db: Session) -> Generator[TestClient, None, None]:
+    """Get the shared test client, serving requests from this test's session.
     
     Args:
+        _client: Shared test client
+        app: Application instance
         db: Database session
         
     Yields:
@@ -61,15 +168,13 @@ def client(db: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
     
-    # Create app
-    app = create_app()
-    
-    # Override dependencies
+    # Override dependencies for this test only
     app.dependency_overrides[get_db] = override_get_db
     
-    # Create test client
-    with TestClient(app) as client:
-        yield client
+    try:
+        yield _client
+    finally:
+        app.dependency_overrides.clear()
 
 
 @pytest.fixture(scope="function")
@@ -85,47 +190,75 @@ def user_service(db: Session) -> UserService:
     return UserService(db)
 
 
-@pytest.fixture(scope="function")
-def test_user(user_service: UserService) -> User:
-    """Create a test user.
+@pytest.fixture(scope="session")
+def _seed_users(_engine) -> Dict[str, User]:
+    """Create the shared test users once for the test session.
+    
+    The users are committed outside the per-test transactions, so the
+    rollback after each test leaves them in place.
     
     Args:
-        user_service: User service instance
+        _engine: Test database engine with the schema created
+        
+    Returns:
+        Dict[str, User]: Test users keyed by "user" and "admin"
+    """
+    session = TestingSessionLocal()
+    
+    try:
+        user_service = UserService(session)
+        users = {
+            "user": user_service.create_user(
+                username="testuser",
+                email="test@example.com",
+                password="password123",
+                first_name="Test",
+                last_name="User",
+                roles=[UserRole.USER]
+            ),
+            "admin": user_service.create_user(
+                username="testadmin",
+                email="admin@example.com",
+                password="password123",
+                first_name="Test",
+                last_name="Admin",
+                roles=[UserRole.ADMIN]
+            )
+        }
+        session.commit()
+    finally:
+        session.close()
+    
+    return users
+
+
+@pytest.fixture(scope="session")
+def test_user(_seed_users: Dict[str, User]) -> User:
+    """Get the shared test user.
+    
+    Args:
+        _seed_users: Shared test users
         
     Returns:
         User: Test user
     """
-    return user_service.create_user(
-        username="testuser",
-        email="test@example.com",
-        password="password123",
-        first_name="Test",
-        last_name="User",
-        roles=[UserRole.USER]
-    )
+    return _seed_users["user"]
 
 
-@pytest.fixture(scope="function")
-def test_admin(user_service: UserService) -> User:
-    """Create a test admin user.
+@pytest.fixture(scope="session")
+def test_admin(_seed_users: Dict[str, User]) -> User:
+    """Get the shared test admin user.
     
     Args:
-        user_service: User service instance
+        _seed_users: Shared test users
         
     Returns:
         User: Test admin user
     """
-    return user_service.create_user(
-        username="testadmin",
-        email="admin@example.com",
-        password="password123",
-        first_name="Test",
-        last_name="Admin",
-        roles=[UserRole.ADMIN]
-    )
+    return _seed_users["admin"]
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def user_token_headers(test_user: User) -> Dict[str, str]:
     """Create authorization headers for a test user.
     
@@ -145,7 +278,7 @@ def user_token_headers(test_user: User) -> Dict[str, str]:
     return {"Authorization": f"Bearer {access_token}"}
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def admin_token_headers(test_admin: User) -> Dict[str, str]:
     """Create authorization headers for a test admin user.
     
@@ -7,21 +7,23 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from stocker.core.utils.passwords import verify_password
 from stocker.domain.user import User
-from stocker.services.user_service import UserService
+from stocker.infrastructure.database.models.user import UserModel
 
 
-def test_login_success(client: TestClient, test_user: User):
-    """Test successful login.
+@pytest.mark.parametrize("identifier_attr", ["username", "email"])
+def test_login_success(client: TestClient, test_user: User, identifier_attr: str):
+    """Test successful login with a username or email.
     
     Args:
         client: Test client
         test_user: Test user
+        identifier_attr: User attribute to log in with
     """
-    # Test login with username
     response = client.post(
         "/api/auth/login",
-        json={"username": test_user.username, "password": "password123"}
+        json={"username": getattr(test_user, identifier_attr), "password": "password123"}
     )
     assert response.status_code == 200
     data = response.json()
@@ -29,35 +31,28 @@ def test_login_success(client: TestClient, test_user: User):
     assert data["token_type"] == "bearer"
     assert data["user_id"] == test_user.id
     assert data["username"] == test_user.username
-    
-    # Test login with email
-    response = client.post(
-        "/api/auth/login",
-        json={"username": test_user.email, "password": "password123"}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    assert "access_token" in data
 
 
-def test_login_failure(client: TestClient, test_user: User):
+@pytest.mark.parametrize(
+    "username, password",
+    [
+        ("testuser", "wrongpassword"),
+        ("nonexistentuser", "password123"),
+    ],
+    ids=["wrong_password", "unknown_user"]
+)
+def test_login_failure(client: TestClient, test_user: User, username: str, password: str):
     """Test failed login attempts.
     
     Args:
         client: Test client
         test_user: Test user
+        username: Username to log in with
+        password: Password to log in with
     """
-    # Test login with incorrect password
     response = client.post(
         "/api/auth/login",
-        json={"username": test_user.username, "password": "wrongpassword"}
-    )
-    assert response.status_code == 401
-    
-    # Test login with non-existent user
-    response = client.post(
-        "/api/auth/login",
-        json={"username": "nonexistentuser", "password": "password123"}
+        json={"username": username, "password": password}
     )
     assert response.status_code == 401
 
@@ -100,13 +95,13 @@ def test_get_current_user(client: TestClient, user_token_headers: dict, test_use
     assert data["email"] == test_user.email
 
 
-def test_change_password(client: TestClient, user_token_headers: dict, user_service: UserService, test_user: User):
+def test_change_password(client: TestClient, db: Session, user_token_headers: dict, test_user: User):
     """Test changing user password.
     
     Args:
         client: Test client
+        db: Database session
         user_token_headers: User token headers
-        user_service: User service
         test_user: Test user
     """
     # Change password
@@ -120,19 +115,10 @@ def test_change_password(client: TestClient, user_token_headers: dict, user_serv
     )
     assert response.status_code == 200
     
-    # Verify old password no longer works
-    response = client.post(
-        "/api/auth/login",
-        json={"username": test_user.username, "password": "password123"}
-    )
-    assert response.status_code == 401
-    
-    # Verify new password works
-    response = client.post(
-        "/api/auth/login",
-        json={"username": test_user.username, "password": "newpassword123"}
-    )
-    assert response.status_code == 200
+    # Verify the stored hash matches the new password only
+    password_hash = db.get(UserModel, test_user.id).password_hash
+    assert not verify_password("password123", password_hash)
+    assert verify_password("newpassword123", password_hash)
 
 
 def test_change_password_failure(client: TestClient, user_token_headers: dict):
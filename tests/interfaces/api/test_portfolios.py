@@ -5,29 +5,29 @@ This module contains tests for the portfolio-related API endpoints.
 
 import pytest
 from datetime import datetime, timedelta
+from typing import Dict
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from stocker.domain.user import User
-from stocker.domain.portfolio import Portfolio, Position, Transaction
+from stocker.domain.portfolio import Portfolio, Position, Transaction, TransactionType
 from stocker.domain.stock import Stock
 from stocker.services.portfolio_service import PortfolioService
 from stocker.services.stock_service import StockService
 
 
-@pytest.fixture
-def test_portfolio(db: Session, portfolio_service: PortfolioService, test_user: User) -> Portfolio:
-    """Create a test portfolio.
+@pytest.fixture(scope="module")
+def test_portfolio(module_db: Session, test_user: User) -> Portfolio:
+    """Create a test portfolio shared by the tests in this module.
     
     Args:
-        db: Database session
-        portfolio_service: Portfolio service
+        module_db: Module database session
         test_user: Test user
         
     Returns:
         Portfolio: Test portfolio
     """
-    return portfolio_service.create_portfolio(
+    return PortfolioService(module_db).create_portfolio(
         name="Test Portfolio",
         description="A test portfolio",
         type="personal",
@@ -36,109 +36,120 @@ def test_portfolio(db: Session, portfolio_service: PortfolioService, test_user:
     )
 
 
-@pytest.fixture
-def test_stock(db: Session, stock_service: StockService) -> Stock:
-    """Create a test stock.
+@pytest.fixture(scope="module")
+def seed_stocks(module_db: Session) -> Dict[str, Stock]:
+    """Create the stocks shared by the tests in this module.
     
     Args:
-        db: Database session
-        stock_service: Stock service
+        module_db: Module database session
+        
+    Returns:
+        Dict[str, Stock]: Test stocks keyed by symbol
+    """
+    stock_service = StockService(module_db)
+    return {
+        "AAPL": stock_service.create_stock(
+            symbol="AAPL",
+            name="Apple Inc.",
+            exchange="NASDAQ",
+            sector="TECHNOLOGY"
+        ),
+        "MSFT": stock_service.create_stock(
+            symbol="MSFT",
+            name="Microsoft Corporation",
+            exchange="NASDAQ",
+            sector="TECHNOLOGY"
+        )
+    }
+
+
+@pytest.fixture(scope="module")
+def test_stock(seed_stocks: Dict[str, Stock]) -> Stock:
+    """Get the test stock shared by the tests in this module.
+    
+    Args:
+        seed_stocks: Test stocks keyed by symbol
         
     Returns:
         Stock: Test stock
     """
-    return stock_service.create_stock(
-        symbol="AAPL",
-        name="Apple Inc.",
-        exchange="NASDAQ",
-        sector="TECHNOLOGY"
-    )
+    return seed_stocks["AAPL"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_portfolio_with_positions(
-    db: Session,
-    portfolio_service: PortfolioService,
-    test_portfolio: Portfolio,
-    test_stock: Stock
+    module_db: Session,
+    test_user: User,
+    seed_stocks: Dict[str, Stock]
 ) -> Portfolio:
-    """Create a test portfolio with positions.
+    """Create a test portfolio with positions shared by the tests in this module.
     
     Args:
-        db: Database session
-        portfolio_service: Portfolio service
-        test_portfolio: Test portfolio
-        test_stock: Test stock
+        module_db: Module database session
+        test_user: Test user
+        seed_stocks: Test stocks keyed by symbol
         
     Returns:
         Portfolio: Test portfolio with positions
     """
-    # Add position
-    portfolio_service.add_position(
-        portfolio_id=test_portfolio.id,
-        symbol=test_stock.symbol,
-        quantity=10.0,
-        cost_basis=150.0
-    )
-    
-    # Add another position
-    stock_service = StockService(db)
-    stock_service.create_stock(
-        symbol="MSFT",
-        name="Microsoft Corporation",
-        exchange="NASDAQ",
-        sector="TECHNOLOGY"
+    portfolio_service = PortfolioService(module_db)
+    portfolio = portfolio_service.create_portfolio(
+        name="Test Portfolio With Positions",
+        description="A test portfolio with positions",
+        type="personal",
+        owner_id=test_user.id,
+        cash_balance=10000.0
     )
     
-    portfolio_service.add_position(
-        portfolio_id=test_portfolio.id,
-        symbol="MSFT",
-        quantity=5.0,
-        cost_basis=250.0
-    )
+    # Add both positions in one batch
+    portfolio_service.add_positions(portfolio.id, [
+        Position(symbol=seed_stocks["AAPL"].symbol, quantity=10.0, cost_basis=150.0),
+        Position(symbol=seed_stocks["MSFT"].symbol, quantity=5.0, cost_basis=250.0)
+    ])
     
-    return portfolio_service.get_portfolio(test_portfolio.id, include_positions=True)
+    return portfolio_service.get_portfolio(portfolio.id, include_positions=True)
 
 
-@pytest.fixture
-def test_portfolio_with_transactions(
-    db: Session,
-    portfolio_service: PortfolioService,
-    test_portfolio: Portfolio,
-    test_stock: Stock
-) -> Portfolio:
-    """Create a test portfolio with transactions.
+@pytest.fixture(scope="module")
+def test_portfolio_with_transactions(module_db: Session, test_user: User, test_stock: Stock) -> Portfolio:
+    """Create a test portfolio with transactions shared by the tests in this module.
     
     Args:
-        db: Database session
-        portfolio_service: Portfolio service
-        test_portfolio: Test portfolio
+        module_db: Module database session
+        test_user: Test user
         test_stock: Test stock
         
     Returns:
         Portfolio: Test portfolio with transactions
     """
-    # Add buy transaction
-    portfolio_service.add_transaction(
-        portfolio_id=test_portfolio.id,
-        transaction_type="buy",
-        symbol=test_stock.symbol,
-        date=datetime.now(),
-        quantity=10.0,
-        price=150.0,
-        amount=1500.0
-    )
-    
-    # Add deposit transaction
-    portfolio_service.add_transaction(
-        portfolio_id=test_portfolio.id,
-        transaction_type="deposit",
-        date=datetime.now() - timedelta(days=1),
-        amount=5000.0,
-        notes="Initial deposit"
+    portfolio_service = PortfolioService(module_db)
+    portfolio = portfolio_service.create_portfolio(
+        name="Test Portfolio With Transactions",
+        description="A test portfolio with transactions",
+        type="personal",
+        owner_id=test_user.id,
+        cash_balance=10000.0
     )
     
-    return portfolio_service.get_portfolio(test_portfolio.id, include_transactions=True)
+    # Add the buy and deposit transactions in one batch
+    portfolio_service.add_transactions(portfolio.id, [
+        Transaction(
+            type=TransactionType.BUY,
+            symbol=test_stock.symbol,
+            date=datetime.now(),
+            quantity=10.0,
+            price=150.0,
+            amount=1500.0
+        ),
+        Transaction(
+            type=TransactionType.DEPOSIT,
+            date=datetime.now() - timedelta(days=1),
+            amount=5000.0,
+            notes="Initial deposit"
+        )
+    ])
+    
+    return portfolio_service.get_portfolio(portfolio.id, include_transactions=True)
 
 
 def test_create_portfolio(client: TestClient, user_token_headers: dict, test_user: User):
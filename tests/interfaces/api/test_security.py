@@ -11,7 +11,7 @@ from unittest.mock import patch, MagicMock
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from jose import jwt
+from jose import JWTError, jwt
 
 from stocker.core.config.settings import get_settings
 from stocker.interfaces.api.app import create_app
@@ -20,7 +20,7 @@ from stocker.interfaces.api.security import (
     verify_password,
     create_access_token,
     create_refresh_token,
-    decode_token,
+    decode_token_payload,
     is_token_expired,
     validate_password_strength
 )
@@ -97,7 +97,7 @@ class TestJWTTokens:
         token = create_access_token(data)
         
         # Decode token
-        payload = decode_token(token)
+        payload = decode_token_payload(token)
         
         # Verify token data
         assert payload["sub"] == "user123"
@@ -116,7 +116,7 @@ class TestJWTTokens:
         token = create_refresh_token(data)
         
         # Decode token
-        payload = decode_token(token)
+        payload = decode_token_payload(token)
         
         # Verify token data
         assert payload["sub"] == "user123"
@@ -142,6 +142,38 @@ class TestJWTTokens:
         
         # Token should be expired now
         assert is_token_expired(token) is True
+    
+    def test_token_audience_and_issuer(self):
+        """Test that configured audience and issuer claims are issued and enforced."""
+        # Configure an audience and issuer
+        security_settings = get_settings().security.copy(
+            update={"token_audience": "stocker-api", "token_issuer": "stocker"}
+        )
+        
+        with patch("stocker.interfaces.api.security.auth.get_security_settings", return_value=security_settings):
+            # Tokens created here carry and pass both claims
+            payload = decode_token_payload(create_access_token({"sub": "user123"}))
+            assert payload["aud"] == "stocker-api"
+            assert payload["iss"] == "stocker"
+            
+            # Tokens for another audience or from another issuer are rejected
+            for claims in ({"sub": "user123", "aud": "other", "iss": "stocker"},
+                           {"sub": "user123", "aud": "stocker-api", "iss": "other"}):
+                token = jwt.encode(claims, security_settings.secret_key, algorithm=security_settings.algorithm)
+                with pytest.raises(JWTError):
+                    decode_token_payload(token)
+    
+    def test_token_audience_rejected_when_not_configured(self):
+        """Test that a token meant for an audience is rejected when none is configured."""
+        security_settings = get_settings().security
+        token = jwt.encode(
+            {"sub": "user123", "aud": "stocker-api"},
+            security_settings.secret_key,
+            algorithm=security_settings.algorithm
+        )
+        
+        with pytest.raises(JWTError):
+            decode_token_payload(token)
 
 
 class TestSecurityMiddleware:
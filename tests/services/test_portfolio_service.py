@@ -14,6 +14,15 @@ from stocker.domain.stock import Stock, StockPrice
 from stocker.infrastructure.database.repositories.portfolio import PortfolioRepository
 from stocker.infrastructure.database.repositories.stock import StockRepository
 from stocker.services.portfolio import PortfolioService
+from stocker.services.stock import stock_exists_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_stock_exists_cache():
+    """Clear the shared stock existence cache between tests."""
+    stock_exists_cache.clear()
+    yield
+    stock_exists_cache.clear()
 
 
 @pytest.fixture
@@ -184,7 +193,7 @@ class TestPortfolioService:
     def test_update_portfolio(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio):
         """Test updating a portfolio."""
         # Configure mock repository
-        mock_portfolio_repository.get_by_id.return_value = sample_portfolio
+        mock_portfolio_repository.exists.return_value = True
         mock_portfolio_repository.update.return_value = sample_portfolio
         
         # Create service with mock repositories
@@ -194,7 +203,7 @@ class TestPortfolioService:
         updated_portfolio = service.update_portfolio(sample_portfolio)
         
         # Verify repository was called correctly
-        mock_portfolio_repository.get_by_id.assert_called_once_with(sample_portfolio.id)
+        mock_portfolio_repository.exists.assert_called_once_with(sample_portfolio.id)
         mock_portfolio_repository.update.assert_called_once_with(sample_portfolio)
         
         # Verify portfolio was updated
@@ -205,7 +214,7 @@ class TestPortfolioService:
     def test_update_portfolio_not_found(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio):
         """Test updating a non-existent portfolio."""
         # Configure mock repository
-        mock_portfolio_repository.get_by_id.return_value = None
+        mock_portfolio_repository.exists.return_value = False
         
         # Create service with mock repositories
         service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
@@ -215,7 +224,7 @@ class TestPortfolioService:
             service.update_portfolio(sample_portfolio)
         
         # Verify repository was called correctly
-        mock_portfolio_repository.get_by_id.assert_called_once_with(sample_portfolio.id)
+        mock_portfolio_repository.exists.assert_called_once_with(sample_portfolio.id)
         mock_portfolio_repository.update.assert_not_called()
     
     def test_delete_portfolio(self, mock_portfolio_repository, mock_stock_repository):
@@ -238,7 +247,7 @@ class TestPortfolioService:
     def test_add_position(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_position):
         """Test adding a position to a portfolio."""
         # Configure mock repositories
-        mock_stock_repository.get_by_symbol.return_value = Mock()
+        mock_stock_repository.exists.return_value = True
         mock_portfolio_repository.add_position.return_value = sample_portfolio
         
         # Create service with mock repositories
@@ -248,7 +257,7 @@ class TestPortfolioService:
         updated_portfolio = service.add_position(sample_portfolio.id, sample_position)
         
         # Verify repositories were called correctly
-        mock_stock_repository.get_by_symbol.assert_called_once_with(sample_position.symbol)
+        mock_stock_repository.exists.assert_called_once_with(sample_position.symbol)
         mock_portfolio_repository.add_position.assert_called_once_with(sample_portfolio.id, sample_position)
         
         # Verify portfolio was updated
@@ -258,7 +267,7 @@ class TestPortfolioService:
     def test_add_position_stock_not_found(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_position):
         """Test adding a position with a non-existent stock."""
         # Configure mock repositories
-        mock_stock_repository.get_by_symbol.return_value = None
+        mock_stock_repository.exists.return_value = False
         
         # Create service with mock repositories
         service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
@@ -268,7 +277,7 @@ class TestPortfolioService:
             service.add_position(sample_portfolio.id, sample_position)
         
         # Verify repositories were called correctly
-        mock_stock_repository.get_by_symbol.assert_called_once_with(sample_position.symbol)
+        mock_stock_repository.exists.assert_called_once_with(sample_position.symbol)
         mock_portfolio_repository.add_position.assert_not_called()
     
     def test_remove_position(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio):
@@ -292,7 +301,7 @@ class TestPortfolioService:
     def test_add_transaction(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_transaction):
         """Test adding a transaction to a portfolio."""
         # Configure mock repositories
-        mock_stock_repository.get_by_symbol.return_value = Mock()
+        mock_stock_repository.exists.return_value = True
         mock_portfolio_repository.add_transaction.return_value = sample_portfolio
         
         # Create service with mock repositories
@@ -302,7 +311,7 @@ class TestPortfolioService:
         updated_portfolio = service.add_transaction(sample_portfolio.id, sample_transaction)
         
         # Verify repositories were called correctly
-        mock_stock_repository.get_by_symbol.assert_called_once_with(sample_transaction.symbol)
+        mock_stock_repository.exists.assert_called_once_with(sample_transaction.symbol)
         mock_portfolio_repository.add_transaction.assert_called_once_with(sample_portfolio.id, sample_transaction)
         
         # Verify portfolio was updated
@@ -312,7 +321,7 @@ class TestPortfolioService:
     def test_add_transaction_stock_not_found(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_transaction):
         """Test adding a transaction with a non-existent stock."""
         # Configure mock repositories
-        mock_stock_repository.get_by_symbol.return_value = None
+        mock_stock_repository.exists.return_value = False
         
         # Create service with mock repositories
         service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
@@ -322,7 +331,7 @@ class TestPortfolioService:
             service.add_transaction(sample_portfolio.id, sample_transaction)
         
         # Verify repositories were called correctly
-        mock_stock_repository.get_by_symbol.assert_called_once_with(sample_transaction.symbol)
+        mock_stock_repository.exists.assert_called_once_with(sample_transaction.symbol)
         mock_portfolio_repository.add_transaction.assert_not_called()
     
     def test_get_transactions(self, mock_portfolio_repository, mock_stock_repository, sample_transaction):
@@ -368,7 +377,7 @@ class TestPortfolioService:
         """Test calculating the value of a portfolio."""
         # Configure mock repositories
         mock_portfolio_repository.get_by_id.return_value = sample_portfolio
-        mock_portfolio_repository.get_positions.return_value = {"AAPL": sample_position}
+        mock_portfolio_repository.get_position_quantities.return_value = {"AAPL": sample_position.quantity}
         
         # Create a mock latest price
         latest_price = StockPrice(
@@ -379,7 +388,7 @@ class TestPortfolioService:
             close=163.0,
             volume=1000000
         )
-        mock_stock_repository.get_latest_price.return_value = latest_price
+        mock_stock_repository.get_latest_prices.return_value = {"AAPL": latest_price}
         
         # Create service with mock repositories
         service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
@@ -389,10 +398,154 @@ class TestPortfolioService:
         
         # Verify repositories were called correctly
         mock_portfolio_repository.get_by_id.assert_called_once_with(sample_portfolio.id)
-        mock_portfolio_repository.get_positions.assert_called_once_with(sample_portfolio.id)
-        mock_stock_repository.get_latest_price.assert_called_once_with("AAPL")
+        mock_portfolio_repository.get_position_quantities.assert_called_once_with(sample_portfolio.id)
+        mock_portfolio_repository.get_positions.assert_not_called()
+        mock_stock_repository.get_latest_prices.assert_called_once_with(["AAPL"])
         
         # Verify value was calculated correctly
         # Cash balance (10000.0) + Position value (10 shares * $163.0 = 1630.0)
         expected_value = 10000.0 + (10.0 * 163.0)
         assert value == expected_value
+    
+    def test_calculate_portfolio_performance(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_position):
+        """Test calculating the performance of a portfolio."""
+        # Configure mock repositories
+        mock_portfolio_repository.get_by_id.return_value = sample_portfolio
+        mock_portfolio_repository.get_position_quantities.return_value = {"AAPL": sample_position.quantity}
+        mock_portfolio_repository.get_period_cashflow_summary.return_value = (1000.0, 200.0, True)
+        mock_stock_repository.get_latest_prices.return_value = {
+            "AAPL": StockPrice(
+                date=datetime.now(),
+                open=160.0,
+                high=165.0,
+                low=159.0,
+                close=163.0,
+                volume=1000000
+            )
+        }
+        
+        # Create service with mock repositories
+        service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
+        
+        # Calculate portfolio performance
+        performance = service.calculate_portfolio_performance(sample_portfolio.id, days=30)
+        
+        # Verify each piece of data was loaded once
+        mock_portfolio_repository.get_by_id.assert_called_once_with(sample_portfolio.id)
+        mock_portfolio_repository.get_position_quantities.assert_called_once_with(sample_portfolio.id)
+        mock_portfolio_repository.get_positions.assert_not_called()
+        mock_stock_repository.get_latest_prices.assert_called_once_with(["AAPL"])
+        
+        # Verify cash flows were summarized in the database
+        mock_portfolio_repository.get_period_cashflow_summary.assert_called_once()
+        mock_portfolio_repository.get_transactions.assert_not_called()
+        
+        # Verify performance metrics
+        expected_value = 10000.0 + (10.0 * 163.0)
+        assert performance["current_value"] == expected_value
+        assert performance["position_value"] == 10.0 * 163.0
+        assert performance["position_count"] == 1
+        assert performance["period_deposits"] == 1000.0
+        assert performance["period_withdrawals"] == 200.0
+        assert "period_return_pct" in performance
+    
+    def test_get_portfolio_memoized_until_write(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_position):
+        """Test that repeated portfolio lookups are memoized until a write."""
+        # Configure mock repositories
+        mock_portfolio_repository.get_by_id.return_value = sample_portfolio
+        mock_portfolio_repository.add_position.return_value = sample_portfolio
+        mock_stock_repository.exists.return_value = True
+        
+        # Create service with mock repositories
+        service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
+        
+        # Repeated lookups hit the repository once
+        service.get_portfolio(sample_portfolio.id)
+        service.get_portfolio(sample_portfolio.id)
+        assert mock_portfolio_repository.get_by_id.call_count == 1
+        
+        # A write invalidates the memoized lookup
+        service.add_position(sample_portfolio.id, sample_position)
+        service.get_portfolio(sample_portfolio.id)
+        assert mock_portfolio_repository.get_by_id.call_count == 2
+    
+    def test_add_transaction_stock_existence_cached(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_transaction):
+        """Test that stock existence is checked once per symbol."""
+        # Configure mock repositories
+        mock_stock_repository.exists.return_value = True
+        mock_portfolio_repository.add_transaction.return_value = sample_portfolio
+        
+        # Create service with mock repositories
+        service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
+        
+        # Add several transactions for the same symbol
+        for _ in range(3):
+            sample_transaction.id = str(uuid.uuid4())
+            service.add_transaction(sample_portfolio.id, sample_transaction)
+        
+        # Verify the stock was only looked up once
+        mock_stock_repository.exists.assert_called_once_with(sample_transaction.symbol)
+        assert mock_portfolio_repository.add_transaction.call_count == 3
+    
+    def test_add_transactions(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_transaction):
+        """Test adding several transactions to a portfolio at once."""
+        # Configure mock repositories
+        mock_stock_repository.exists_many.return_value = {"AAPL"}
+        mock_portfolio_repository.add_transactions_bulk.return_value = sample_portfolio
+        
+        deposit = Transaction(
+            id=None,
+            type=TransactionType.DEPOSIT,
+            symbol=None,
+            date=datetime.now(),
+            amount=5000.0
+        )
+        transactions = [deposit, sample_transaction]
+        
+        # Create service with mock repositories
+        service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
+        
+        # Add transactions
+        updated_portfolio = service.add_transactions(sample_portfolio.id, transactions)
+        
+        # Verify symbols were validated in one query and transactions inserted in one call
+        mock_stock_repository.exists_many.assert_called_once_with({"AAPL"})
+        mock_portfolio_repository.add_transactions_bulk.assert_called_once_with(sample_portfolio.id, transactions)
+        mock_portfolio_repository.add_transaction.assert_not_called()
+        
+        # Verify missing IDs were assigned
+        assert deposit.id
+        assert updated_portfolio.id == sample_portfolio.id
+    
+    def test_add_transactions_stock_not_found(self, mock_portfolio_repository, mock_stock_repository, sample_portfolio, sample_transaction):
+        """Test adding several transactions with a non-existent stock."""
+        # Configure mock repositories
+        mock_stock_repository.exists_many.return_value = set()
+        
+        # Create service with mock repositories
+        service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
+        
+        # Add transactions with non-existent stock
+        with pytest.raises((DataNotFoundError, ServiceError)):
+            service.add_transactions(sample_portfolio.id, [sample_transaction])
+        
+        # Verify nothing was inserted
+        mock_portfolio_repository.add_transactions_bulk.assert_not_called()
+    
+    def test_iter_transactions(self, mock_portfolio_repository, mock_stock_repository, sample_transaction):
+        """Test streaming transactions for a portfolio."""
+        # Configure mock repository
+        mock_portfolio_repository.iter_transactions.return_value = iter([sample_transaction])
+        
+        # Create service with mock repositories
+        service = PortfolioService(mock_portfolio_repository, mock_stock_repository)
+        
+        # Stream transactions
+        transactions = service.iter_transactions("portfolio-id")
+        
+        # Verify nothing is fetched until iteration
+        mock_portfolio_repository.iter_transactions.assert_not_called()
+        
+        # Verify transactions were streamed
+        assert [tx.id for tx in transactions] == [sample_transaction.id]
+        mock_portfolio_repository.iter_transactions.assert_called_once_with("portfolio-id", None)
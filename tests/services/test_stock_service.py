@@ -10,7 +10,7 @@ from unittest.mock import Mock, patch, MagicMock
 from stocker.core.exceptions import ServiceError, DataNotFoundError
 from stocker.domain.stock import Stock, StockPrice, StockData, Exchange, Sector
 from stocker.infrastructure.database.repositories.stock import StockRepository
-from stocker.services.stock import StockService
+from stocker.services.stock import StockService, stock_exists_cache
 
 
 @pytest.fixture
@@ -185,7 +185,7 @@ class TestStockService:
     def test_update_stock(self, mock_stock_repository, sample_stock):
         """Test updating a stock."""
         # Configure mock repository
-        mock_stock_repository.get_by_symbol.return_value = sample_stock
+        mock_stock_repository.exists.return_value = True
         mock_stock_repository.update.return_value = sample_stock
         
         # Create service with mock repository
@@ -195,7 +195,7 @@ class TestStockService:
         updated_stock = service.update_stock(sample_stock)
         
         # Verify repository was called correctly
-        mock_stock_repository.get_by_symbol.assert_called_once_with("AAPL")
+        mock_stock_repository.exists.assert_called_once_with("AAPL")
         mock_stock_repository.update.assert_called_once_with(sample_stock)
         
         # Verify stock was updated
@@ -206,7 +206,7 @@ class TestStockService:
     def test_update_stock_not_found(self, mock_stock_repository, sample_stock):
         """Test updating a non-existent stock."""
         # Configure mock repository
-        mock_stock_repository.get_by_symbol.return_value = None
+        mock_stock_repository.exists.return_value = False
         
         # Create service with mock repository
         service = StockService(mock_stock_repository)
@@ -216,7 +216,7 @@ class TestStockService:
             service.update_stock(sample_stock)
         
         # Verify repository was called correctly
-        mock_stock_repository.get_by_symbol.assert_called_once_with("AAPL")
+        mock_stock_repository.exists.assert_called_once_with("AAPL")
         mock_stock_repository.update.assert_not_called()
     
     def test_delete_stock(self, mock_stock_repository):
@@ -236,6 +236,21 @@ class TestStockService:
         # Verify stock was deleted
         assert result is True
     
+    def test_delete_stock_forgets_existence(self, mock_stock_repository):
+        """Test that deleting a stock drops it from the shared existence cache."""
+        # Configure mock repository
+        mock_stock_repository.delete.return_value = True
+        stock_exists_cache.set("AAPL", True)
+        
+        # Create service with mock repository
+        service = StockService(mock_stock_repository)
+        
+        # Delete stock
+        service.delete_stock("AAPL")
+        
+        # Verify the symbol is no longer known to exist
+        assert stock_exists_cache.get("AAPL") is None
+    
     def test_search_stocks(self, mock_stock_repository, sample_stock):
         """Test searching for stocks."""
         # Configure mock repository
@@ -404,3 +419,21 @@ class TestStockService:
         # Verify error was handled correctly
         assert "Service operation 'get_stock' failed" in str(excinfo.value)
         assert "Test error" in str(excinfo.value)
+    
+    @pytest.mark.asyncio
+    async def test_get_top_movers(self, mock_stock_repository, sample_stock):
+        """Test getting top gainers and losers together."""
+        # Configure mock repository
+        mock_stock_repository.get_top_gainers.return_value = [(sample_stock, 2.5)]
+        mock_stock_repository.get_top_losers.return_value = [(sample_stock, 1.5)]
+        
+        # Create service with mock repository
+        service = StockService(mock_stock_repository)
+        
+        # Get top movers
+        movers = await service.get_top_movers(5)
+        
+        # Verify both lists were returned
+        assert movers == {"gainers": [(sample_stock, 2.5)], "losers": [(sample_stock, 1.5)]}
+        mock_stock_repository.get_top_gainers.assert_called_once_with(5)
+        mock_stock_repository.get_top_losers.assert_called_once_with(5)
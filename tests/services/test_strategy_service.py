@@ -0,0 +1,399 @@
+"""Tests for the strategy service.
+
+This module contains tests for the StrategyService class.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+import uuid
+
+from stocker.core.exceptions import ServiceError, DataNotFoundError
+from stocker.domain.stock import Stock
+from stocker.domain.strategy import Strategy, StrategyType, StrategyParameters, Signal, SignalType
+from stocker.infrastructure.database.repositories.base import encode_cursor, decode_cursor
+from stocker.infrastructure.database.repositories.stock import StockRepository
+from stocker.infrastructure.database.repositories.strategy import StrategyRepository
+from stocker.services import strategy as strategy_module
+from stocker.services.strategy import StrategyService, _strategy_cache, _run_cache, _prefetch_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_strategy_cache():
+    """Clear the shared strategy, run and prefetch caches between tests."""
+    _strategy_cache.clear()
+    _run_cache.clear()
+    _prefetch_cache.clear()
+    yield
+    _strategy_cache.clear()
+    _run_cache.clear()
+    _prefetch_cache.clear()
+
+
+@pytest.fixture
+def mock_strategy_repository():
+    """Create a mock strategy repository for testing."""
+    return Mock(spec=StrategyRepository)
+
+
+@pytest.fixture
+def mock_stock_repository():
+    """Create a mock stock repository for testing."""
+    return Mock(spec=StockRepository)
+
+
+@pytest.fixture
+def sample_strategy():
+    """Create a sample strategy for testing."""
+    return Strategy(
+        id=str(uuid.uuid4()),
+        name="Test Strategy",
+        description="A test strategy",
+        type=StrategyType.CUSTOM,
+        owner_id=str(uuid.uuid4())
+    )
+
+
+class TestStrategyService:
+    """Tests for the StrategyService class."""
+    
+    def test_get_strategy(self, mock_strategy_repository, mock_stock_repository, sample_strategy):
+        """Test getting a strategy by ID."""
+        # Configure mock repository
+        mock_strategy_repository.get_by_id.return_value = sample_strategy
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Get strategy
+        strategy = service.get_strategy(sample_strategy.id)
+        
+        # Verify repository was called correctly
+        mock_strategy_repository.get_by_id.assert_called_once_with(sample_strategy.id)
+        
+        # Verify strategy was returned
+        assert strategy == sample_strategy
+    
+    def test_get_strategy_cached_until_update(self, mock_strategy_repository, mock_stock_repository, sample_strategy):
+        """Test that strategy lookups are cached until the strategy is updated."""
+        # Configure mock repository
+        mock_strategy_repository.get_by_id.return_value = sample_strategy
+        mock_strategy_repository.update.return_value = sample_strategy
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Repeated lookups hit the repository once
+        service.get_strategy(sample_strategy.id)
+        service.get_strategy(sample_strategy.id)
+        assert mock_strategy_repository.get_by_id.call_count == 1
+        
+        # Updating the strategy invalidates the cached entry
+        service.update_strategy(sample_strategy)
+        service.get_strategy(sample_strategy.id)
+        assert mock_strategy_repository.get_by_id.call_count == 2
+    
+    def test_failed_update_leaves_cache_unchanged(self, mock_strategy_repository, mock_stock_repository, sample_strategy):
+        """Test that edits to a fetched strategy reach the cache only once saved."""
+        # Configure mock repository
+        mock_strategy_repository.get_by_id.return_value = sample_strategy
+        mock_strategy_repository.update.side_effect = Exception("Test error")
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        service.get_strategy(sample_strategy.id)
+        
+        # Edit a cached copy and fail to save it
+        strategy = service.get_strategy(sample_strategy.id)
+        strategy.name = "Unsaved Name"
+        with pytest.raises(ServiceError):
+            service.update_strategy(strategy)
+        
+        # Verify the cached strategy still has the stored values
+        assert service.get_strategy(sample_strategy.id).name == "Test Strategy"
+        assert mock_strategy_repository.get_by_id.call_count == 1
+    
+    def test_update_strategy_not_found(self, mock_strategy_repository, mock_stock_repository, sample_strategy):
+        """Test that updating a missing strategy fails without a prior lookup."""
+        # Configure mock repository
+        mock_strategy_repository.update.side_effect = DataNotFoundError(f"Strategy with ID {sample_strategy.id} not found")
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Verify the update fails
+        with pytest.raises(ServiceError) as excinfo:
+            service.update_strategy(sample_strategy)
+        
+        assert "not found" in str(excinfo.value)
+        mock_strategy_repository.get_by_id.assert_not_called()
+    
+    def test_get_strategy_not_found_not_cached(self, mock_strategy_repository, mock_stock_repository):
+        """Test that missing strategies are not cached."""
+        # Configure mock repository
+        mock_strategy_repository.get_by_id.return_value = None
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Look up a missing strategy twice
+        with pytest.raises(DataNotFoundError):
+            service.get_strategy_or_raise("nonexistent-id")
+        assert service.get_strategy("nonexistent-id") is None
+        
+        # Verify both lookups hit the repository
+        assert mock_strategy_repository.get_by_id.call_count == 2
+    
+    def test_get_signals_with_cursor(self, mock_strategy_repository, mock_stock_repository):
+        """Test paging through signals with a cursor."""
+        # Configure mock repository
+        mock_strategy_repository.get_signals.return_value = []
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Get the page after a known signal
+        cursor = encode_cursor(datetime(2025, 1, 2), "signal-id")
+        service.get_signals("strategy-id", limit=20, cursor=cursor)
+        
+        # Verify the cursor was passed through and decodes to the last row
+        mock_strategy_repository.get_signals.assert_called_once_with("strategy-id", 20, 0, cursor, full_detail=False)
+        assert decode_cursor(cursor) == (datetime(2025, 1, 2), "signal-id")
+    
+    def test_get_signals_prefetches_next_page(self, mock_strategy_repository, mock_stock_repository, monkeypatch):
+        """Test that the next page of signals is prefetched and served once."""
+        # Run prefetches inline so the test is deterministic
+        executor = Mock()
+        executor.submit.side_effect = lambda fn: fn()
+        monkeypatch.setattr(strategy_module, "_prefetch_executor", executor)
+        
+        # Configure mock repository with two full pages
+        first_page = [Signal(strategy_id="strategy-id", symbol="AAPL", type=SignalType.BUY, price=150.0)]
+        second_page = [Signal(strategy_id="strategy-id", symbol="MSFT", type=SignalType.SELL, price=300.0)]
+        mock_strategy_repository.get_signals.side_effect = [first_page, second_page, []]
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # First page triggers a prefetch of the second
+        assert service.get_signals("strategy-id", limit=1, offset=0) == first_page
+        mock_strategy_repository.get_signals.assert_called_with("strategy-id", 1, 1, None, full_detail=False)
+        
+        # Second page comes from the prefetch and schedules the third
+        assert service.get_signals("strategy-id", limit=1, offset=1) == second_page
+        assert mock_strategy_repository.get_signals.call_count == 3
+        mock_strategy_repository.get_signals.assert_called_with("strategy-id", 1, 2, None, full_detail=False)
+    
+    def test_prefetch_discarded_after_invalidation(self, mock_strategy_repository, mock_stock_repository, monkeypatch):
+        """Test that a prefetch finishing after signals change is not served."""
+        # Hold prefetches until the test runs them
+        pending = []
+        executor = Mock()
+        executor.submit.side_effect = pending.append
+        monkeypatch.setattr(strategy_module, "_prefetch_executor", executor)
+        
+        # Configure mock repository with two full pages
+        first_page = [Signal(strategy_id="strategy-id", symbol="AAPL", type=SignalType.BUY, price=150.0)]
+        stale_page = [Signal(strategy_id="strategy-id", symbol="MSFT", type=SignalType.SELL, price=300.0)]
+        mock_strategy_repository.get_signals.side_effect = [first_page, stale_page, []]
+        mock_strategy_repository.delete.return_value = True
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Schedule a prefetch, then delete the strategy before it completes
+        service.get_signals("strategy-id", limit=1, offset=0)
+        service.delete_strategy("strategy-id")
+        pending.pop()()
+        
+        # Verify the stale page was dropped and the page is read again
+        assert service.get_signals("strategy-id", limit=1, offset=1) == []
+        assert mock_strategy_repository.get_signals.call_count == 3
+    
+    def test_prefetch_slot_released_when_submit_fails(self, mock_strategy_repository, mock_stock_repository, monkeypatch):
+        """Test that a prefetch that cannot be scheduled frees its slot."""
+        executor = Mock()
+        executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        monkeypatch.setattr(strategy_module, "_prefetch_executor", executor)
+        
+        # Configure mock repository with a full page
+        page = [Signal(strategy_id="strategy-id", symbol="AAPL", type=SignalType.BUY, price=150.0)]
+        mock_strategy_repository.get_signals.return_value = page
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # The page is still served
+        assert service.get_signals("strategy-id", limit=1, offset=0) == page
+        
+        # Verify every prefetch slot is free again
+        slots = strategy_module._prefetch_slots
+        acquired = [slots.acquire(blocking=False) for _ in range(8)]
+        for _ in filter(None, acquired):
+            slots.release()
+        assert all(acquired)
+    
+    def test_iter_signals(self, mock_strategy_repository, mock_stock_repository):
+        """Test streaming signals for a strategy."""
+        # Configure mock repository
+        signal = Signal(strategy_id="strategy-id", symbol="AAPL", type=SignalType.BUY, price=150.0)
+        mock_strategy_repository.iter_signals.return_value = iter([signal])
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Stream signals
+        signals = service.iter_signals("strategy-id")
+        
+        # Verify nothing is fetched until iteration
+        mock_strategy_repository.iter_signals.assert_not_called()
+        
+        # Verify signals were streamed
+        assert [s.id for s in signals] == [signal.id]
+        mock_strategy_repository.iter_signals.assert_called_once_with("strategy-id")
+    
+    def test_update_strategy_performance(self, mock_strategy_repository, mock_stock_repository, sample_strategy):
+        """Test updating strategy performance from database signal stats."""
+        # Configure mock repository
+        mock_strategy_repository.get_by_id.return_value = sample_strategy
+        mock_strategy_repository.compute_signal_stats.return_value = {
+            "type_counts": {SignalType.BUY: 3, SignalType.SELL: 2, SignalType.HOLD: 1},
+            "symbols": ["AAPL", "MSFT"]
+        }
+        mock_strategy_repository.update_strategy_performance.return_value = sample_strategy
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Update performance
+        service.update_strategy_performance(sample_strategy.id)
+        
+        # Verify signals were summarized rather than loaded
+        mock_strategy_repository.compute_signal_stats.assert_called_once_with(sample_strategy.id)
+        mock_strategy_repository.get_signals.assert_not_called()
+        
+        # Verify metrics
+        metrics = mock_strategy_repository.update_strategy_performance.call_args[0][1]
+        assert metrics["signal_count"] == 6
+        assert metrics["buy_signals"] == 3
+        assert metrics["sell_signals"] == 2
+        assert metrics["neutral_signals"] == 1
+        assert metrics["symbols"] == ["AAPL", "MSFT"]
+        assert metrics["symbol_count"] == 2
+    
+    def test_run_strategy_reuses_recent_run(self, mock_strategy_repository, mock_stock_repository, sample_strategy):
+        """Test that an identical run returns the cached signals without re-executing."""
+        signal = Signal(
+            strategy_id=sample_strategy.id,
+            symbol="AAPL",
+            type=SignalType.BUY,
+            price=150.0
+        )
+        sample_strategy.run = Mock(return_value=[signal])
+        
+        # Configure mock repositories
+        mock_strategy_repository.get_by_id.return_value = sample_strategy
+        mock_strategy_repository.add_signals_bulk.side_effect = lambda strategy_id, signals: signals
+        mock_strategy_repository.compute_signal_stats.return_value = {"type_counts": {}, "symbols": []}
+        mock_strategy_repository.get_signals_by_ids.return_value = [signal]
+        mock_stock_repository.get_by_symbols.return_value = {"AAPL": Stock(symbol="AAPL", name="Apple Inc.")}
+        mock_stock_repository.get_price_data_bulk.return_value = {"AAPL": []}
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Run the strategy twice with the same inputs
+        first = service.run_strategy(sample_strategy.id, symbols=["AAPL"])
+        second = service.run_strategy(sample_strategy.id, symbols=["AAPL"])
+        
+        # Verify the strategy only executed once
+        sample_strategy.run.assert_called_once()
+        mock_stock_repository.get_price_data_bulk.assert_called_once()
+        mock_strategy_repository.get_signals_by_ids.assert_called_once_with([signal.id])
+        assert first == second == [signal]
+    
+    def test_run_strategy_symbols_from_parameters(self, mock_strategy_repository, mock_stock_repository):
+        """Test that a strategy without explicit symbols runs on its stored ones."""
+        strategy = Strategy(
+            name="Stored Strategy",
+            type=StrategyType.CUSTOM,
+            owner_id="owner-id",
+            parameters=StrategyParameters.from_dict({"symbols": ["AAPL"]})
+        )
+        strategy.run = Mock(return_value=[])
+        
+        # Configure mock repositories
+        mock_strategy_repository.get_by_id.return_value = strategy
+        mock_strategy_repository.add_signals_bulk.side_effect = lambda strategy_id, signals: signals
+        mock_strategy_repository.compute_signal_stats.return_value = {"type_counts": {}, "symbols": []}
+        mock_stock_repository.get_by_symbols.return_value = {"AAPL": Stock(symbol="AAPL", name="Apple Inc.")}
+        mock_stock_repository.get_price_data_bulk.return_value = {"AAPL": []}
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Run the strategy without passing symbols
+        service.run_strategy(strategy.id)
+        
+        # Verify the stored symbols were used
+        assert mock_stock_repository.get_price_data_bulk.call_args[0][0] == ["AAPL"]
+        assert list(strategy.run.call_args[0][0]) == ["AAPL"]
+    
+    def test_run_strategies_shares_price_fetch(self, mock_strategy_repository, mock_stock_repository):
+        """Test that several strategies are run on prices fetched once."""
+        first = Strategy(
+            name="First",
+            type=StrategyType.CUSTOM,
+            owner_id="owner-id",
+            parameters=StrategyParameters.from_dict({"symbols": ["AAPL", "MSFT"]})
+        )
+        second = Strategy(
+            name="Second",
+            type=StrategyType.CUSTOM,
+            owner_id="owner-id",
+            parameters=StrategyParameters.from_dict({"symbols": ["MSFT"]})
+        )
+        first.run = Mock(return_value=[Signal(strategy_id="", symbol="AAPL", type=SignalType.BUY, price=150.0)])
+        second.run = Mock(return_value=[])
+        
+        # Configure mock repositories
+        mock_strategy_repository.get_by_ids.return_value = {first.id: first, second.id: second}
+        mock_strategy_repository.add_signals_bulk.side_effect = lambda strategy_id, signals: signals
+        mock_strategy_repository.compute_signal_stats.return_value = {"type_counts": {}, "symbols": []}
+        mock_stock_repository.get_by_symbols.return_value = {
+            "AAPL": Stock(symbol="AAPL", name="Apple Inc."),
+            "MSFT": Stock(symbol="MSFT", name="Microsoft Corporation")
+        }
+        mock_stock_repository.get_price_data_bulk.return_value = {"AAPL": [], "MSFT": []}
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Run both strategies
+        results = service.run_strategies([first.id, second.id])
+        
+        # Verify prices were fetched once for the union of symbols
+        mock_stock_repository.get_price_data_bulk.assert_called_once()
+        assert mock_stock_repository.get_price_data_bulk.call_args[0][0] == ["AAPL", "MSFT"]
+        
+        # Verify each strategy ran on its own symbols
+        assert list(first.run.call_args[0][0]) == ["AAPL", "MSFT"]
+        assert list(second.run.call_args[0][0]) == ["MSFT"]
+        assert [signal.strategy_id for signal in results[first.id]] == [first.id]
+        assert results[second.id] == []
+    
+    def test_error_handling(self, mock_strategy_repository, mock_stock_repository):
+        """Test error handling in the service."""
+        # Configure mock repository to raise an exception
+        mock_strategy_repository.get_by_id.side_effect = Exception("Test error")
+        
+        # Create service with mock repositories
+        service = StrategyService(mock_strategy_repository, mock_stock_repository)
+        
+        # Call method that should handle the error
+        with pytest.raises(ServiceError) as excinfo:
+            service.get_strategy("strategy-id")
+        
+        # Verify error was handled correctly
+        assert "Service operation 'get_strategy' failed" in str(excinfo.value)
+        assert "Test error" in str(excinfo.value)
@@ -0,0 +1,253 @@
+"""Tests for the user service.
+
+This module contains tests for the UserService class.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+import uuid
+
+from stocker.core.exceptions import ServiceError
+from stocker.domain.user import User, UserRole, UserPreferences
+from stocker.infrastructure.database.repositories.user import UserRepository
+from stocker.services.user import UserService, _api_key_cache, _user_cache, _user_id_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_user_caches():
+    """Clear the shared user caches between tests."""
+    _api_key_cache.clear()
+    _user_cache.clear()
+    _user_id_cache.clear()
+    yield
+    _api_key_cache.clear()
+    _user_cache.clear()
+    _user_id_cache.clear()
+
+
+@pytest.fixture
+def mock_user_repository():
+    """Create a mock user repository for testing."""
+    return Mock(spec=UserRepository)
+
+
+@pytest.fixture
+def sample_user():
+    """Create a sample user for testing."""
+    return User(
+        id=str(uuid.uuid4()),
+        username="testuser",
+        email="test@example.com",
+        first_name="Test",
+        last_name="User"
+    )
+
+
+class TestUserService:
+    """Tests for the UserService class."""
+    
+    def test_get_user_cached(self, mock_user_repository, sample_user):
+        """Test that user lookups by ID are cached."""
+        # Configure mock repository
+        mock_user_repository.get_by_id.return_value = sample_user
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Repeated lookups hit the repository once
+        assert service.get_user(sample_user.id) == sample_user
+        assert service.get_user(sample_user.id) == sample_user
+        mock_user_repository.get_by_id.assert_called_once_with(sample_user.id)
+    
+    def test_get_user_by_username_cached_until_update(self, mock_user_repository, sample_user):
+        """Test that username lookups are cached until the user is updated."""
+        # Configure mock repository
+        mock_user_repository.get_by_username.return_value = sample_user
+        mock_user_repository.get_by_id.return_value = sample_user
+        mock_user_repository.add_role_to_user.return_value = sample_user
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Repeated lookups hit the repository once
+        service.get_user_by_username("testuser")
+        service.get_user_by_username("testuser")
+        mock_user_repository.get_by_username.assert_called_once_with("testuser")
+        mock_user_repository.get_by_id.assert_not_called()
+        
+        # Updating the user reloads it by ID on the next lookup
+        service.add_role_to_user(sample_user.id, UserRole.ADMIN)
+        assert service.get_user_by_username("testuser") == sample_user
+        mock_user_repository.get_by_username.assert_called_once()
+        mock_user_repository.get_by_id.assert_called_once_with(sample_user.id)
+    
+    def test_get_user_by_username_after_rename(self, mock_user_repository, sample_user):
+        """Test that a stale username mapping is discarded after a rename."""
+        renamed_user = User(id=sample_user.id, username="renamed", email=sample_user.email)
+        
+        # Configure mock repository
+        mock_user_repository.get_by_username.side_effect = [sample_user, None]
+        mock_user_repository.get_by_id.return_value = renamed_user
+        mock_user_repository.delete.return_value = True
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Cache the old username, then invalidate the user
+        service.get_user_by_username("testuser")
+        service.delete_user(sample_user.id)
+        
+        # The old username no longer resolves to the renamed user
+        assert service.get_user_by_username("testuser") is None
+        assert mock_user_repository.get_by_username.call_count == 2
+    
+    def test_get_user_not_found_not_cached(self, mock_user_repository):
+        """Test that missing users are not cached."""
+        # Configure mock repository
+        mock_user_repository.get_by_id.return_value = None
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Each lookup of a missing user hits the repository
+        assert service.get_user("missing-id") is None
+        assert service.get_user("missing-id") is None
+        assert mock_user_repository.get_by_id.call_count == 2
+    
+    def test_create_user_username_taken(self, mock_user_repository, sample_user):
+        """Test that username and email conflicts are checked in one lookup."""
+        # Configure mock repository
+        mock_user_repository.check_taken.return_value = (True, False)
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Verify the conflicting username is rejected
+        with pytest.raises(ServiceError) as excinfo:
+            service.create_user(sample_user, "Password1!")
+        
+        assert "Username 'testuser' is already taken" in str(excinfo.value)
+        mock_user_repository.check_taken.assert_called_once_with("testuser", "test@example.com", None)
+        mock_user_repository.get_by_username.assert_not_called()
+        mock_user_repository.get_by_email.assert_not_called()
+    
+    def test_update_user_unchanged(self, mock_user_repository, sample_user):
+        """Test that an update without changes writes nothing."""
+        # Configure mock repository
+        mock_user_repository.get_by_id.return_value = sample_user
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Update with an identical copy of the user
+        unchanged_user = User(
+            id=sample_user.id,
+            username=sample_user.username,
+            email=sample_user.email,
+            first_name=sample_user.first_name,
+            last_name=sample_user.last_name
+        )
+        assert service.update_user(unchanged_user) == sample_user
+        
+        # Verify nothing was checked or written
+        mock_user_repository.check_taken.assert_not_called()
+        mock_user_repository.update_fields.assert_not_called()
+        mock_user_repository.update.assert_not_called()
+    
+    def test_update_user_changed_fields(self, mock_user_repository, sample_user):
+        """Test that an update writes only the changed columns."""
+        # Configure mock repository
+        mock_user_repository.get_by_id.return_value = sample_user
+        mock_user_repository.check_taken.return_value = (False, False)
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Change the email and last name
+        changed_user = User(
+            id=sample_user.id,
+            username=sample_user.username,
+            email="new@example.com",
+            first_name=sample_user.first_name,
+            last_name="Changed"
+        )
+        updated_user = service.update_user(changed_user)
+        
+        # Verify only the changed columns were written
+        mock_user_repository.check_taken.assert_called_once_with(None, "new@example.com", sample_user.id)
+        mock_user_repository.update_fields.assert_called_once_with(
+            sample_user.id, email="new@example.com", last_name="Changed"
+        )
+        assert updated_user.email == "new@example.com"
+        assert service.get_user(sample_user.id).last_name == "Changed"
+        assert mock_user_repository.get_by_id.call_count == 1
+    
+    def test_update_user_after_get(self, mock_user_repository, sample_user):
+        """Test that a user fetched, modified and saved is written."""
+        # Configure mock repository
+        mock_user_repository.get_by_id.return_value = sample_user
+        mock_user_repository.check_taken.return_value = (False, False)
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Modify a fetched user; the cached user is not changed in place
+        user = service.get_user(sample_user.id)
+        user.first_name = "Changed"
+        assert service.get_user(sample_user.id).first_name == "Test"
+        
+        # Save the modified user
+        service.update_user(user)
+        
+        # Verify the change was written and is served afterwards
+        mock_user_repository.update_fields.assert_called_once_with(sample_user.id, first_name="Changed")
+        assert service.get_user(sample_user.id).first_name == "Changed"
+    
+    def test_update_user_preferences(self, mock_user_repository, sample_user):
+        """Test that preferences are written without reloading a cached user."""
+        # Configure mock repository
+        mock_user_repository.get_by_id.return_value = sample_user
+        preferences = UserPreferences(theme="light")
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        service.get_user(sample_user.id)
+        
+        # Update preferences
+        updated_user = service.update_user_preferences(sample_user.id, preferences)
+        
+        # Verify only the preferences were written and the cached user patched
+        mock_user_repository.update_preferences.assert_called_once_with(sample_user.id, preferences)
+        mock_user_repository.update.assert_not_called()
+        assert mock_user_repository.get_by_id.call_count == 1
+        assert updated_user.preferences == preferences
+        assert service.get_user(sample_user.id).preferences == preferences
+    
+    @pytest.mark.asyncio
+    async def test_authenticate_user_async(self, mock_user_repository, sample_user):
+        """Test that async authentication delegates to authenticate_user."""
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Authenticate through the async wrapper
+        with patch.object(service, "authenticate_user", return_value=sample_user) as authenticate:
+            user = await service.authenticate_user_async("testuser", "Password1!")
+        
+        # Verify the synchronous method did the work
+        assert user == sample_user
+        authenticate.assert_called_once_with("testuser", "Password1!")
+    
+    def test_error_handling(self, mock_user_repository):
+        """Test error handling in the service."""
+        # Configure mock repository to raise an exception
+        mock_user_repository.get_by_id.side_effect = Exception("Test error")
+        
+        # Create service with mock repository
+        service = UserService(mock_user_repository)
+        
+        # Call method that should handle the error
+        with pytest.raises(ServiceError) as excinfo:
+            service.get_user("user-id")
+        
+        # Verify error was wrapped
+        assert "Test error" in str(excinfo.value)